@@ -0,0 +1,84 @@
+# NongGameTyping/src/alias_table.py
+import random
+from array import array
+from typing import List, Optional, Sequence
+import numpy as np
+
+def numpy_generator(rng: Optional[random.Random] = None) -> np.random.Generator:
+    """A NumPy Generator seeded from rng, so seeded Python RNGs stay reproducible"""
+    return np.random.default_rng((rng or random).getrandbits(64))
+
+def alias_sample(generator: np.random.Generator, prob: np.ndarray, alias: np.ndarray, count: int) -> np.ndarray:
+    """count draws from an alias table's columns as an int64 array"""
+    size = len(prob)
+    u = generator.random(count) * size
+    i = np.minimum(u.astype(np.int64), size - 1)
+    return np.where(u - i < prob[i], i, alias[i])
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) to build, O(1) per weighted draw
+
+    Each slot i keeps the probability of returning i itself and an alias to
+    return otherwise, so one uniform random number picks an outcome. Both
+    columns are flat NumPy arrays (float64 / int64), so a table over a
+    million-word corpus costs 16 bytes per word rather than boxed objects.
+    """
+    __slots__ = ("prob", "alias", "size")
+
+    def __init__(self, weights: Sequence[float]):
+        weights = np.asarray(weights, dtype=np.float64)
+        size = len(weights)
+        total = float(weights.sum()) if size else 0.0
+        if size == 0 or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+        if (weights < 0).any():
+            raise ValueError("AliasTable weights must not be negative")
+
+        # Vose's loop over flat typed buffers; array() element access is much
+        # cheaper than indexing NumPy scalars one at a time
+        scaled_np = weights * (size / total)
+        scaled = array("d", scaled_np.tobytes())
+        prob = array("d", bytes(8 * size))
+        alias = array("q", np.arange(size, dtype=np.int64).tobytes())
+        small = array("q", np.flatnonzero(scaled_np < 1.0).astype(np.int64).tobytes())
+        large = array("q", np.flatnonzero(scaled_np >= 1.0).astype(np.int64).tobytes())
+        del scaled_np
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left is 1.0 up to rounding error
+        for stack in (small, large):
+            for i in stack:
+                prob[i] = 1.0
+
+        self.prob = np.frombuffer(prob, dtype=np.float64)
+        self.alias = np.frombuffer(alias, dtype=np.int64)
+        self.size = size
+
+    def sample(self, rng: Optional[random.Random] = None) -> int:
+        """Draw one index with probability proportional to its weight"""
+        u = (rng or random).random() * self.size
+        i = int(u)
+        if i >= self.size:  # Guard against u rounding up to size
+            i = self.size - 1
+        return i if u - i < self.prob[i] else int(self.alias[i])
+
+    def sample_array(self, count: int, generator: np.random.Generator) -> np.ndarray:
+        """Draw count indices as an int64 array, vectorised"""
+        return alias_sample(generator, self.prob, self.alias, count)
+
+    def sample_many(self, count: int, rng: Optional[random.Random] = None) -> List[int]:
+        """Draw count indices (seeded from rng)"""
+        return self.sample_array(count, numpy_generator(rng)).tolist()
+
+    def probabilities(self) -> List[float]:
+        """Recover the normalised probability of each index (for checks and reports)"""
+        share = 1.0 / self.size
+        result = self.prob * share
+        np.add.at(result, self.alias, (1.0 - self.prob) * share)
+        return result.tolist()
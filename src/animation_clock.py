@@ -0,0 +1,81 @@
+# NongGameTyping/src/animation_clock.py
+from typing import Optional
+
+# Simulation steps per second unless settings['simulation_hz'] says otherwise
+DEFAULT_SIMULATION_HZ = 60
+
+# Steps run per rendered frame at most; after a long stall the rest of the backlog is dropped
+MAX_STEPS_PER_FRAME = 8
+
+# Frame-counted animation constants (durations, per-frame fades and easing rates) were tuned at this rate
+TICK_RATE = 60
+
+# Slack for float error when the accumulator lands exactly on a step boundary
+_EPSILON = 1e-9
+
+def ticks(dt: float) -> float:
+    """dt in seconds expressed as 60 Hz ticks, for constants written per frame"""
+    return dt * TICK_RATE
+
+def approach(current: float, target: float, rate: float, tick_count: float = 1.0) -> float:
+    """Move current towards target by `rate` of the gap per tick, for any number of ticks
+
+    Equivalent to `current += (target - current) * rate` repeated tick_count
+    times, so per-frame easing keeps its speed at any step size.
+    """
+    return target + (current - target) * (1.0 - rate) ** tick_count
+
+class FixedStepClock:
+    """Fixed-timestep simulation clock with a render interpolation factor
+
+    Each rendered frame feeds its real duration to advance(), which says how
+    many fixed steps of `step` seconds to simulate. Whatever is left over is
+    exposed as `alpha` (0..1 of a step) so rendering can interpolate between
+    the last two simulated states. Simulation therefore runs at the same
+    speed whatever the render rate, and feeding it fixed frame times makes
+    it fully deterministic.
+    """
+
+    def __init__(self, hz: float = DEFAULT_SIMULATION_HZ, max_steps: int = MAX_STEPS_PER_FRAME):
+        if hz <= 0:
+            raise ValueError("simulation rate must be positive")
+        self.hz = hz
+        self.step = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.time = 0.0
+        self.steps = 0
+        self.dropped = 0.0
+
+    def advance(self, frame_dt: float) -> int:
+        """Add a frame's duration; returns how many steps to simulate now"""
+        self.accumulator += max(0.0, frame_dt)
+        steps = int((self.accumulator + _EPSILON) / self.step)
+        if steps > self.max_steps:
+            # Catching up on every missed step would make the next frame slower still
+            self.dropped += (steps - self.max_steps) * self.step
+            self.accumulator -= (steps - self.max_steps) * self.step
+            steps = self.max_steps
+        self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        self.time += steps * self.step
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """How far (0..1) rendering is between the last step and the next"""
+        return min(1.0, self.accumulator / self.step)
+
+    @property
+    def lag(self) -> float:
+        """Seconds of real time not simulated yet"""
+        return self.accumulator
+
+    def lerp(self, previous: float, current: float, alpha: Optional[float] = None) -> float:
+        """Interpolate a value between its previous and current simulated state"""
+        if alpha is None:
+            alpha = self.alpha
+        return previous + (current - previous) * alpha
+
+    def reset(self):
+        self.accumulator = 0.0
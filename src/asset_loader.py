@@ -0,0 +1,124 @@
+# NongGameTyping/src/asset_loader.py
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional, Tuple
+import pygame
+from .font_registry import get_font_registry
+from .image_cache import get_image_cache
+
+# Worker threads decoding assets; decoding is mostly in SDL_image / SDL_mixer with the GIL released
+MAX_WORKERS = 8
+
+# Redraw rate of the loading screen while waiting for decodes
+LOADING_FPS = 30
+
+LOADING_BG = (25, 25, 40)
+LOADING_BAR_BG = (40, 40, 40)
+LOADING_BAR = (154, 245, 78)
+LOADING_TEXT = (200, 200, 200)
+
+class AssetLoader:
+    """Decodes startup images and sounds on a thread pool
+
+    Workers only decode (and smoothscale, when a size is given); the
+    decoded images are converted to the display format and put into the
+    shared image cache on the main thread, as SDL requires. run() blocks
+    until everything is done while drawing a progress screen.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or min(MAX_WORKERS, os.cpu_count() or 1)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-loader")
+        # future -> (kind, path, image (size, alpha) or sound name)
+        self._pending: Dict[Future, Tuple[str, str, Any]] = {}
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def image(self, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = True):
+        """Queue an image (optionally smoothscaled to size) for the image cache"""
+        if not os.path.exists(path):
+            return
+        self._submit(("image", path, (size, alpha)), self._decode_image, path, size)
+
+    def sound(self, name: str, path: str):
+        """Queue a sound effect; it ends up in self.sounds[name]"""
+        if not os.path.exists(path) or not pygame.mixer.get_init():
+            return
+        self._submit(("sound", path, name), pygame.mixer.Sound, path)
+
+    def _submit(self, job: Tuple[str, str, Any], fn, *args):
+        self._pending[self._pool.submit(fn, *args)] = job
+        self.total += 1
+
+    @staticmethod
+    def _decode_image(path: str, size: Optional[Tuple[int, int]]) -> pygame.Surface:
+        image = pygame.image.load(path)
+        if size is not None:
+            image = pygame.transform.smoothscale(image, size)
+        return image
+
+    @property
+    def progress(self) -> float:
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return not self._pending
+
+    def collect(self):
+        """Hand finished decodes over (converting images on this, the main, thread)"""
+        for future in [future for future in self._pending if future.done()]:
+            kind, path, extra = self._pending.pop(future)
+            self.completed += 1
+            try:
+                result = future.result()
+            except Exception as e:
+                self.failed += 1
+                print(f"Error loading asset {path}: {e}")
+                continue
+            if kind == "image":
+                size, alpha = extra
+                get_image_cache().put(path, result, size, alpha)
+            else:
+                self.sounds[extra] = result
+
+    def run(self, surface: pygame.Surface, title: str = "Loading"):
+        """Draw the loading screen until every queued asset is decoded"""
+        while True:
+            self.collect()
+            draw_loading_screen(surface, self.progress, title)
+            pygame.display.flip()
+            if self.done:
+                break
+            # Keep the window responsive; events stay queued for the game loop
+            pygame.event.pump()
+            wait(list(self._pending), timeout=1.0 / LOADING_FPS, return_when=FIRST_COMPLETED)
+        self._pool.shutdown()
+        self.elapsed = time.perf_counter() - self.started
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "assets": self.total,
+            "failed": self.failed,
+            "workers": self.workers,
+            "seconds": self.elapsed,
+        }
+
+def draw_loading_screen(surface: pygame.Surface, progress: float, title: str = "Loading"):
+    """A plain progress bar; needs nothing but the default font"""
+    width, height = surface.get_size()
+    surface.fill(LOADING_BG)
+    font = get_font_registry().get(None, 36)
+    text = font.render(f"{title}... {int(progress * 100)}%", True, LOADING_TEXT)
+    surface.blit(text, text.get_rect(center=(width // 2, height // 2 - 30)))
+    bar = pygame.Rect(0, 0, width // 2, 16)
+    bar.center = (width // 2, height // 2 + 10)
+    pygame.draw.rect(surface, LOADING_BAR_BG, bar, border_radius=8)
+    if progress > 0:
+        pygame.draw.rect(surface, LOADING_BAR, (bar.x, bar.y, max(16, int(bar.width * progress)), bar.height),
+                         border_radius=8)
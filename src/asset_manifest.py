@@ -0,0 +1,138 @@
+# NongGameTyping/src/asset_manifest.py
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from typing import Any, Dict, Iterable, Optional
+
+# Stamp written into the user's assets directory after a successful sync
+STAMP_FILENAME = ".manifest.json"
+
+# Optional manifest shipped with the project assets (build it with `python -m src.asset_manifest`)
+SOURCE_MANIFEST_FILENAME = "manifest.json"
+
+MANIFEST_VERSION = 1
+
+def _file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_manifest(root: str, subdirs: Iterable[str],
+                   previous: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """Describe every file under root/subdirs as {relpath: {size, mtime_ns, sha1}}
+
+    Hashes from `previous` are reused for files whose size and mtime are unchanged,
+    so only new or edited files are read.
+    """
+    previous = previous or {}
+    files = {}
+    for subdir in subdirs:
+        base = os.path.join(root, subdir)
+        if not os.path.isdir(base):
+            continue
+        for dirpath, _, filenames in os.walk(base):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                rel = os.path.relpath(path, root).replace(os.sep, "/")
+                st = os.stat(path)
+                old = previous.get(rel)
+                if old and old.get("size") == st.st_size and old.get("mtime_ns") == st.st_mtime_ns:
+                    sha1 = old["sha1"]
+                else:
+                    sha1 = _file_sha1(path)
+                files[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha1": sha1}
+    return files
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == MANIFEST_VERSION:
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable asset manifest {path}: {e}")
+    return None
+
+def _write_json(path: str, data: Dict[str, Any]):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _same_content(a: Optional[Dict[str, Any]], b: Optional[Dict[str, Any]]) -> bool:
+    return bool(a and b and a.get("size") == b.get("size") and a.get("sha1") == b.get("sha1"))
+
+def _dst_intact(dst_root: str, rel: str, entry: Dict[str, Any]) -> bool:
+    """The copy in dst_root exists with the expected size (one stat, no hashing)"""
+    try:
+        return os.path.getsize(os.path.join(dst_root, rel)) == entry["size"]
+    except OSError:
+        return False
+
+def sync_assets(src_root: str, dst_root: str, subdirs: Iterable[str]) -> Dict[str, Any]:
+    """Copy changed assets from src_root to dst_root using a manifest stamp
+
+    Files whose source differs from the stamp are copied, and so is any
+    file whose copy in dst_root was deleted or changed size (one stat per
+    file, no hashing), so assets the player removed are restored.
+    """
+    start = time.perf_counter()
+    subdirs = list(subdirs)
+    stamp_path = os.path.join(dst_root, STAMP_FILENAME)
+    stamp = _read_json(stamp_path)
+    stamped_files = stamp["files"] if stamp else {}
+
+    shipped = _read_json(os.path.join(src_root, SOURCE_MANIFEST_FILENAME))
+    if shipped is not None:
+        source_files = shipped["files"]
+    else:
+        # Walking the project's own (local) assets is cheap; hashes are reused from the stamp
+        source_files = build_manifest(src_root, subdirs, previous=stamped_files)
+
+    # Without a stamp (first run or older version), files that already exist are trusted
+    to_copy = [rel for rel, entry in source_files.items()
+               if not _dst_intact(dst_root, rel, entry)
+               or (stamp is not None and not _same_content(entry, stamped_files.get(rel)))]
+
+    copied = 0
+    failed = set()
+    if stamp is not None and not to_copy:
+        status = "up to date"
+    else:
+        for rel in to_copy:
+            src_path = os.path.join(src_root, rel)
+            dst_path = os.path.join(dst_root, rel)
+            try:
+                os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+                shutil.copy2(src_path, dst_path)
+                copied += 1
+            except Exception as e:
+                print(f"Error copying asset {rel}: {e}")
+                failed.add(rel)
+        # Failed files are left out of the stamp so they are retried next startup
+        stamped = {rel: entry for rel, entry in source_files.items() if rel not in failed}
+        _write_json(stamp_path, {"version": MANIFEST_VERSION, "files": stamped})
+        status = f"copied {copied} files"
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"Asset sync: {status} ({elapsed_ms:.1f} ms)")
+    return {"status": status, "copied": copied, "files": len(source_files), "elapsed_ms": elapsed_ms}
+
+def main(argv=None):
+    """Write assets/manifest.json so players' startup can skip walking the project assets"""
+    argv = sys.argv[1:] if argv is None else argv
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assets_root = argv[0] if argv else os.path.join(project_root, "assets")
+    files = build_manifest(assets_root, ["fonts", "images", "sounds"])
+    _write_json(os.path.join(assets_root, SOURCE_MANIFEST_FILENAME), {"version": MANIFEST_VERSION, "files": files})
+    print(f"Wrote manifest for {len(files)} files to {assets_root}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# NongGameTyping/src/background_layer.py
+import math
+from typing import List, Optional, Tuple
+import pygame
+from .surface_cache import get_surface_cache
+
+# How often the ambient layer is recomposited unless settings['ambient_fps'] says otherwise
+DEFAULT_AMBIENT_FPS = 15
+
+# Ambient twinkles drifting over the background
+TWINKLE_COUNT = 20
+TWINKLE_RADIUS = 3
+
+# Used when bg.png is missing
+FALLBACK_COLOR = (25, 25, 40)
+
+class BackgroundCompositor:
+    """The background image with its ambient twinkles baked into one layer
+
+    `base` is the plain background (the image, or a flat colour without
+    one). `layer` is base plus the twinkles, recomposited from base only
+    when refresh() crosses into a new 1/ambient_fps slot, so between
+    refreshes a scene draws its whole background with a single blit.
+    """
+
+    def __init__(self, size: Tuple[int, int], image: Optional[pygame.Surface] = None,
+                 ambient_fps: float = DEFAULT_AMBIENT_FPS):
+        self.size = size
+        self.ambient_fps = max(1, ambient_fps)
+        self.surface_cache = get_surface_cache()
+        self.base = pygame.Surface(size)
+        if image is not None:
+            self.base.blit(image, (0, 0))
+        else:
+            self.base.fill(FALLBACK_COLOR)
+        self.base = self.base.convert()
+        self.layer = self.base.copy()
+        self._slot: Optional[int] = None
+        self._twinkle_rects: List[pygame.Rect] = []
+        self.renders = 0
+
+    def refresh(self, time: float) -> List[pygame.Rect]:
+        """Recomposite the layer if `time` reached a new slot; returns the areas that changed"""
+        slot = int(time * self.ambient_fps)
+        if slot == self._slot:
+            return []
+        self._slot = slot
+        changed = self._twinkle_rects
+        for rect in changed:
+            self.layer.blit(self.base, rect.topleft, rect)
+        self._twinkle_rects = self._draw_twinkles(slot / self.ambient_fps)
+        self.renders += 1
+        return changed + self._twinkle_rects
+
+    def _draw_twinkles(self, time: float) -> List[pygame.Rect]:
+        width, height = self.size
+        rects = []
+        for i in range(TWINKLE_COUNT):
+            x = (i * 137 + time * 20) % width
+            y = (i * 47 + math.sin(time + i) * 30) % height
+            alpha = int(abs(math.sin(time + i)) * 100 + 50)
+            stamp = self.surface_cache.circle(TWINKLE_RADIUS, (255, 255, 255, alpha))
+            rects.append(self.layer.blit(stamp, (x, y)))
+        return rects
+
+    def draw(self, surface: pygame.Surface, area: Optional[pygame.Rect] = None, ambient: bool = True):
+        """Blit the layer (or just `area` of it); ambient=False draws the plain background"""
+        source = self.layer if ambient else self.base
+        if area is None:
+            surface.blit(source, (0, 0))
+        else:
+            surface.blit(source, area.topleft, area)
@@ -1,10 +1,16 @@
 import pygame
 import random
 import math
-import os
 from typing import List, Dict, Optional, Callable
-from .data_manager import DataManager, Rarity, Item
+from .data_manager import get_data_manager, Rarity, Item
+from .surface_cache import get_surface_cache
+from .text_cache import get_text_cache
+from .font_registry import get_font_registry, ICON_FONT_SIZE
+from .image_cache import get_image_cache, ICON_IMAGE_SIZE
+from .particle_engine import ParticleEngine
+from .animation_clock import ticks
 from dataclasses import dataclass
+from collections import OrderedDict
 
 # --- Constants ---
 BLACK = (0, 0, 0)
@@ -17,6 +23,13 @@ BLUE = (70, 130, 180)
 BLUE_LIGHT = (120, 180, 255)
 SILVER = (192, 192, 192)
 
+# Overlay fade speed in alpha per 60 Hz tick
+FADE_STEP = 24
+
+# Card bitmaps are rendered at scales rounded to this step and kept for this many (item, state, scale) keys
+CARD_SCALE_STEP = 0.02
+CARD_BITMAP_CACHE_SIZE = 64
+
 def get_rarity_color(rarity: Rarity) -> tuple:
     """Modern gaming theme colors"""
     colors = {
@@ -32,12 +45,15 @@ class AnimatedValue:
         self.initial = initial_value
         self.target = target_value
         self.current = initial_value
+        # Value before the last update, for drawing between simulation steps
+        self.previous = initial_value
         self.duration = duration
         self.elapsed = 0
         self.easing = easing
         self.completed = False
     
     def update(self, dt):
+        self.previous = self.current
         if self.completed:
             return self.current
         
@@ -61,56 +77,32 @@ class AnimatedValue:
             self.current = self.target
         
         return self.current
-
-class Particle:
-    def __init__(self, x, y, color, velocity, life):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.life = life
-        self.max_life = life
-        self.size = random.uniform(1, 2)
     
-    def update(self, dt):
-        self.x += self.velocity[0] * dt
-        self.y += self.velocity[1] * dt
-        self.life -= dt
-        return self.life > 0
-    
-    def draw(self, screen):
-        alpha = int(255 * (self.life / self.max_life))
-        size = max(1, int(self.size * (self.life / self.max_life)))
-        if size > 0:
-            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*self.color, alpha), (size, size), size)
-            screen.blit(surf, (self.x - size, self.y - size))
+    def at(self, lerp=None) -> float:
+        """The current value, or with lerp(previous, current) the value between the last two updates"""
+        return self.current if lerp is None else lerp(self.previous, self.current)
 
 class ParticleSystem:
     def __init__(self):
-        self.particles = []
         self.max_particles = 30
+        self.engine = ParticleEngine(max_particles=self.max_particles)
+    
+    def __len__(self):
+        return len(self.engine)
     
     def add_particle(self, x, y, color, velocity=None, life=1.0):
-        if len(self.particles) >= self.max_particles:
-            return
         if velocity is None:
             velocity = (random.uniform(-20, 20), random.uniform(-20, 20))
-        self.particles.append(Particle(x, y, color, velocity, life))
+        self.engine.emit(x, y, velocity[0], velocity[1], life, random.uniform(1, 2), color)
     
     def update(self, dt):
-        self.particles = [p for p in self.particles if p.update(dt)]
+        self.engine.update(dt)
     
     def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+        self.engine.draw(screen)
     
     def add_magic_burst(self, x, y, color, count=5):
-        for _ in range(min(count, self.max_particles - len(self.particles))):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(10, 40)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            self.add_particle(x, y, color, velocity, random.uniform(0.5, 1.5))
+        self.engine.burst(x, y, count, (10, 40), (0.5, 1.5), (1, 2), color)
 
 class ModernButton:
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
@@ -119,7 +111,7 @@ class ModernButton:
         self.text = text
         self.bg_color = bg_color
         self.text_color = text_color
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font_registry().get(None, 24)
         self.hovered = False
         self.pressed = False
         self.scale = AnimatedValue(1.0, 1.0, 0.15)
@@ -129,8 +121,9 @@ class ModernButton:
         self.scale.update(dt)
         self.glow_intensity.update(dt)
     
-    def draw(self, screen):
-        scale_factor = self.scale.current
+    def draw(self, screen, lerp=None):
+        scale_factor = self.scale.at(lerp)
+        glow = self.glow_intensity.at(lerp)
         scaled_width = int(self.rect.width * scale_factor)
         scaled_height = int(self.rect.height * scale_factor)
         scaled_rect = pygame.Rect(
@@ -140,22 +133,21 @@ class ModernButton:
         )
         
         # Glow effect
-        if self.glow_intensity.current > 0:
-            glow_alpha = int(50 * self.glow_intensity.current)
+        if glow > 0:
+            glow_alpha = int(50 * glow)
+            surface_cache = get_surface_cache()
             for i in range(3):
                 glow_rect = scaled_rect.inflate(i * 4, i * 4)
-                glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, (*self.bg_color, glow_alpha), (0, 0, glow_rect.width, glow_rect.height), border_radius=12)
-                screen.blit(glow_surf, glow_rect.topleft)
+                surface_cache.blit_rounded_rect(screen, glow_rect, (*self.bg_color, glow_alpha), 12)
         
         # Main button
-        intensity = int(30 * self.glow_intensity.current)
+        intensity = int(30 * glow)
         color = tuple(min(255, c + intensity) for c in self.bg_color)
         pygame.draw.rect(screen, color, scaled_rect, border_radius=12)
         pygame.draw.rect(screen, (80, 80, 80), scaled_rect, 2, border_radius=12)
         
         # Text
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = get_text_cache().render(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=scaled_rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -189,7 +181,7 @@ class FilterTab:
         self.text = text
         self.color = color
         self.active = False
-        self.font = pygame.font.Font(None, 20)
+        self.font = get_font_registry().get(None, 20)
         self.hover_scale = AnimatedValue(1.0, 1.0, 0.2)
         self.glow_intensity = AnimatedValue(0, 0, 0.3)
     
@@ -197,8 +189,9 @@ class FilterTab:
         self.hover_scale.update(dt)
         self.glow_intensity.update(dt)
     
-    def draw(self, screen):
-        scale = self.hover_scale.current
+    def draw(self, screen, lerp=None):
+        scale = self.hover_scale.at(lerp)
+        glow = self.glow_intensity.at(lerp)
         scaled_width = int(self.rect.width * scale)
         scaled_height = int(self.rect.height * scale)
         draw_rect = pygame.Rect(
@@ -208,13 +201,12 @@ class FilterTab:
         )
         
         # Glow effect for active tab
-        if self.active or self.glow_intensity.current > 0:
-            glow_alpha = int(80 * (1.0 if self.active else self.glow_intensity.current))
+        if self.active or glow > 0:
+            glow_alpha = int(80 * (1.0 if self.active else glow))
+            surface_cache = get_surface_cache()
             for i in range(2):
                 glow_rect = draw_rect.inflate(i * 3, i * 3)
-                glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, (*self.color, glow_alpha), (0, 0, glow_rect.width, glow_rect.height), border_radius=8)
-                screen.blit(glow_surf, glow_rect.topleft)
+                surface_cache.blit_rounded_rect(screen, glow_rect, (*self.color, glow_alpha), 8)
         
         # Tab background
         if self.active:
@@ -229,7 +221,7 @@ class FilterTab:
         
         # Text
         text_color = (255, 255, 255) if self.active else (160, 160, 160)
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = get_text_cache().render(self.font, self.text, text_color)
         text_rect = text_surface.get_rect(center=draw_rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -249,95 +241,63 @@ class FilterTab:
         return False
 
 class ItemCard:
+    # Rendered cards shared by every ItemCard, keyed by (item, owned, center, scale bucket)
+    _bitmaps: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+    
     def __init__(self, item: Item, x: int, y: int, width: int = 300, height: int = 400):
-        self.item = item
         self.rect = pygame.Rect(x, y, width, height)
         self.original_x = x
         self.original_y = y
+        fonts = get_font_registry()
+        self.font_title = fonts.get(None, 28)
+        self.font_icon = fonts.get(None, 80)
+        self.font_rarity = fonts.get(None, 22)
+        self.font_rate = fonts.get(None, 18)
+        self.bind(item)
+    
+    def bind(self, item: Item):
+        """Show an item on this card, resetting its animations (used when the carousel recycles it)"""
+        self.release()
+        self.item = item
         self.scale = AnimatedValue(0.8, 0.8, 0.3)
         self.alpha = AnimatedValue(0, 255, 0.5)
         self.glow_intensity = AnimatedValue(0, 0, 0.3)
-        self.font_title = pygame.font.Font(None, 28)
-        self.font_icon = pygame.font.Font(None, 80)
-        self.font_rarity = pygame.font.Font(None, 22)
-        self.font_rate = pygame.font.Font(None, 18)
         self.is_center = False
         self.hovered = False
         self.item_image = None
+        self.image_path = None
         self.is_emoji = self._is_emoji(self.item.icon)
         if not self.is_emoji:
             self._load_item_image()
     
+    def release(self):
+        """Unpin the bound item's image in the shared image cache"""
+        if getattr(self, "item_image", None) is not None:
+            get_image_cache().release(self.image_path)
+            self.item_image = None
+    
     def _is_emoji(self, text):
         """Check if the icon is an emoji (not a filename ending with .png)"""
         return not text.lower().endswith('.png')
     
     def _load_item_image(self):
-        """Load the item image from assets"""
-        try:
-            # Get the image path using DataManager
-            data_manager = DataManager()
-            image_path = data_manager.get_assets_path("images", f"Item/{self.item.icon}")
-            
-            if os.path.exists(image_path):
-                self.item_image = pygame.image.load(image_path).convert_alpha()
-            else:
-                print(f"Warning: Image not found for {self.item.name}: {image_path}")
-                self.item_image = None
-        except Exception as e:
-            print(f"Error loading image for {self.item.name}: {e}")
-            self.item_image = None
+        """Load the item image from assets (shared with the gacha screen through the image cache)"""
+        self.image_path = get_data_manager().get_assets_path("images", f"Item/{self.item.icon}")
+        self.item_image = get_image_cache().acquire(self.image_path)
     
     def get_icon_surface(self, size=None):
-        if self.is_emoji:
-            font = None
-            emoji_font_size = max(10, (size or 60) // 2)
-            # ลองใช้ฟอนต์อิโมจิที่รองรับบน Windows ก่อน
-            try:
-                font = pygame.font.SysFont("Segoe UI Emoji", emoji_font_size)
-            except Exception:
-                font = None
-            if font is None or font.get_height() == 0:
-                try:
-                    font = pygame.font.Font("assets/fonts/NotoColorEmoji-Regular.ttf", emoji_font_size)
-                except Exception:
-                    font = pygame.font.Font(None, emoji_font_size)
-            return font.render(self.item.icon, True, (255, 255, 255))
         if self.item_image is None:
-            font = pygame.font.Font(None, size or 60)
-            return font.render(self.item.icon, True, (255, 255, 255))
+            # Glyphs are rendered once at ICON_FONT_SIZE and scaled, instead of a new font per animated size
+            registry = get_font_registry()
+            font = registry.emoji(ICON_FONT_SIZE // 2) if self.is_emoji else registry.get(None, ICON_FONT_SIZE)
+            glyph = get_text_cache().render(font, self.item.icon, (255, 255, 255))
+            return get_surface_cache().scaled_icon((font, self.item.icon), glyph, ICON_FONT_SIZE, size)
         if size:
-            return self._scale_image_to_fit(self.item_image, size)
+            # Fitted once at ICON_IMAGE_SIZE; animated sizes are scaled copies in the surface cache
+            icon = get_image_cache().load(self.image_path, ICON_IMAGE_SIZE, fit=True)
+            return get_surface_cache().scaled_icon(self.image_path, icon, ICON_IMAGE_SIZE, size)
         return self.item_image
     
-    def _scale_image_to_fit(self, image, target_size):
-        """Scale image to fit within target_size while maintaining aspect ratio"""
-        img_width, img_height = image.get_size()
-        
-        # Calculate scale factor to fit within target_size
-        scale_x = target_size / img_width
-        scale_y = target_size / img_height
-        scale = min(scale_x, scale_y)  # Use smaller scale to fit within bounds
-        
-        # Calculate new dimensions
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
-        
-        # Scale the image
-        scaled_image = pygame.transform.scale(image, (new_width, new_height))
-        
-        # Create a surface with the target size and center the scaled image
-        result_surface = pygame.Surface((target_size, target_size), pygame.SRCALPHA)
-        
-        # Calculate centering offset
-        offset_x = (target_size - new_width) // 2
-        offset_y = (target_size - new_height) // 2
-        
-        # Blit the scaled image centered on the result surface
-        result_surface.blit(scaled_image, (offset_x, offset_y))
-        
-        return result_surface
-    
     def set_center(self, is_center: bool):
         if is_center != self.is_center:
             self.is_center = is_center
@@ -350,32 +310,52 @@ class ItemCard:
         self.alpha.update(dt)
         self.glow_intensity.update(dt)
     
-    def draw(self, screen, particle_system):
-        if self.alpha.current < 10:
+    @classmethod
+    def invalidate_bitmaps(cls, item: Item):
+        """Drop the cached renders of an item (its ownership changed)"""
+        for key in [key for key in cls._bitmaps if key[:2] == (item.name, item.rarity)]:
+            del cls._bitmaps[key]
+    
+    def draw(self, screen, particle_system, lerp=None):
+        alpha = self.alpha.at(lerp)
+        glow = self.glow_intensity.at(lerp)
+        if alpha < 10:
             return
         
         # Calculate scaled dimensions
-        scale = self.scale.current
+        bucket = round(self.scale.at(lerp) / CARD_SCALE_STEP)
+        scale = bucket * CARD_SCALE_STEP
         width = int(self.rect.width * scale)
         height = int(self.rect.height * scale)
         x = self.rect.centerx - width // 2
         y = self.rect.centery - height // 2
         card_rect = pygame.Rect(x, y, width, height)
         
-        # Create card surface
-        card_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        alpha = int(self.alpha.current)
-        
         # Glow effect for center card or collected items
-        if self.is_center or (self.item.is_owned and self.glow_intensity.current > 0):
+        if self.is_center or (self.item.is_owned and glow > 0):
             glow_color = self.item.get_rarity_color()
-            glow_alpha = int(60 * (1.0 if self.is_center else self.glow_intensity.current))
+            glow_alpha = int(60 * (1.0 if self.is_center else glow))
+            surface_cache = get_surface_cache()
             for i in range(4):
                 glow_rect = card_rect.inflate(i * 6, i * 6)
-                glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, (*glow_color, glow_alpha // (i + 1)), 
-                               (0, 0, glow_rect.width, glow_rect.height), border_radius=15)
-                screen.blit(glow_surf, glow_rect.topleft)
+                surface_cache.blit_rounded_rect(screen, glow_rect, (*glow_color, glow_alpha // (i + 1)), 15)
+        
+        # The card itself is rendered once per state and faded with a surface alpha
+        key = (self.item.name, self.item.rarity, self.item.is_owned, self.is_center, bucket)
+        card_surface = ItemCard._bitmaps.get(key)
+        if card_surface is None:
+            card_surface = self._render_card(width, height, scale)
+            ItemCard._bitmaps[key] = card_surface
+            if len(ItemCard._bitmaps) > CARD_BITMAP_CACHE_SIZE:
+                ItemCard._bitmaps.popitem(last=False)
+        else:
+            ItemCard._bitmaps.move_to_end(key)
+        card_surface.set_alpha(int(alpha))
+        screen.blit(card_surface, card_rect.topleft)
+    
+    def _render_card(self, width, height, scale):
+        card_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        alpha = 255  # Rendered opaque; draw() applies the card's fade
         
         # Card background
         bg_color = (20, 20, 20) if not self.item.is_owned else (30, 30, 30)
@@ -419,17 +399,7 @@ class ItemCard:
         # Collection status
         if self.item.is_owned:
             # Render star with emoji font
-            star_font = None
-            star_font_size = int(self.font_rarity.get_height() * 1.5)  # ให้ดาวใหญ่ขึ้น 1.5 เท่า
-            try:
-                star_font = pygame.font.SysFont("Segoe UI Symbol", star_font_size)
-            except Exception:
-                star_font = None
-            if star_font is None or star_font.get_height() == 0:
-                try:
-                    star_font = pygame.font.Font("assets/fonts/NotoColorEmoji-Regular.ttf", star_font_size)
-                except Exception:
-                    star_font = pygame.font.Font(None, star_font_size)
+            star_font = get_font_registry().symbol(int(self.font_rarity.get_height() * 1.5))  # ให้ดาวใหญ่ขึ้น 1.5 เท่า
             star_surface = star_font.render("★", True, (0, 255, 100, alpha))
             owned_surface = self.font_rarity.render(" OWNED", True, (0, 255, 100, alpha))
             # ต่อภาพดาวกับ OWNED
@@ -448,8 +418,7 @@ class ItemCard:
             status_rect = status_surface.get_rect(centerx=width//2, y=rate_rect.bottom + 10)
             card_surface.blit(status_surface, status_rect)
         
-        # Blit to screen
-        screen.blit(card_surface, card_rect.topleft)
+        return card_surface
     
     def handle_event(self, event, particle_system):
         if event.type == pygame.MOUSEMOTION:
@@ -458,39 +427,69 @@ class ItemCard:
             
             if self.hovered and not was_hovered and self.item.is_owned:
                 self.glow_intensity = AnimatedValue(0, 1, 0.3, "ease_out")
-                if len(particle_system.particles) < 15:
+                if len(particle_system) < 15:
                     particle_system.add_magic_burst(self.rect.centerx, self.rect.centery, 
                                                   self.item.get_rarity_color(), 3)
             elif not self.hovered and was_hovered:
                 self.glow_intensity = AnimatedValue(1, 0, 0.3, "ease_out")
 
 class CarouselSystem:
+    """Cards for the items around the current index only
+    
+    Items in view (plus one either side) are bound to ItemCards taken from a
+    small pool; cards that scroll out of view go back to the pool and are
+    rebound to the items coming in, so filtering and navigating cost the
+    same however many items the catalog has.
+    """
     def __init__(self, screen_width: int):
         self.screen_width = screen_width
         self.center_x = screen_width // 2
         self.current_index = 0
-        self.cards = []
+        self.items: List[Item] = []
+        self.card_width = 300
         self.card_spacing = 350
         self.scroll_offset = AnimatedValue(0, 0, 0.5, "ease_out")
+        # Cards within this many slots of the centre can reach the screen (glow included)
+        self.visible_radius = math.ceil((screen_width / 2 + self.card_width) / self.card_spacing)
+        self._visible: Dict[int, ItemCard] = {}
+        self._pool: List[ItemCard] = []
+    
+    @property
+    def cards(self) -> List[ItemCard]:
+        """Cards currently bound to items, in item order"""
+        return [self._visible[index] for index in sorted(self._visible)]
+    
+    def current_item(self) -> Optional[Item]:
+        return self.items[self.current_index] if self.items else None
         
     def set_items(self, items: List[Item]):
-        self.cards = []
+        self.items = list(items)
         self.current_index = 0
-        
-        for i, item in enumerate(items):
-            x = self.center_x - 150  # Center the first card
-            y = 160
-            card = ItemCard(item, x, y)
-            self.cards.append(card)
-        
+        self._pool.extend(self._visible.values())
+        self._visible = {}
         self.update_positions()
     
+    def _bind_visible(self):
+        """Bind pooled cards to the items in view; cards scrolled out go back to the pool"""
+        shift = self.scroll_offset.current / self.card_spacing
+        first = max(0, math.floor(self.current_index - shift) - self.visible_radius)
+        last = min(len(self.items) - 1, math.ceil(self.current_index - shift) + self.visible_radius)
+        for index in [index for index in self._visible if not first <= index <= last]:
+            self._pool.append(self._visible.pop(index))
+        for index in range(first, last + 1):
+            if index not in self._visible:
+                if self._pool:
+                    card = self._pool.pop()
+                    card.bind(self.items[index])
+                else:
+                    card = ItemCard(self.items[index], self.center_x - self.card_width // 2, 160)
+                self._visible[index] = card
+    
     def update_positions(self):
-        if not self.cards:
-            return
+        self._bind_visible()
             
         # Calculate target positions
-        for i, card in enumerate(self.cards):
+        for i, card in self._visible.items():
             offset_from_center = i - self.current_index
             target_x = self.center_x + (offset_from_center * self.card_spacing) + self.scroll_offset.current - 150
             card.rect.x = int(target_x)
@@ -499,7 +498,7 @@ class CarouselSystem:
             card.set_center(i == self.current_index)
     
     def navigate_to(self, index: int):
-        if 0 <= index < len(self.cards):
+        if 0 <= index < len(self.items):
             self.current_index = index
             self.scroll_offset = AnimatedValue(0, 0, 0.5, "ease_out")
             self.update_positions()
@@ -509,45 +508,59 @@ class CarouselSystem:
             self.navigate_to(self.current_index - 1)
     
     def navigate_right(self):
-        if self.current_index < len(self.cards) - 1:
+        if self.current_index < len(self.items) - 1:
             self.navigate_to(self.current_index + 1)
     
     def update(self, dt):
         self.scroll_offset.update(dt)
         self.update_positions()
         
-        for card in self.cards:
+        for card in self._visible.values():
             card.update(dt)
     
-    def draw(self, screen, particle_system):
-        # Draw cards from back to front (center card last)
+    def draw(self, screen, particle_system, lerp=None):
+        screen_rect = screen.get_rect()
+        # Draw cards from back to front (center card last), skipping any entirely off screen
         draw_order = []
-        for i, card in enumerate(self.cards):
-            distance = abs(i - self.current_index)
-            draw_order.append((distance, i, card))
+        for i, card in self._visible.items():
+            if card.rect.inflate(24, 24).colliderect(screen_rect):
+                distance = abs(i - self.current_index)
+                draw_order.append((distance, i, card))
         
         draw_order.sort(key=lambda x: -x[0])  # Far to near
         
         for _, _, card in draw_order:
-            card.draw(screen, particle_system)
+            card.draw(screen, particle_system, lerp)
     
     def handle_event(self, event, particle_system):
-        for card in self.cards:
+        for card in self._visible.values():
             card.handle_event(event, particle_system)
+    
+    def release(self):
+        """Unpin every card's image (the overlay is closing)"""
+        for card in list(self._visible.values()) + self._pool:
+            card.release()
 
 class CollectionOverlaySystem:
-    def __init__(self, screen_size, font_dict, ui_manager, on_close: Optional[Callable]=None):
+    def __init__(self, screen_size, font_dict, ui_manager, on_close: Optional[Callable]=None, clock=None):
         self.width, self.height = screen_size
         self.fonts = font_dict
         self.ui_manager = ui_manager
         self.on_close = on_close
+        # The game's FixedStepClock; animations are drawn interpolated between steps (None = latest step)
+        self.clock = clock
         self.state = "idle"
         
         # Initialize systems
-        self.data_manager = DataManager()
+        self.data_manager = get_data_manager()
         self.particle_system = ParticleSystem()
         self.carousel = CarouselSystem(self.width)
         
+        # Text that repeats every frame is rendered once through the shared cache
+        self.text_cache = get_text_cache()
+        self.font_stats = get_font_registry().get(None, 20)
+        self.font_hint = get_font_registry().get(None, 18)
+        
         # Setup UI
         self.setup_ui()
         self.current_filter = "ALL"
@@ -608,11 +621,11 @@ class CollectionOverlaySystem:
     def _draw_collection_stats(self, screen):
         """Draw collection statistics"""
         stats = self.data_manager.get_player_stats()
-        font_stats = pygame.font.Font(None, 20)
+        font_stats = self.font_stats
         
         # Total collection progress
         total_progress = f"Collection: {stats['owned_items']}/{stats['total_items']} ({stats['completion_rate']}%)"
-        progress_surface = font_stats.render(total_progress, True, (200, 200, 200))
+        progress_surface = self.text_cache.render(font_stats, total_progress, (200, 200, 200))
         progress_rect = progress_surface.get_rect(x=20, y=20)
         screen.blit(progress_surface, progress_rect)
         
@@ -624,7 +637,7 @@ class CollectionOverlaySystem:
                 total = stats['rarity_counts'][rarity]
                 rarity_text = f"{rarity}: {owned}/{total}"
                 color = get_rarity_color(Rarity(rarity))
-                rarity_surface = font_stats.render(rarity_text, True, color)
+                rarity_surface = self.text_cache.render(font_stats, rarity_text, color)
                 rarity_rect = rarity_surface.get_rect(x=20, y=y_offset)
                 screen.blit(rarity_surface, rarity_rect)
                 y_offset += 25
@@ -651,12 +664,13 @@ class CollectionOverlaySystem:
             elif event.key == pygame.K_HOME:
                 self.carousel.navigate_to(0)
             elif event.key == pygame.K_END:
-                self.carousel.navigate_to(len(self.carousel.cards) - 1)
+                self.carousel.navigate_to(len(self.carousel.items) - 1)
             # Test ownership toggle with 'T' key
-            elif event.key == pygame.K_t and self.carousel.cards:
-                current_item = self.carousel.cards[self.carousel.current_index].item
+            elif event.key == pygame.K_t and self.carousel.items:
+                current_item = self.carousel.current_item()
                 new_status = not current_item.is_owned
                 self.data_manager.set_item_ownership(current_item.name, current_item.rarity, new_status)
+                ItemCard.invalidate_bitmaps(current_item)
                 self._update_collection()
         
         elif event.type == pygame.MOUSEWHEEL:
@@ -684,19 +698,30 @@ class CollectionOverlaySystem:
         # Handle carousel events
         self.carousel.handle_event(event, self.particle_system)
     
+    def is_idle(self):
+        """True when only the ambient particles are moving (fade, scroll and hover animations done)"""
+        if self.fading_out or self.fade_alpha < 255 or not self.carousel.scroll_offset.completed:
+            return False
+        animations = [value for card in self.carousel.cards
+                      for value in (card.scale, card.alpha, card.glow_intensity)]
+        animations += [value for tab in self.filter_tabs.values()
+                       for value in (tab.hover_scale, tab.glow_intensity)]
+        return all(value.completed for value in animations)
+    
     def update(self, dt):
         # Fade animation
         if self.fading_out:
             if self.fade_alpha > 0:
-                self.fade_alpha = max(0, self.fade_alpha - 24)
+                self.fade_alpha = max(0, self.fade_alpha - FADE_STEP * ticks(dt))
             if self.fade_alpha <= 0 and not self._fade_out_called:
                 self._fade_out_called = True
+                self.carousel.release()
                 if self.on_close:
                     self.on_close()
             return
         else:
             if self.fade_alpha < 255:
-                self.fade_alpha = min(255, self.fade_alpha + 24)
+                self.fade_alpha = min(255, self.fade_alpha + FADE_STEP * ticks(dt))
         
         # Update UI elements
         for tab in self.filter_tabs.values():
@@ -712,7 +737,7 @@ class CollectionOverlaySystem:
         self.background_particles_timer += dt
         if self.background_particles_timer > 0.5:
             self.background_particles_timer = 0
-            if len(self.particle_system.particles) < 15:
+            if len(self.particle_system) < 15:
                 x = random.randint(0, self.width)
                 y = random.randint(0, self.height)
                 color = random.choice([(80, 80, 120), (120, 80, 80), (80, 120, 80), (120, 120, 80)])
@@ -726,12 +751,12 @@ class CollectionOverlaySystem:
         self.particle_system.draw(surface)
         
         # Draw title
-        title_surface = self.fonts["large"].render("NEXUS COLLECTION", True, (255, 255, 255))
+        title_surface = self.text_cache.render(self.fonts["large"], "NEXUS COLLECTION", (255, 255, 255))
         title_rect = title_surface.get_rect(centerx=self.width//2, y=20)
         surface.blit(title_surface, title_rect)
         
         # Draw subtitle
-        subtitle_surface = self.fonts["small"].render("Gaming Archive", True, (150, 150, 150))
+        subtitle_surface = self.text_cache.render(self.fonts["small"], "Gaming Archive", (150, 150, 150))
         subtitle_rect = subtitle_surface.get_rect(centerx=self.width//2, y=title_rect.bottom + 5)
         surface.blit(subtitle_surface, subtitle_rect)
         
@@ -739,14 +764,15 @@ class CollectionOverlaySystem:
         self._draw_collection_stats(surface)
         
         # Draw filter tabs
+        lerp = self.clock.lerp if self.clock is not None else None
         for tab in self.filter_tabs.values():
-            tab.draw(surface)
+            tab.draw(surface, lerp)
         
         # Draw carousel
-        self.carousel.draw(surface, self.particle_system)
+        self.carousel.draw(surface, self.particle_system, lerp)
         
         # Draw navigation hints
-        font_hint = pygame.font.Font(None, 18)
+        font_hint = self.font_hint
         hints = [
             "Use ← → or A/D to navigate",
             "Mouse wheel to scroll",
@@ -755,7 +781,7 @@ class CollectionOverlaySystem:
         ]
         
         for i, hint in enumerate(hints):
-            hint_surface = font_hint.render(hint, True, (100, 100, 100))
+            hint_surface = self.text_cache.render(font_hint, hint, (100, 100, 100))
             hint_rect = hint_surface.get_rect(centerx=self.width//2, y=self.height - 80 + i * 20)
             surface.blit(hint_surface, hint_rect)
         
@@ -770,17 +796,11 @@ class CollectionOverlaySystem:
             btn_size, btn_size
         )
         color = (220, 60, 60) if is_hover else (200, 50, 50)
-        shadow = pygame.Surface((btn_rect.width+6, btn_rect.height+6), pygame.SRCALPHA)
-        pygame.draw.rect(shadow, (0,0,0,60), shadow.get_rect(), border_radius=12)
-        surface.blit(shadow, (btn_rect.x-3, btn_rect.y-3))
+        get_surface_cache().blit_rounded_rect(surface, btn_rect.inflate(6, 6), (0, 0, 0, 60), 12)
         pygame.draw.rect(surface, color, btn_rect, border_radius=12)
         pygame.draw.rect(surface, WHITE, btn_rect, 2, border_radius=12)
-        x_font = self.fonts["medium"].render("X", True, WHITE)
+        x_font = self.text_cache.render(self.fonts["medium"], "X", WHITE)
         x_rect = x_font.get_rect(center=btn_rect.center)
         surface.blit(x_font, x_rect)
-        
-        # Fade overlay
-        if self.fade_alpha < 255:
-            fade_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            fade_surf.fill((0, 0, 0, 255 - self.fade_alpha))
-            surface.blit(fade_surf, (0, 0)) 
\ No newline at end of file
+
+        # Fading in/out is cross-faded by GameManager from snapshots (ui_manager.transitions) 
\ No newline at end of file
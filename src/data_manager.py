@@ -1,17 +1,28 @@
 import json
 import os
 import random
-import shutil
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from typing import Dict, List, Any, Optional, Sequence
 from enum import Enum
 from dataclasses import dataclass
+from .persistence_manager import PersistenceManager, DEFAULT_SAVE_INTERVAL
+from .economy_journal import EconomyJournal, COIN_EARNED, COIN_SPENT, ITEM_GRANTED, ITEM_REVOKED
+from .asset_manifest import sync_assets
+from .word_corpus import WordCorpus, compile_corpus, is_current
 
 class Rarity(Enum):
     R = "R"
     SR = "SR"
     SSR = "SSR"
 
-@dataclass
+RARITY_COLORS = {
+    Rarity.R: (100, 149, 237),      # Cornflower Blue
+    Rarity.SR: (147, 112, 219),     # Medium Slate Blue
+    Rarity.SSR: (255, 215, 0)       # Gold
+}
+
+@dataclass(slots=True)
 class Item:
     name: str
     icon: str
@@ -20,15 +31,114 @@ class Item:
     is_owned: bool = False
     
     def get_rarity_color(self) -> tuple:
-        colors = {
-            Rarity.R: (100, 149, 237),      # Cornflower Blue
-            Rarity.SR: (147, 112, 219),     # Medium Slate Blue
-            Rarity.SSR: (255, 215, 0)       # Gold
-        }
-        return colors[self.rarity]
+        return RARITY_COLORS[self.rarity]
+
+class ItemCatalog:
+    """Name-indexed gacha items with per-rarity/owned views and O(1) completion counters
+
+    Item objects are built once per gacha data load and shared; the lists
+    returned by the view methods are read-only.
+    """
+    __slots__ = ("_items", "_raw", "_by_rarity", "_all", "_owned_view", "_unowned_view",
+                 "total_count", "owned_count", "rarity_counts", "owned_rarity_counts")
+    
+    def __init__(self, gacha_data: Dict[str, Any]):
+        self._items: Dict[str, Item] = {}
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._by_rarity: Dict[Rarity, List[Item]] = {rarity: [] for rarity in Rarity}
+        self.rarity_counts = {rarity.value: 0 for rarity in Rarity}
+        self.owned_rarity_counts = {rarity.value: 0 for rarity in Rarity}
+        self.total_count = 0
+        self.owned_count = 0
+        
+        for rarity_str, items in gacha_data.get("items", {}).items():
+            try:
+                rarity = Rarity(rarity_str)
+            except ValueError:
+                continue
+            for item_data in items:
+                name = item_data["name"]
+                if name in self._items:
+                    print(f"Warning: duplicate item name in gacha data, skipping: {name}")
+                    continue
+                item = Item(
+                    name=name,
+                    icon=item_data["icon"],
+                    rarity=rarity,
+                    rate=item_data["rate"],
+                    is_owned=item_data.get("is_owned", False)
+                )
+                self._items[name] = item
+                self._raw[name] = item_data
+                self._by_rarity[rarity].append(item)
+                self.total_count += 1
+                self.rarity_counts[rarity_str] += 1
+                if item.is_owned:
+                    self.owned_count += 1
+                    self.owned_rarity_counts[rarity_str] += 1
+        
+        self._all = [item for rarity in (Rarity.R, Rarity.SR, Rarity.SSR) for item in self._by_rarity[rarity]]
+        self._owned_view = None
+        self._unowned_view = None
+    
+    def __len__(self) -> int:
+        return self.total_count
+    
+    def get(self, name: str, rarity: Optional[Rarity] = None) -> Optional[Item]:
+        """Look up an item by name (and optionally check its rarity)"""
+        item = self._items.get(name)
+        if item is None or (rarity is not None and item.rarity != rarity):
+            return None
+        return item
+    
+    def get_raw(self, name: str) -> Optional[Dict[str, Any]]:
+        """The gacha data entry backing an item"""
+        return self._raw.get(name)
+    
+    def all_items(self) -> List[Item]:
+        return self._all
+    
+    def items_by_rarity(self, rarity: Rarity) -> List[Item]:
+        return self._by_rarity.get(rarity, [])
+    
+    def owned_items(self) -> List[Item]:
+        if self._owned_view is None:
+            self._owned_view = [item for item in self._all if item.is_owned]
+        return self._owned_view
+    
+    def unowned_items(self) -> List[Item]:
+        if self._unowned_view is None:
+            self._unowned_view = [item for item in self._all if not item.is_owned]
+        return self._unowned_view
+    
+    def set_owned(self, name: str, is_owned: bool) -> bool:
+        """Update an item's ownership and the counters; return False if unknown"""
+        item = self._items.get(name)
+        if item is None:
+            return False
+        if item.is_owned != is_owned:
+            item.is_owned = is_owned
+            self._raw[name]["is_owned"] = is_owned
+            delta = 1 if is_owned else -1
+            self.owned_count += delta
+            self.owned_rarity_counts[item.rarity.value] += delta
+            # Views are rebuilt lazily the next time a filter asks for them
+            self._owned_view = None
+            self._unowned_view = None
+        return True
+    
+    def completion_rate(self) -> float:
+        return (self.owned_count / self.total_count * 100) if self.total_count > 0 else 0
+
+# How often (in seconds) a loaded file's mtime is re-checked on access
+MTIME_CHECK_INTERVAL = 1.0
 
 class DataManager:
-    """Centralized data management for all game data"""
+    """Centralized data management for all game data
+
+    Use get_data_manager() to obtain the shared instance; each data file is
+    loaded on first access and reloaded only when its mtime changes.
+    """
     
     def __init__(self):
         # Setup data directory in user's home
@@ -47,17 +157,122 @@ class DataManager:
         self.settings_path = os.path.join(self.settings_dir, "setting.json")
         self.gacha_data_path = os.path.join(self.data_dir_path, "gacha_data.json")
         self.word_data_path = os.path.join(self.data_dir_path, "word.json")
+        self.word_corpus_path = os.path.join(self.data_dir_path, "word.corpus")
+        self.save_path = os.path.join(self.data_dir_path, "save.json")
+        
+        # Guards in-memory data against the background flush thread
+        self._lock = threading.RLock()
+        
+        # Settings, gacha ownership and autosave are written behind in batches
+        self._autosave_state = None
+        self.persistence = PersistenceManager(on_written=self._on_flushed)
+        self.persistence.register("settings", self._serialize_settings)
+        self.persistence.register("gacha", self._serialize_gacha_data)
+        self.persistence.register("autosave", self._serialize_autosave)
+        
+        # Coins and owned items are journaled; settings/gacha_data only mirror them
+        self._economy = None
+        self._economy_bytes_counted = 0
+        
+        # Indexed view over gacha_data, rebuilt whenever gacha_data is reloaded
+        self._catalog = None
+        self._catalog_source = None
+        self.persistence.register("economy", self._sync_economy)
         
         # Create directory structure
         self._ensure_directory_structure()
         
-        # Initialize data
-        self.gacha_data = {}
-        self.words = []
-        self.settings = {}
+        # Data is loaded lazily on first access (see the properties below)
+        self._gacha_data = None
+        self._words = None
+        self._settings = None
         
-        # Load all data
-        self._load_all_data()
+        # mtime of each file as of our last load/save, and when we last checked it
+        self._mtimes = {}
+        self._last_checked = {}
+    
+    def _is_stale(self, path: str) -> bool:
+        """Check whether a file changed on disk since we last loaded or saved it"""
+        now = time.monotonic()
+        if now - self._last_checked.get(path, 0.0) < MTIME_CHECK_INTERVAL:
+            return False
+        self._last_checked[path] = now
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            # Keep the in-memory copy if the file disappeared
+            return False
+        return mtime != self._mtimes.get(path)
+    
+    def _mark_synced(self, path: str):
+        """Remember the current mtime of a file we just loaded or saved"""
+        try:
+            self._mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            self._mtimes.pop(path, None)
+        self._last_checked[path] = time.monotonic()
+    
+    def _on_flushed(self, key: str, path: str):
+        """Called by the persistence worker after it wrote a file"""
+        with self._lock:
+            self._mark_synced(path)
+    
+    def _encode_json(self, path: str, data: Any):
+        with self._lock:
+            payload = json.dumps(data, indent=2, ensure_ascii=False)
+        return path, payload.encode("utf-8")
+    
+    def _serialize_settings(self):
+        # Snapshot under the lock so the worker never iterates the live dict
+        with self._lock:
+            if self._settings is None:
+                return None
+            settings = dict(self._settings)
+        return self.settings_path, json.dumps(settings, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    def _serialize_gacha_data(self):
+        return self._encode_json(self.gacha_data_path, self._gacha_data)
+    
+    def _serialize_autosave(self):
+        if self._autosave_state is None:
+            return None
+        return self._encode_json(self.save_path, self._autosave_state)
+    
+    def _sync_economy(self):
+        # The journal persists itself; batch its fsync and count what it appended
+        if self._economy is not None:
+            self._economy.sync()
+            written = self._economy.bytes_written
+            if written > self._economy_bytes_counted:
+                self.persistence.record_write(written - self._economy_bytes_counted)
+                self._economy_bytes_counted = written
+        return None
+    
+    @property
+    def gacha_data(self) -> Dict[str, Any]:
+        if self._gacha_data is None or (not self.persistence.is_dirty("gacha") and self._is_stale(self.gacha_data_path)):
+            self._load_gacha_data()
+        return self._gacha_data
+    
+    @gacha_data.setter
+    def gacha_data(self, value: Dict[str, Any]):
+        self._gacha_data = value
+    
+    @property
+    def words(self) -> Sequence[str]:
+        if self._words is None or self._is_stale(self.word_data_path):
+            self._load_word_data()
+        return self._words
+    
+    @property
+    def settings(self) -> Dict[str, Any]:
+        if self._settings is None or (not self.persistence.is_dirty("settings") and self._is_stale(self.settings_path)):
+            self._load_settings()
+        return self._settings
+    
+    @settings.setter
+    def settings(self, value: Dict[str, Any]):
+        self._settings = value
     
     def _ensure_directory_structure(self):
         """Ensure all necessary directories exist"""
@@ -80,42 +295,19 @@ class DataManager:
         self._copy_assets_if_needed()
     
     def _copy_assets_if_needed(self):
-        """Copy assets from project directory to user's home directory if they don't exist"""
-        # Define source and destination mappings
+        """Copy new or changed assets from the project directory to the user's home directory
+
+        A manifest stamp in the assets directory lets startup skip the copy
+        entirely when nothing changed (see asset_manifest.sync_assets).
+        """
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        asset_mappings = [
-            (os.path.join(project_root, "assets", "fonts"), self.fonts_dir),
-            (os.path.join(project_root, "assets", "images"), self.images_dir),
-            (os.path.join(project_root, "assets", "sounds"), self.sounds_dir)
-        ]
-        
-        for src_dir, dst_dir in asset_mappings:
-            if os.path.exists(src_dir) and not os.path.exists(dst_dir):
-                try:
-                    shutil.copytree(src_dir, dst_dir)
-                    print(f"Copied assets from {src_dir} to {dst_dir}")
-                except Exception as e:
-                    print(f"Error copying assets from {src_dir}: {e}")
-            elif os.path.exists(src_dir):
-                # Copy individual files if directory exists but files might be missing
-                try:
-                    for item in os.listdir(src_dir):
-                        src_item = os.path.join(src_dir, item)
-                        dst_item = os.path.join(dst_dir, item)
-                        if os.path.isfile(src_item) and not os.path.exists(dst_item):
-                            shutil.copy2(src_item, dst_item)
-                            print(f"Copied file: {item}")
-                        elif os.path.isdir(src_item) and not os.path.exists(dst_item):
-                            shutil.copytree(src_item, dst_item)
-                            print(f"Copied directory: {item}")
-                except Exception as e:
-                    print(f"Error copying individual assets from {src_dir}: {e}")
-    
-    def _load_all_data(self):
-        """Load all game data files"""
-        self._load_gacha_data()
-        self._load_word_data()
-        self._load_settings()
+        src_assets_dir = os.path.join(project_root, "assets")
+        if not os.path.isdir(src_assets_dir):
+            return
+        try:
+            sync_assets(src_assets_dir, self.assets_dir, ["fonts", "images", "sounds"])
+        except Exception as e:
+            print(f"Error syncing assets from {src_assets_dir}: {e}")
     
     def _load_gacha_data(self):
         """Load or create gacha data"""
@@ -123,6 +315,8 @@ class DataManager:
             if os.path.exists(self.gacha_data_path):
                 with open(self.gacha_data_path, "r", encoding="utf-8") as f:
                     self.gacha_data = json.load(f)
+                self._mark_synced(self.gacha_data_path)
+                self._mirror_economy_ownership()
                 print(f"Loaded gacha data from: {self.gacha_data_path}")
             else:
                 self._create_default_gacha_data()
@@ -167,29 +361,46 @@ class DataManager:
         print(f"Created default gacha data at: {self.gacha_data_path}")
     
     def _save_gacha_data(self):
-        """Save gacha data to file"""
-        try:
-            with open(self.gacha_data_path, "w", encoding="utf-8") as f:
-                json.dump(self.gacha_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving gacha data: {e}")
+        """Schedule gacha data to be written on the next flush"""
+        self.persistence.mark_dirty("gacha")
     
     def _load_word_data(self):
-        """Load or create word data"""
+        """Load or create word data
+
+        word.json is only parsed when the compiled corpus next to it is missing
+        or older than it; otherwise the corpus is memory-mapped as is.
+        """
         try:
             if os.path.exists(self.word_data_path):
-                with open(self.word_data_path, "r", encoding="utf-8") as f:
-                    self.words = json.load(f)
-                print(f"Loaded word data from: {self.word_data_path}")
+                self._close_word_corpus()
+                if not is_current(self.word_corpus_path, self.word_data_path):
+                    with open(self.word_data_path, "r", encoding="utf-8") as f:
+                        words = json.load(f)
+                    self._compile_word_corpus(words)
+                self._words = WordCorpus(self.word_corpus_path)
+                self._mark_synced(self.word_data_path)
+                print(f"Loaded {len(self._words)} words from: {self.word_corpus_path}")
             else:
                 self._create_default_word_data()
         except Exception as e:
             print(f"Error loading word data: {e}")
             self._create_default_word_data()
     
+    def _compile_word_corpus(self, words: List[str]):
+        """Rebuild word.corpus from a word list that was just read from or written to word.json"""
+        start = time.perf_counter()
+        count = compile_corpus(words, self.word_corpus_path, source_path=self.word_data_path)
+        print(f"Compiled word corpus: {count} words ({(time.perf_counter() - start) * 1000:.1f} ms)")
+    
+    def _close_word_corpus(self):
+        # Unmap before the corpus file is replaced (required on Windows)
+        if isinstance(self._words, WordCorpus):
+            self._words.close()
+        self._words = None
+    
     def _create_default_word_data(self):
         """Create default word data"""
-        self.words = [
+        words = [
             "hello", "world", "python", "game", "typing", "speed", "test",
             "computer", "programming", "development", "software", "application",
             "database", "network", "internet", "website", "server", "client",
@@ -201,16 +412,22 @@ class DataManager:
             "authentication", "authorization", "encryption", "decryption",
             "compression", "decompression", "serialization", "deserialization"
         ]
-        self._save_word_data()
+        self._save_word_data(words)
         print(f"Created default word data at: {self.word_data_path}")
     
-    def _save_word_data(self):
-        """Save word data to file"""
+    def _save_word_data(self, words: List[str]):
+        """Save word data to file and recompile the corpus"""
+        self._close_word_corpus()
         try:
             with open(self.word_data_path, "w", encoding="utf-8") as f:
-                json.dump(self.words, f, indent=2, ensure_ascii=False)
+                json.dump(words, f, indent=2, ensure_ascii=False)
+            self._compile_word_corpus(words)
+            self._words = WordCorpus(self.word_corpus_path)
+            self._mark_synced(self.word_data_path)
         except Exception as e:
             print(f"Error saving word data: {e}")
+            # Keep the game playable from memory
+            self._words = words
     
     def _load_settings(self):
         """Load or create settings data"""
@@ -218,6 +435,9 @@ class DataManager:
             if os.path.exists(self.settings_path):
                 with open(self.settings_path, "r", encoding="utf-8") as f:
                     self.settings = json.load(f)
+                self._mark_synced(self.settings_path)
+                self._apply_persistence_settings()
+                self._mirror_economy_coins()
                 print(f"Loaded settings from: {self.settings_path}")
             else:
                 self._create_default_settings()
@@ -230,7 +450,12 @@ class DataManager:
         self.settings = {
             'screen_width': 1280,
             'screen_height': 720,
-            'fps': 60,
+            'fps': 60,  # 0 = ไม่จำกัด
+            'simulation_hz': 60,  # ความถี่ fixed step ของการจำลองเกม
+            'ambient_fps': 15,  # ความถี่การวาดประกายลอยบนพื้นหลังใหม่
+            'power_save': True,  # ลด fps เมื่อหน้าจอนิ่ง/ไม่ได้โฟกัส และหยุดวาดเมื่อย่อหน้าต่าง
+            'idle_fps': 20,
+            'background_fps': 10,
             'max_time_per_word': 20,
             'growth_on_success': 0.15,
             'growth_on_error': -0.05,
@@ -240,23 +465,31 @@ class DataManager:
             'coins': 1000,  # เพิ่มค่าเริ่มต้นสำหรับเงิน
             'sound_volume': 0.5,
             'music_volume': 0.3,
+            'sound_memory_mb': 16,  # หน่วยความจำสูงสุดของเสียง SFX ที่ decode แล้ว
             'difficulty': 'normal',
             'language': 'en',
+            'save_interval': DEFAULT_SAVE_INTERVAL,  # วินาทีระหว่างการบันทึกไฟล์เบื้องหลัง
+            'dirty_rect_rendering': False,  # วาด/อัปเดตจอเฉพาะส่วนที่เปลี่ยน
+            'debug_dirty_rects': False,  # แสดงกรอบส่วนที่เปลี่ยน
             # Game statistics
             'total_words_typed': 0,
             'total_coins_earned': 0,
             'best_combo': 0
         }
+        self._apply_persistence_settings()
         self._save_settings()
         print(f"Created default settings at: {self.settings_path}")
     
-    def _save_settings(self):
-        """Save settings to file"""
+    def _apply_persistence_settings(self):
+        """Apply the configured background flush cadence"""
         try:
-            with open(self.settings_path, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+            self.persistence.interval = max(0.1, float(self._settings.get('save_interval', DEFAULT_SAVE_INTERVAL)))
+        except (TypeError, ValueError):
+            self.persistence.interval = DEFAULT_SAVE_INTERVAL
+    
+    def _save_settings(self):
+        """Schedule settings to be written on the next flush"""
+        self.persistence.mark_dirty("settings")
     
     # Public methods for accessing data
     
@@ -264,32 +497,111 @@ class DataManager:
         """Get gacha data"""
         return self.gacha_data
     
-    def get_words(self) -> List[str]:
-        """Get word list"""
+    def get_words(self) -> Sequence[str]:
+        """Get word list (a memory-mapped WordCorpus; index it rather than copying it)"""
         return self.words
     
     def get_settings(self) -> Dict[str, Any]:
-        """Get settings"""
+        """Get settings (read only; change them through update_settings)"""
         return self.settings
     
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        """Read one setting under the lock, without copying the settings"""
+        with self._lock:
+            return self.settings.get(key, default)
+    
     def get_random_word(self) -> str:
         """Get a random word from the word list"""
-        return random.choice(self.words) if self.words else "default"
+        # random.choice only needs len() and one index, so the corpus is never materialised
+        words = self.words
+        return random.choice(words) if len(words) else "default"
     
     def set_item_ownership(self, item_name: str, rarity: Rarity, is_owned: bool) -> bool:
         """Set ownership status of an item"""
         try:
-            rarity_str = rarity.value
-            if rarity_str in self.gacha_data.get("items", {}):
-                for item in self.gacha_data["items"][rarity_str]:
-                    if item["name"] == item_name:
-                        item["is_owned"] = is_owned
-                        self._save_gacha_data()
-                        return True
-            return False
+            if self._find_item_data(item_name, rarity.value) is None:
+                return False
+            if is_owned:
+                event = EconomyJournal.item_granted(item_name, rarity.value)
+            else:
+                event = EconomyJournal.item_revoked(item_name, rarity.value)
+            return self.commit_economy([event])
         except Exception as e:
             print(f"Error setting item ownership: {e}")
             return False
+    
+    def _find_item_data(self, item_name: str, rarity_str: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Find the raw gacha entry for an item"""
+        catalog = self.get_catalog()
+        if catalog.get(item_name, Rarity(rarity_str) if rarity_str else None) is None:
+            return None
+        return catalog.get_raw(item_name)
+    
+    def get_catalog(self) -> ItemCatalog:
+        """Get the indexed item catalog (rebuilt only when gacha data is reloaded)"""
+        with self._lock:
+            gacha_data = self.gacha_data
+            if self._catalog is None or self._catalog_source is not gacha_data:
+                self._catalog = ItemCatalog(gacha_data)
+                self._catalog_source = gacha_data
+            return self._catalog
+    
+    def get_economy(self) -> EconomyJournal:
+        """Get the economy journal holding the authoritative coins and owned items"""
+        with self._lock:
+            if self._economy is None:
+                economy = EconomyJournal(self.data_dir_path)
+                if not economy.has_history:
+                    # First run with the journal: seed it from the legacy JSON files
+                    autosave = self.load_autosave() or {}
+                    coins = autosave.get("coins", self.settings.get('coins', 1000))
+                    owned = [item["name"]
+                             for items in self.gacha_data.get("items", {}).values()
+                             for item in items if item.get("is_owned", False)]
+                    economy.seed(coins, owned)
+                self._economy = economy
+                self._mirror_economy_coins()
+                self._mirror_economy_ownership()
+            return self._economy
+    
+    def commit_economy(self, events: List[Dict[str, Any]]) -> bool:
+        """Append economy events as one journal record, then update the mirrors"""
+        economy = self.get_economy()
+        with self._lock:
+            if not economy.commit(events):
+                return False
+            for event in events:
+                kind = event["type"]
+                if kind in (COIN_EARNED, COIN_SPENT):
+                    self._mirror_economy_coins()
+                elif kind in (ITEM_GRANTED, ITEM_REVOKED):
+                    if self.get_catalog().set_owned(event["item"], kind == ITEM_GRANTED):
+                        self._save_gacha_data()
+        self.persistence.mark_dirty("economy")
+        return True
+    
+    def _mirror_economy_coins(self):
+        """Copy the journal's coin balance into settings['coins']"""
+        if self._economy is None or self._settings is None:
+            return
+        if self._settings.get('coins') != self._economy.coins:
+            self._settings['coins'] = self._economy.coins
+            self._save_settings()
+    
+    def _mirror_economy_ownership(self):
+        """Copy the journal's owned items into the gacha data is_owned flags"""
+        if self._economy is None or self._gacha_data is None:
+            return
+        changed = False
+        for items in self._gacha_data.get("items", {}).values():
+            for item in items:
+                owned = item["name"] in self._economy.owned
+                if item.get("is_owned", False) != owned:
+                    item["is_owned"] = owned
+                    changed = True
+        if changed:
+            self._catalog = None
+            self._save_gacha_data()
 
     def add_item_to_collection(self, item_name: str, rarity: Rarity) -> bool:
         """Add an item to player's collection (mark as owned)"""
@@ -298,27 +610,13 @@ class DataManager:
     def get_player_stats(self) -> Dict[str, Any]:
         """Get player statistics"""
         try:
-            total_items = 0
-            owned_items = 0
-            rarity_counts = {"R": 0, "SR": 0, "SSR": 0}
-            owned_rarity_counts = {"R": 0, "SR": 0, "SSR": 0}
-            
-            for rarity_str, items in self.gacha_data.get("items", {}).items():
-                for item in items:
-                    total_items += 1
-                    rarity_counts[rarity_str] += 1
-                    if item.get("is_owned", False):
-                        owned_items += 1
-                        owned_rarity_counts[rarity_str] += 1
-            
-            completion_rate = (owned_items / total_items * 100) if total_items > 0 else 0
-            
+            catalog = self.get_catalog()
             return {
-                "total_items": total_items,
-                "owned_items": owned_items,
-                "completion_rate": round(completion_rate, 1),
-                "rarity_counts": rarity_counts,
-                "owned_rarity_counts": owned_rarity_counts
+                "total_items": catalog.total_count,
+                "owned_items": catalog.owned_count,
+                "completion_rate": round(catalog.completion_rate(), 1),
+                "rarity_counts": dict(catalog.rarity_counts),
+                "owned_rarity_counts": dict(catalog.owned_rarity_counts)
             }
         except Exception as e:
             print(f"Error getting player stats: {e}")
@@ -331,55 +629,36 @@ class DataManager:
             }
     
     def get_items_by_rarity(self, rarity: Rarity) -> List[Item]:
-        """Get items by rarity with ownership status"""
-        items = []
-        if rarity.value in self.gacha_data["items"]:
-            for item_data in self.gacha_data["items"][rarity.value]:
-                item = Item(
-                    name=item_data["name"],
-                    icon=item_data["icon"],
-                    rarity=rarity,
-                    rate=item_data["rate"],
-                    is_owned=item_data.get("is_owned", False)
-                )
-                items.append(item)
-        return items
+        """Get items by rarity with ownership status (shared, do not modify)"""
+        return self.get_catalog().items_by_rarity(rarity)
     
     def get_all_items(self) -> List[Item]:
-        """Get all items with ownership status"""
-        all_items = []
-        for rarity_str in ["R", "SR", "SSR"]:
-            try:
-                rarity = Rarity(rarity_str)
-                all_items.extend(self.get_items_by_rarity(rarity))
-            except ValueError:
-                continue
-        return all_items
+        """Get all items with ownership status (shared, do not modify)"""
+        return self.get_catalog().all_items()
     
     def get_collected_items(self) -> List[Item]:
         """Get all collected items"""
-        return [item for item in self.get_all_items() if item.is_owned]
+        return self.get_catalog().owned_items()
+    
+    def get_uncollected_items(self) -> List[Item]:
+        """Get all items not collected yet"""
+        return self.get_catalog().unowned_items()
     
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get collection statistics"""
-        stats = {"total": 0, "collected": 0}
-        for rarity_str in ["R", "SR", "SSR"]:
-            try:
-                rarity = Rarity(rarity_str)
-                items = self.get_items_by_rarity(rarity)
-                stats[rarity_str] = {"total": len(items), "collected": 0}
-                stats["total"] += len(items)
-                for item in items:
-                    if item.is_owned:
-                        stats[rarity_str]["collected"] += 1
-                        stats["collected"] += 1
-            except ValueError:
-                continue
+        catalog = self.get_catalog()
+        stats = {"total": catalog.total_count, "collected": catalog.owned_count}
+        for rarity in Rarity:
+            stats[rarity.value] = {
+                "total": catalog.rarity_counts[rarity.value],
+                "collected": catalog.owned_rarity_counts[rarity.value]
+            }
         return stats
     
     def update_settings(self, new_settings: Dict[str, Any]):
         """Update settings"""
-        self.settings.update(new_settings)
+        with self._lock:
+            self.settings.update(new_settings)
         self._save_settings()
     
     def reset_all_data(self):
@@ -387,6 +666,7 @@ class DataManager:
         self._create_default_gacha_data()
         self._create_default_word_data()
         self._create_default_settings()
+        self.get_economy().seed(self.settings.get('coins', 1000), [])
         print("All data reset to default values")
     
     def get_assets_path(self, asset_type: str, filename: str = None) -> str:
@@ -406,10 +686,12 @@ class DataManager:
 
     def get_save_path(self):
         """Return the path to save.json in the data directory"""
-        return os.path.join(self.data_dir_path, "save.json")
+        return self.save_path
 
     def load_autosave(self):
         """Load autosave data from save.json if exists, else return None"""
+        if self._autosave_state is not None:
+            return dict(self._autosave_state)
         save_path = self.get_save_path()
         if os.path.exists(save_path):
             try:
@@ -420,15 +702,40 @@ class DataManager:
         return None
 
     def save_autosave(self, coins, combo, plant_growth):
-        """Save autosave data to save.json"""
-        save_path = self.get_save_path()
-        data = {
-            "coins": coins,
-            "combo": combo,
-            "plant_growth": plant_growth
-        }
-        try:
-            with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving autosave: {e}") 
\ No newline at end of file
+        """Schedule autosave data to be written to save.json on the next flush"""
+        with self._lock:
+            self._autosave_state = {
+                "coins": coins,
+                "combo": combo,
+                "plant_growth": plant_growth
+            }
+        self.persistence.mark_dirty("autosave")
+
+    def flush(self):
+        """Write all pending changes to disk now"""
+        self.persistence.flush()
+
+    def shutdown(self):
+        """Stop background saving and flush everything (call on quit)"""
+        self.persistence.shutdown()
+        if self._economy is not None:
+            self._economy.close()
+        stats = self.persistence.get_write_stats()
+        print(f"Saved data: {stats['total_bytes']} bytes in {stats['flushes']} flushes "
+              f"({stats['bytes_per_minute']} bytes in the last minute)")
+
+    def get_write_stats(self) -> Dict[str, float]:
+        """Bytes written per minute and lifetime write totals"""
+        return self.persistence.get_write_stats()
+
+_shared_data_manager: Optional[DataManager] = None
+_shared_lock = threading.Lock()
+
+def get_data_manager() -> DataManager:
+    """Return the process-wide DataManager shared by every component"""
+    global _shared_data_manager
+    if _shared_data_manager is None:
+        with _shared_lock:
+            if _shared_data_manager is None:
+                _shared_data_manager = DataManager()
+    return _shared_data_manager
@@ -1,39 +1,24 @@
 import pygame
 import math
 import random
+from .surface_cache import get_surface_cache
+from .particle_engine import ParticleEngine
+from .animation_clock import ticks
 
 WHITE = (255, 255, 255)
+MIDDLE_COLOR = (200, 200, 200)
+INNER_COLOR = (150, 150, 150)
 
-class Particle:
-    """
-    อนุภาคสำหรับเอฟเฟกต์ particle ด้านหลังปุ่ม DiamondButton
-    """
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-1, 1)
-        self.vy = random.uniform(-1, 1)
-        self.alpha = 255
-        self.size = random.uniform(1, 3)
-        self.color = random.choice([(144, 238, 144), (173, 255, 173), (200, 255, 200), WHITE])
-        self.life = random.uniform(0.5, 2.0)
-        self.max_life = self.life
+# มุมของเฟรมหมุนที่อบไว้ (เพชรสมมาตรทุก 90 องศา จึงเก็บแค่ 0-90)
+ROTATION_STEP = 2
+SYMMETRY = 90
 
-    def update(self, dt):
-        self.x += self.vx * dt * 60
-        self.y += self.vy * dt * 60
-        self.life -= dt
-        self.alpha = max(0, int(255 * (self.life / self.max_life)))
-        self.vx *= 0.98
-        self.vy *= 0.98
-        return self.life > 0
+# ระยะเผื่อรอบรูปเพชรสำหรับเส้นขอบหนา
+FRAME_PADDING = 4
 
-    def draw(self, screen):
-        if self.alpha > 0:
-            particle_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            color_with_alpha = (*self.color[:3], self.alpha)
-            pygame.draw.circle(particle_surface, color_with_alpha, (int(self.size), int(self.size)), int(self.size))
-            screen.blit(particle_surface, (self.x - self.size, self.y - self.size))
+# อนุภาคด้านหลังปุ่ม: สีที่สุ่มได้ และแรงต้านต่อเฟรม 60 Hz
+PARTICLE_COLORS = [(144, 238, 144), (173, 255, 173), (200, 255, 200), WHITE]
+PARTICLE_DRAG = 0.98
 
 class DiamondButton:
     """
@@ -54,14 +39,20 @@ class DiamondButton:
         self.bounce_frequency = 0.5
         self.rotation_speed = 1
         self.inner_rotation_speed = 0.75
-        self.particles = []
+        # อนุภาคจางหายโดยไม่หดขนาด
+        self.particles = ParticleEngine(drag=(PARTICLE_DRAG, PARTICLE_DRAG), shrink=False)
         self.particle_spawn_timer = 0
         self.particle_spawn_rate = 0.15
-        self.outer_points = self._calculate_diamond_points(x, y, size)
-        self.middle_points = self._calculate_diamond_points(x, y, size - 15)
-        self.inner_points = self._calculate_diamond_points(x, y, size - 30)
         self.sound_manager = sound_manager
         self._was_hovered = False
+        
+        # ย่อ icon ครั้งเดียว (ประมาณ 40% ของขนาดปุ่ม)
+        icon_size = int(size * 0.4)
+        self.scaled_icon = pygame.transform.smoothscale(self.icon, (icon_size, icon_size)) if self.icon else None
+        
+        # เฟรมของเพชรวาดไว้ใน surface cache ที่แชร์กัน (ปุ่มขนาดเท่ากันใช้เฟรมร่วมกัน)
+        self.frame_center = size // 2 + FRAME_PADDING
+        self.surface_cache = get_surface_cache()
 
     def _calculate_diamond_points(self, center_x, center_y, size, rotation=0):
         half_size = size // 2
@@ -89,12 +80,53 @@ class DiamondButton:
         self.particle_spawn_timer += dt
         if self.particle_spawn_timer >= self.particle_spawn_rate:
             self.particle_spawn_timer = 0
-            for _ in range(random.randint(2, 4)):
-                offset_x = random.uniform(-self.size//3, self.size//3)
-                offset_y = random.uniform(-self.size//3, self.size//3)
-                particle = Particle(self.x + offset_x, self.y + offset_y)
-                self.particles.append(particle)
+            count = random.randint(2, 4)
+            rng = self.particles.rng
+            spread = self.size // 3
+            colors = [random.choice(PARTICLE_COLORS) for _ in range(count)]
+            self.particles.emit(
+                self.x + rng.uniform(-spread, spread, count), self.y + rng.uniform(-spread, spread, count),
+                rng.uniform(-60, 60, count), rng.uniform(-60, 60, count),
+                rng.uniform(0.5, 2.0, count), rng.uniform(1, 3, count), colors
+            )
 
+    def _frame_surface(self):
+        side = self.frame_center * 2
+        return pygame.Surface((side, side), pygame.SRCALPHA)
+    
+    def _quantize_angle(self, angle):
+        return int(round(angle / ROTATION_STEP)) * ROTATION_STEP % SYMMETRY
+    
+    def _outer_frame(self, angle):
+        """เพชรชั้นนอกและชั้นกลาง (หมุนมุมเดียวกัน) ที่มุม angle"""
+        def build():
+            surf = self._frame_surface()
+            c = self.frame_center
+            pygame.draw.polygon(surf, WHITE, self._calculate_diamond_points(c, c, self.size, angle), 3)
+            pygame.draw.polygon(surf, MIDDLE_COLOR, self._calculate_diamond_points(c, c, self.size - 15, angle), 2)
+            return surf
+        return self.surface_cache.get(("diamond_outer", self.size, angle), build)
+    
+    def _inner_frame(self, angle):
+        """เพชรชั้นในที่มุม angle"""
+        def build():
+            surf = self._frame_surface()
+            c = self.frame_center
+            pygame.draw.polygon(surf, INNER_COLOR, self._calculate_diamond_points(c, c, self.size - 30, angle), 2)
+            return surf
+        return self.surface_cache.get(("diamond_inner", self.size, angle), build)
+    
+    def _idle_frame(self):
+        """ภาพปุ่มตอนนิ่ง (เพชรสามชั้น + icon) ประกอบครั้งเดียว"""
+        def build():
+            surf = self._frame_surface()
+            surf.blit(self._outer_frame(0), (0, 0))
+            surf.blit(self._inner_frame(0), (0, 0))
+            if self.scaled_icon:
+                surf.blit(self.scaled_icon, self.scaled_icon.get_rect(center=(self.frame_center, self.frame_center)))
+            return surf
+        return self.surface_cache.get(("diamond_idle", self.size, id(self.icon)), build)
+    
     def update_animation(self, dt):
         if self.is_hovered:
             self.rotation_angle += self.rotation_speed * dt * 60
@@ -105,46 +137,45 @@ class DiamondButton:
                 self.inner_rotation_angle += 360
             self.bounce_time += dt
         else:
-            self.rotation_angle *= 0.95
-            self.inner_rotation_angle *= 0.95
+            # หมุนกลับเข้าที่ 5% ต่อ tick
+            settle = 0.95 ** ticks(dt)
+            self.rotation_angle *= settle
+            self.inner_rotation_angle *= settle
             if abs(self.rotation_angle) < 0.1:
                 self.rotation_angle = 0
             if abs(self.inner_rotation_angle) < 0.1:
                 self.inner_rotation_angle = 0
             self.bounce_time = 0
-        self.outer_points = self._calculate_diamond_points(self.x, self.y, self.size, self.rotation_angle)
-        self.middle_points = self._calculate_diamond_points(self.x, self.y, self.size - 15, self.rotation_angle)
-        self.inner_points = self._calculate_diamond_points(self.x, self.y, self.size - 30, self.inner_rotation_angle)
-        self.spawn_particles(dt)
-        self.particles = [p for p in self.particles if p.update(dt)]
+        if self.particles or self.is_hovered:
+            self.spawn_particles(dt)
+            self.particles.update(dt)
+
+    def is_animating(self):
+        """ยังมีการหมุน/อนุภาคอยู่หรือไม่ (ถ้าไม่ ปุ่มวาดจากภาพนิ่งที่ cache ไว้)"""
+        return self.is_hovered or bool(self.particles) or self.rotation_angle != 0 or self.inner_rotation_angle != 0
 
     def draw(self, screen):
+        """วาดปุ่ม คืนค่าพื้นที่บนจอที่วาดทับ (สำหรับ dirty rect)"""
+        frame_pos = (self.x - self.frame_center, self.y - self.frame_center)
+        frame_rect = pygame.Rect(frame_pos, (self.frame_center * 2, self.frame_center * 2))
+        if not self.is_animating():
+            screen.blit(self._idle_frame(), frame_pos)
+            return frame_rect
         # Draw particles
-        for particle in self.particles:
-            particle.draw(screen)
-        # Draw outer diamond (ขาวสุด)
-        pygame.draw.polygon(screen, WHITE, self.outer_points, 3)
-        # Draw middle diamond (สีอ่อนลง)
-        MIDDLE_COLOR = (200, 200, 200)
-        pygame.draw.polygon(screen, MIDDLE_COLOR, self.middle_points, 2)
-        # Draw inner diamond (สีอ่อนลงอีก)
-        INNER_COLOR = (150, 150, 150)
-        pygame.draw.polygon(screen, INNER_COLOR, self.inner_points, 2)
+        particles_rect = self.particles.draw(screen)
+        # Draw outer + middle diamond, then inner diamond (หมุนสวนทาง)
+        screen.blit(self._outer_frame(self._quantize_angle(self.rotation_angle)), frame_pos)
+        screen.blit(self._inner_frame(self._quantize_angle(self.inner_rotation_angle)), frame_pos)
         # Draw icon
-        if self.icon:
+        if self.scaled_icon:
             if self.is_hovered:
                 bounce_offset = math.sin(self.bounce_time * self.bounce_frequency * 2 * math.pi) * self.bounce_amplitude
             else:
                 bounce_offset = 0
             icon_y = self.y + bounce_offset
-            
-            # Calculate appropriate icon size (about 40% of button size)
-            icon_size = int(self.size * 0.4)
-            
-            # Scale the icon to fit properly
-            scaled_icon = pygame.transform.smoothscale(self.icon, (icon_size, icon_size))
-            scaled_rect = scaled_icon.get_rect(center=(self.x, icon_y))
-            screen.blit(scaled_icon, scaled_rect)
+            scaled_rect = self.scaled_icon.get_rect(center=(self.x, icon_y))
+            screen.blit(self.scaled_icon, scaled_rect)
+        return frame_rect.union(particles_rect) if particles_rect else frame_rect
 
     def is_point_inside(self, point):
         x, y = point
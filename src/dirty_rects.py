@@ -0,0 +1,118 @@
+# NongGameTyping/src/dirty_rects.py
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import pygame
+
+# Past this share of the screen a single full update is cheaper than many small ones
+FULL_UPDATE_FRACTION = 0.6
+
+# Outline colours for the debug view: pushed to the display / redrawn but unchanged
+DEBUG_CHANGED_COLOR = (255, 60, 60)
+DEBUG_STATIC_COLOR = (60, 160, 255)
+
+class DirtyRectTracker:
+    """Which parts of the screen were drawn and changed this frame
+
+    Every frame each component marks the area it drew. Before the next frame
+    those areas are restored from the background, so anything drawn always
+    lands on a clean background. A named mark carries a state key; when the
+    key and the rect match the previous frame the area is redrawn but not
+    pushed to the display. Anonymous marks (particles, effects) are always
+    pushed, as are the areas they covered the frame before.
+    """
+
+    def __init__(self, screen_size: Tuple[int, int], full_fraction: float = FULL_UPDATE_FRACTION):
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.full_fraction = full_fraction
+        self._previous: Dict[Hashable, Tuple[pygame.Rect, Any]] = {}
+        self._previous_anonymous: List[pygame.Rect] = []
+        self._current: Dict[Hashable, Tuple[pygame.Rect, Any]] = {}
+        self._current_anonymous: List[pygame.Rect] = []
+        self._last_pushed: List[pygame.Rect] = []
+        self.full = True
+
+    def invalidate(self):
+        """Redraw and push the whole screen on the next frame (scene switches, resizes)"""
+        self.full = True
+
+    def restore_rects(self) -> List[pygame.Rect]:
+        """Areas drawn last frame, to be reset to the background before drawing"""
+        if self.full:
+            return [self.screen_rect]
+        return [rect for rect, _ in self._previous.values()] + self._previous_anonymous
+
+    def mark(self, rect, name: Optional[Hashable] = None, state: Any = None):
+        """Record an area drawn this frame
+
+        With a name and a non-None state the area is only pushed when either
+        differs from the previous frame.
+        """
+        if rect is None:
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if not rect.width or not rect.height:
+            return
+        if name is None:
+            self._current_anonymous.append(rect)
+        else:
+            self._current[name] = (rect, state)
+
+    def end_frame(self) -> List[pygame.Rect]:
+        """Rects to pass to pygame.display.update; starts the next frame"""
+        if self.full:
+            pushed = [self.screen_rect]
+        else:
+            pushed = list(self._previous_anonymous) + self._current_anonymous
+            for name, (rect, state) in self._current.items():
+                before = self._previous.get(name)
+                if state is None or before is None or before[1] != state or before[0] != rect:
+                    pushed.append(rect)
+                    if before is not None:
+                        pushed.append(before[0])
+            pushed += [rect for name, (rect, _) in self._previous.items() if name not in self._current]
+            pushed = self._merge(pushed)
+
+        self._previous = self._current
+        self._previous_anonymous = self._current_anonymous
+        self._current = {}
+        self._current_anonymous = []
+        self._last_pushed = pushed
+        self.full = False
+        return pushed
+
+    def draw_debug(self, surface: pygame.Surface):
+        """Outline this frame's marks (call before end_frame)
+
+        Outlines stay inside the marked rects, so the next frame's restore
+        wipes them again. Unchanged areas get pushed too so their outline
+        shows.
+        """
+        for rect in self._current_anonymous:
+            pygame.draw.rect(surface, DEBUG_CHANGED_COLOR, rect, 1)
+        for name, (rect, state) in self._current.items():
+            before = self._previous.get(name)
+            static = state is not None and before == (rect, state)
+            pygame.draw.rect(surface, DEBUG_STATIC_COLOR if static else DEBUG_CHANGED_COLOR, rect, 1)
+            if static:
+                self._current_anonymous.append(rect)
+
+    def stats(self) -> Dict[str, Any]:
+        area = sum(rect.width * rect.height for rect in self._last_pushed)
+        return {
+            "rects": len(self._last_pushed),
+            "screen_fraction": area / (self.screen_rect.width * self.screen_rect.height),
+        }
+
+    def _merge(self, rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Union overlapping rects; one full-screen rect once most of the screen is dirty"""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.copy()
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        area = sum(rect.width * rect.height for rect in merged)
+        if area > self.full_fraction * self.screen_rect.width * self.screen_rect.height:
+            return [self.screen_rect]
+        return merged
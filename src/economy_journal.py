@@ -0,0 +1,243 @@
+# NongGameTyping/src/economy_journal.py
+import json
+import os
+import threading
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+from .persistence_manager import write_file_atomic
+
+JOURNAL_FILENAME = "economy.journal"
+SNAPSHOT_FILENAME = "economy_snapshot.json"
+
+# Fold the journal into a fresh snapshot once this many records pile up
+COMPACT_AFTER_RECORDS = 1000
+
+# Event types
+COIN_EARNED = "coin_earned"
+COIN_SPENT = "coin_spent"
+ITEM_GRANTED = "item_granted"
+ITEM_REVOKED = "item_revoked"
+
+def _record_crc(seq: int, events: List[Dict[str, Any]]) -> int:
+    body = json.dumps({"seq": seq, "events": events}, sort_keys=True, separators=(",", ":"))
+    return zlib.crc32(body.encode("utf-8"))
+
+class EconomyJournal:
+    """Append-only log of coin and item events with snapshot compaction
+
+    Every commit appends one checksummed JSON line holding one or more events,
+    so a gacha spend and its item grants land (or are lost) together. Appends
+    are fsynced in batches by sync(); on startup the snapshot is loaded and the
+    journal replayed, dropping a torn trailing record left by a crash.
+    """
+
+    def __init__(self, directory: str):
+        self.journal_path = os.path.join(directory, JOURNAL_FILENAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILENAME)
+        self.coins = 0
+        self.owned = set()
+        self.seq = 0
+        self._lock = threading.RLock()
+        self._file = None
+        self._needs_fsync = False
+        self._records_since_snapshot = 0
+        # Bytes appended to the journal and written as snapshots (for write stats)
+        self.bytes_written = 0
+        self.has_history = self._load()
+
+    # --- Startup ---
+
+    def _load(self) -> bool:
+        """Load the snapshot and replay the journal; return False if neither exists"""
+        found = False
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    snapshot = json.load(f)
+                self.seq = int(snapshot.get("seq", 0))
+                self.coins = int(snapshot.get("coins", 0))
+                self.owned = set(snapshot.get("owned", []))
+                found = True
+            except Exception as e:
+                print(f"Error loading economy snapshot: {e}")
+
+        if os.path.exists(self.journal_path):
+            found = self._replay() or found
+        return found
+
+    def _replay(self) -> bool:
+        good_offset = 0
+        replayed = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    seq = int(record["seq"])
+                    events = record["events"]
+                    if not line.endswith(b"\n") or record.get("crc") != _record_crc(seq, events):
+                        raise ValueError("checksum mismatch")
+                except Exception:
+                    print(f"Economy journal: dropping damaged record at byte {good_offset}")
+                    break
+                good_offset += len(line)
+                if seq <= self.seq:
+                    continue  # Already folded into the snapshot
+                self._apply(events)
+                self.seq = seq
+                replayed += 1
+
+        if good_offset != os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_offset)
+                f.flush()
+                os.fsync(f.fileno())
+        self._records_since_snapshot = replayed
+        if replayed:
+            print(f"Economy journal: replayed {replayed} records")
+        return good_offset > 0
+
+    def seed(self, coins: int, owned: Iterable[str]):
+        """Initialise state for a player who has no journal yet"""
+        with self._lock:
+            self.coins = int(coins)
+            self.owned = set(owned)
+            self.compact()
+            self.has_history = True
+
+    # --- Writing ---
+
+    def commit(self, events: List[Dict[str, Any]]) -> bool:
+        """Validate and append events as one atomic record, applying them once written
+
+        Returns False, with state unchanged, if the events are invalid or the
+        record could not be written.
+        """
+        with self._lock:
+            if not self._validate(events):
+                return False
+            seq = self.seq + 1
+            record = {"seq": seq, "events": events, "crc": _record_crc(seq, events)}
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            if not self._append(line.encode("utf-8")):
+                return False
+            self._apply(events)
+            self.seq = seq
+            self._needs_fsync = True
+            self._records_since_snapshot += 1
+            return True
+
+    def _append(self, data: bytes) -> bool:
+        offset = None
+        try:
+            if self._file is None:
+                self._file = open(self.journal_path, "ab")
+            offset = self._file.tell()
+            self._file.write(data)
+            # Hand the bytes to the OS now; fsync is batched in sync()
+            self._file.flush()
+            self.bytes_written += len(data)
+            return True
+        except OSError as e:
+            print(f"Error writing economy journal: {e}")
+            self._discard_partial(offset)
+            return False
+
+    def _discard_partial(self, offset: Optional[int]):
+        """Cut a partly written record so later appends don't follow a torn line"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass  # The unwritten buffer is dropped along with the record
+            self._file = None
+        if offset is not None:
+            try:
+                os.truncate(self.journal_path, offset)
+            except OSError:
+                pass  # Replay drops a torn record anyway
+
+    def _validate(self, events: List[Dict[str, Any]]) -> bool:
+        balance = self.coins
+        for event in events:
+            kind = event.get("type")
+            if kind in (COIN_EARNED, COIN_SPENT):
+                amount = event.get("amount")
+                if not isinstance(amount, int) or amount <= 0:
+                    return False
+                balance += amount if kind == COIN_EARNED else -amount
+                if balance < 0:
+                    return False
+            elif kind in (ITEM_GRANTED, ITEM_REVOKED):
+                if not event.get("item"):
+                    return False
+            else:
+                return False
+        return True
+
+    def _apply(self, events: List[Dict[str, Any]]):
+        for event in events:
+            kind = event["type"]
+            if kind == COIN_EARNED:
+                self.coins += event["amount"]
+            elif kind == COIN_SPENT:
+                self.coins -= event["amount"]
+            elif kind == ITEM_GRANTED:
+                self.owned.add(event["item"])
+            elif kind == ITEM_REVOKED:
+                self.owned.discard(event["item"])
+
+    def sync(self):
+        """fsync pending appends and compact if the journal grew long"""
+        with self._lock:
+            if self._file is not None and self._needs_fsync:
+                os.fsync(self._file.fileno())
+                self._needs_fsync = False
+            if self._records_since_snapshot >= COMPACT_AFTER_RECORDS:
+                self.compact()
+
+    def compact(self):
+        """Fold all state into an atomically renamed snapshot and truncate the journal"""
+        with self._lock:
+            snapshot = {"seq": self.seq, "coins": self.coins, "owned": sorted(self.owned)}
+            payload = json.dumps(snapshot, ensure_ascii=False, indent=2).encode("utf-8")
+            write_file_atomic(self.snapshot_path, payload)
+            self.bytes_written += len(payload)
+            # A crash before the truncate is harmless: replay skips seq <= snapshot seq
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.journal_path, "wb")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._needs_fsync = False
+            self._records_since_snapshot = 0
+
+    def close(self):
+        with self._lock:
+            self.sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # --- Event helpers ---
+
+    @staticmethod
+    def coin_earned(amount: int) -> Dict[str, Any]:
+        return {"type": COIN_EARNED, "amount": int(amount)}
+
+    @staticmethod
+    def coin_spent(amount: int) -> Dict[str, Any]:
+        return {"type": COIN_SPENT, "amount": int(amount)}
+
+    @staticmethod
+    def item_granted(name: str, rarity: Optional[str] = None) -> Dict[str, Any]:
+        event = {"type": ITEM_GRANTED, "item": name}
+        if rarity:
+            event["rarity"] = rarity
+        return event
+
+    @staticmethod
+    def item_revoked(name: str, rarity: Optional[str] = None) -> Dict[str, Any]:
+        event = {"type": ITEM_REVOKED, "item": name}
+        if rarity:
+            event["rarity"] = rarity
+        return event
@@ -0,0 +1,110 @@
+# NongGameTyping/src/font_registry.py
+import os
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+import pygame
+from .data_manager import get_data_manager
+
+# System font chains used for icons, with the bundled file to try when none is installed
+EMOJI_FONTS = ("Segoe UI Emoji",)
+SYMBOL_FONTS = ("Segoe UI Symbol",)
+EMOJI_FALLBACK_FILE = "NotoColorEmoji-Regular.ttf"
+
+# Item icon glyphs are rendered once at this size and scaled to the animated size
+ICON_FONT_SIZE = 60
+
+class FontRegistry:
+    """Every Font object in the game, keyed by (face, size)
+
+    A face is a font file path, or None for pygame's default font. Fonts
+    are created on first request and shared afterwards, so asking for the
+    same face and size anywhere returns the same object (which also keeps
+    text_cache keys stable). System font names are resolved to a file once
+    per name list; a face that fails to load at some size is remembered as
+    the default font at that size.
+    """
+
+    def __init__(self):
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._resolved: Dict[Tuple[Tuple[str, ...], Optional[str]], Optional[str]] = {}
+        self.fallbacks = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, face: Optional[str], size: int) -> pygame.font.Font:
+        """The shared Font for face at size; raises like pygame.font.Font if the file is missing"""
+        key = (face, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        self.misses += 1
+        font = pygame.font.Font(face, size)
+        self._fonts[key] = font
+        return font
+
+    def system(self, names: Sequence[str], size: int, fallback_file: Optional[str] = None) -> pygame.font.Font:
+        """First installed system font of names, else the bundled fallback_file if present, else the default"""
+        key = (tuple(names), fallback_file)
+        if key not in self._resolved:
+            self._resolved[key] = self._resolve(*key)
+        face = self._resolved[key]
+        if face is None:
+            return self.get(None, size)
+        try:
+            return self.get(face, size)
+        except (OSError, pygame.error):
+            # Bitmap fonts (colour emoji) only load at some sizes
+            self.fallbacks += 1
+            font = self.get(None, size)
+            self._fonts[(face, size)] = font
+            return font
+
+    def emoji(self, size: int) -> pygame.font.Font:
+        return self.system(EMOJI_FONTS, size, EMOJI_FALLBACK_FILE)
+
+    def symbol(self, size: int) -> pygame.font.Font:
+        return self.system(SYMBOL_FONTS, size, EMOJI_FALLBACK_FILE)
+
+    @staticmethod
+    def _resolve(names: Tuple[str, ...], fallback_file: Optional[str]) -> Optional[str]:
+        for name in names:
+            try:
+                path = pygame.font.match_font(name)
+            except Exception:
+                path = None
+            if path:
+                return path
+        if fallback_file:
+            # The user's assets folder first, then the one next to the game
+            for path in (get_data_manager().get_assets_path("fonts", fallback_file),
+                         os.path.join("assets", "fonts", fallback_file)):
+                if os.path.exists(path):
+                    return path
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "fonts": len(set(map(id, self._fonts.values()))),
+            "faces": len({face for face, _ in self._fonts}),
+            "hits": self.hits,
+            "misses": self.misses,
+            "fallbacks": self.fallbacks,
+        }
+
+    def clear(self):
+        self._fonts.clear()
+        self._resolved.clear()
+
+# Shared instance (see get_font_registry)
+_shared_font_registry: Optional[FontRegistry] = None
+_shared_lock = threading.Lock()
+
+def get_font_registry() -> FontRegistry:
+    """Return the process-wide FontRegistry, creating it on first use"""
+    global _shared_font_registry
+    if _shared_font_registry is None:
+        with _shared_lock:
+            if _shared_font_registry is None:
+                _shared_font_registry = FontRegistry()
+    return _shared_font_registry
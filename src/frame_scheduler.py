@@ -0,0 +1,143 @@
+# NongGameTyping/src/frame_scheduler.py
+import time
+from typing import Any, Dict, List, Optional
+import pygame
+
+# Modes, from busiest to quietest
+ACTIVE = "active"          # something is animating: render at the fps setting
+IDLE = "idle"              # nothing moving on screen: low refresh, wake on input
+BACKGROUND = "background"  # window unfocused
+HIDDEN = "hidden"          # window minimised/hidden: no rendering at all
+MODES = (ACTIVE, IDLE, BACKGROUND, HIDDEN)
+
+DEFAULT_IDLE_FPS = 20
+DEFAULT_BACKGROUND_FPS = 10
+
+# While hidden, wake at least this often so timers (autosave) still fire
+HIDDEN_WAKE_INTERVAL = 1.0
+
+_HIDE_EVENTS = {pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN}
+_SHOW_EVENTS = {pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED, pygame.WINDOWEXPOSED}
+
+class FrameScheduler:
+    """Paces the game loop by what is on screen
+
+    ACTIVE frames tick the clock at the configured fps. In the quieter modes
+    the loop blocks in pygame.event.wait() instead of sleeping, so input
+    wakes it immediately; the wait is also cut short by the next timer
+    deadline. The event that ends a wait is held rather than re-posted, and
+    events() returns it ahead of the rest of the queue so order is kept. While the window is hidden nothing is rendered. Process CPU
+    time is accounted per mode so power use can be compared.
+    """
+
+    def __init__(self, active_fps: int = 60, idle_fps: int = DEFAULT_IDLE_FPS,
+                 background_fps: int = DEFAULT_BACKGROUND_FPS, enabled: bool = True):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.background_fps = background_fps
+        self.enabled = enabled
+        self.clock = pygame.time.Clock()
+        self.focused = True
+        self.hidden = False
+        self.mode = ACTIVE
+        self._wall: Dict[str, float] = dict.fromkeys(MODES, 0.0)
+        self._cpu: Dict[str, float] = dict.fromkeys(MODES, 0.0)
+        self._frames: Dict[str, int] = dict.fromkeys(MODES, 0)
+        self._mark_wall = time.perf_counter()
+        self._mark_cpu = time.process_time()
+        self._last_frame = self._mark_wall
+        self._woken: Optional[pygame.event.Event] = None
+
+    def observe(self, event: pygame.event.Event) -> bool:
+        """Track focus and visibility from window events; True when the window needs a full repaint"""
+        if event.type in _HIDE_EVENTS:
+            self.hidden = True
+        elif event.type in _SHOW_EVENTS:
+            self.hidden = False
+            return True
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        return False
+
+    def next_mode(self, animating: bool) -> str:
+        if not self.enabled:
+            return ACTIVE
+        if self.hidden:
+            return HIDDEN
+        if not self.focused:
+            return BACKGROUND
+        return ACTIVE if animating else IDLE
+
+    @property
+    def rendering(self) -> bool:
+        """False while hidden: simulate but skip drawing"""
+        return self.mode != HIDDEN
+
+    def wait(self, animating: bool, deadline: Optional[float] = None) -> float:
+        """Wait until the next frame is due; returns the real seconds since the last one
+
+        deadline is the number of seconds until some timer must run; quiet
+        modes never sleep past it.
+        """
+        self._account()
+        self.mode = self.next_mode(animating)
+        self._frames[self.mode] += 1
+
+        if self.mode == ACTIVE:
+            self.clock.tick(self.active_fps)
+        else:
+            if self.mode == HIDDEN:
+                interval = HIDDEN_WAKE_INTERVAL
+            else:
+                interval = 1.0 / max(1, self.idle_fps if self.mode == IDLE else self.background_fps)
+            timeout = interval - (time.perf_counter() - self._last_frame)
+            if deadline is not None:
+                timeout = min(timeout, deadline)
+            if timeout > 0 and self._woken is None:
+                event = pygame.event.wait(max(1, int(timeout * 1000)))
+                if event.type != pygame.NOEVENT:
+                    # wait() took the head of the queue; events() hands it out first
+                    self._woken = event
+            self.clock.tick()
+
+        now = time.perf_counter()
+        frame_dt = now - self._last_frame
+        self._last_frame = now
+        return frame_dt
+
+    def events(self) -> List[pygame.event.Event]:
+        """This frame's events in arrival order (use instead of pygame.event.get())"""
+        events = pygame.event.get()
+        if self._woken is not None:
+            events.insert(0, self._woken)
+            self._woken = None
+        return events
+
+    def _account(self):
+        wall, cpu = time.perf_counter(), time.process_time()
+        self._wall[self.mode] += wall - self._mark_wall
+        self._cpu[self.mode] += cpu - self._mark_cpu
+        self._mark_wall, self._mark_cpu = wall, cpu
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-mode wall time, CPU time, CPU share and frames rendered"""
+        self._account()
+        return {
+            mode: {
+                "seconds": self._wall[mode],
+                "cpu_seconds": self._cpu[mode],
+                "cpu_percent": 100.0 * self._cpu[mode] / self._wall[mode] if self._wall[mode] else 0.0,
+                "frames": self._frames[mode],
+            }
+            for mode in MODES
+        }
+
+    def report(self) -> str:
+        lines = ["Frame scheduler CPU usage:"]
+        for mode, row in self.stats().items():
+            if row["seconds"] > 0:
+                lines.append(f"  {mode:<10} {row['cpu_percent']:5.1f}% CPU over {row['seconds']:.1f}s "
+                             f"({row['frames']} frames)")
+        return "\n".join(lines)
@@ -0,0 +1,94 @@
+# NongGameTyping/src/gacha_sampler.py
+import random
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from .alias_table import AliasTable, numpy_generator
+
+# Coins per pull (1x) and per 10-pull
+GACHA_1_COST = 100
+GACHA_10_COST = 900
+
+# base_rates are percentages of this total; unassigned mass falls back to R
+RATE_TOTAL = 100.0
+FALLBACK_RARITY = "R"
+
+def effective_rarity_rates(base_rates: Dict[str, float]) -> Dict[str, float]:
+    """Turn base_rates into the odds the original cumulative roll produced
+
+    A roll in [0, 100) walks base_rates in order, so rates past 100 are cut off
+    and anything below 100 is left over for R.
+    """
+    rates = {}
+    cumulative = 0.0
+    for rarity, rate in base_rates.items():
+        low = min(cumulative, RATE_TOTAL)
+        cumulative += max(float(rate), 0.0)
+        rates[rarity] = min(cumulative, RATE_TOTAL) - low
+    leftover = RATE_TOTAL - min(cumulative, RATE_TOTAL)
+    if leftover > 0:
+        rates[FALLBACK_RARITY] = rates.get(FALLBACK_RARITY, 0.0) + leftover
+    return rates
+
+class GachaSampler:
+    """Rarity and item draws from gacha_data via precomputed alias tables
+
+    Build once per gacha_data; each pull is then two O(1) table lookups,
+    done for a whole batch at once with NumPy in draw(). Pass a seeded
+    random.Random for reproducible pulls.
+    """
+
+    def __init__(self, gacha_data: Dict[str, Any], rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+        self.items: Dict[str, List[Dict[str, Any]]] = {}
+        self.item_tables: Dict[str, AliasTable] = {}
+        for rarity, items in gacha_data["items"].items():
+            weights = [max(float(item.get("rate", 0.0)), 0.0) for item in items]
+            # A rarity with nothing drawable cannot be rolled
+            if sum(weights) > 0:
+                self.items[rarity] = items
+                self.item_tables[rarity] = AliasTable(weights)
+
+        rates = effective_rarity_rates(gacha_data.get("base_rates", {}))
+        self.rarities = [rarity for rarity, rate in rates.items() if rate > 0 and rarity in self.items]
+        if not self.rarities:
+            raise ValueError("gacha_data has no drawable rarity")
+        self.rarity_table = AliasTable([rates[rarity] for rarity in self.rarities])
+
+    def draw_one(self) -> Tuple[str, int]:
+        """One pull as (rarity, index into gacha_data['items'][rarity])"""
+        rarity = self.rarities[self.rarity_table.sample(self.rng)]
+        return rarity, self.item_tables[rarity].sample(self.rng)
+
+    def draw_arrays(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """count pulls as (index into self.rarities, item index) int64 arrays"""
+        generator = numpy_generator(self.rng)
+        rarity = self.rarity_table.sample_array(count, generator)
+        item = np.empty(count, dtype=np.int64)
+        for r, name in enumerate(self.rarities):
+            mask = rarity == r
+            hits = int(np.count_nonzero(mask))
+            if hits:
+                item[mask] = self.item_tables[name].sample_array(hits, generator)
+        return rarity, item
+
+    def draw(self, count: int) -> List[Tuple[str, int]]:
+        """count pulls as (rarity, item index) pairs"""
+        rarity, item = self.draw_arrays(count)
+        rarities = self.rarities
+        return [(rarities[r], i) for r, i in zip(rarity.tolist(), item.tolist())]
+
+    def draw_items(self, count: int) -> List[Dict[str, Any]]:
+        """count pulls as the raw item dicts from gacha_data"""
+        return [self.items[rarity][index] for rarity, index in self.draw(count)]
+
+    def rarity_probabilities(self) -> Dict[str, float]:
+        return dict(zip(self.rarities, self.rarity_table.probabilities()))
+
+    def item_probabilities(self) -> Dict[Tuple[str, str], float]:
+        """Exact chance of each (rarity, item name) per pull"""
+        result = {}
+        for rarity, p_rarity in self.rarity_probabilities().items():
+            for item, p_item in zip(self.items[rarity], self.item_tables[rarity].probabilities()):
+                key = (rarity, item["name"])
+                result[key] = result.get(key, 0.0) + p_rarity * p_item
+        return result
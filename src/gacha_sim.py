@@ -0,0 +1,191 @@
+# NongGameTyping/src/gacha_sim.py
+"""Headless Monte Carlo check of gacha drop rates and collection cost
+
+    python -m src.gacha_sim --pulls 20000000 --runs 20000
+
+Reads the same gacha_data.json as DataManager (or --data PATH), samples with
+the GachaSampler alias tables vectorised in NumPy across a process pool, and
+reports observed vs configured rates plus the pulls/coins needed to own every
+item.
+"""
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .alias_table import alias_sample
+from .gacha_sampler import GachaSampler, GACHA_1_COST, GACHA_10_COST
+
+# z for a two-sided 95% interval
+Z_95 = 1.959963984540054
+
+# Pulls drawn per block while simulating collection runs
+COMPLETION_BLOCK = 256
+
+def _table_arrays(sampler: GachaSampler) -> Dict[str, Any]:
+    """Flatten the sampler's alias tables into arrays that pickle cheaply to workers"""
+    offsets, item_prob, item_alias, item_size = [], [], [], []
+    offset = 0
+    for rarity in sampler.rarities:
+        table = sampler.item_tables[rarity]
+        offsets.append(offset)
+        item_prob.append(table.prob)
+        item_alias.append(table.alias)
+        item_size.append(table.size)
+        offset += table.size
+    return {
+        "rarity_prob": sampler.rarity_table.prob,
+        "rarity_alias": sampler.rarity_table.alias,
+        "offsets": offsets,
+        "item_prob": item_prob,
+        "item_alias": item_alias,
+        "item_size": item_size,
+        "total_items": offset,
+    }
+
+def _sample_flat(rng: np.random.Generator, tables: Dict[str, Any], count: int) -> np.ndarray:
+    """count two-stage pulls (rarity, then item) as flat item ids"""
+    rarity = alias_sample(rng, np.asarray(tables["rarity_prob"]), np.asarray(tables["rarity_alias"]), count)
+    flat = np.empty(count, dtype=np.int64)
+    for r, offset in enumerate(tables["offsets"]):
+        mask = rarity == r
+        hits = int(mask.sum())
+        if hits:
+            flat[mask] = offset + alias_sample(rng, np.asarray(tables["item_prob"][r]),
+                                                np.asarray(tables["item_alias"][r]), hits)
+    return flat
+
+def _count_pulls(tables: Dict[str, Any], count: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """Worker: histogram of count pulls over flat item ids"""
+    return np.bincount(_sample_flat(np.random.default_rng(seed), tables, count), minlength=tables["total_items"])
+
+def _pulls_to_complete(tables: Dict[str, Any], unique_ids: List[int], runs: int,
+                       seed: np.random.SeedSequence) -> np.ndarray:
+    """Worker: pulls each of `runs` players needed before owning every distinct item"""
+    rng = np.random.default_rng(seed)
+    unique_ids = np.asarray(unique_ids)
+    distinct = int(unique_ids.max()) + 1
+    first_seen = np.full((runs, distinct), -1, dtype=np.int64)
+    active = np.arange(runs)
+    done = np.zeros(runs, dtype=np.int64)
+    pulled = 0
+    while active.size:
+        block = unique_ids[_sample_flat(rng, tables, active.size * COMPLETION_BLOCK)].reshape(active.size, COMPLETION_BLOCK)
+        seen = first_seen[active]
+        for item in range(distinct):
+            hits = block == item
+            newly = (seen[:, item] < 0) & hits.any(axis=1)
+            seen[newly, item] = pulled + hits[newly].argmax(axis=1)
+        first_seen[active] = seen
+        complete = (seen >= 0).all(axis=1)
+        done[active[complete]] = seen[complete].max(axis=1) + 1
+        active = active[~complete]
+        pulled += COMPLETION_BLOCK
+    return done
+
+def wilson_interval(hits: int, trials: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion"""
+    if trials == 0:
+        return 0.0, 1.0
+    p = hits / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+def _split(total: int, parts: int) -> List[int]:
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts) if base or i < extra]
+
+def simulate(gacha_data: Dict[str, Any], pulls: int, runs: int, workers: int, seed: int,
+             chunk: int) -> Dict[str, Any]:
+    sampler = GachaSampler(gacha_data)
+    tables = _table_arrays(sampler)
+    labels = [(rarity, item["name"]) for rarity in sampler.rarities for item in sampler.items[rarity]]
+    # Ownership is by name, so duplicate names count as one collectible
+    names = sorted({name for _, name in labels})
+    unique_ids = [names.index(name) for _, name in labels]
+
+    pull_chunks = _split(pulls, max(1, math.ceil(pulls / chunk)))
+    run_chunks = _split(runs, max(1, workers * 4)) if runs else []
+    seeds = np.random.SeedSequence(seed).spawn(len(pull_chunks) + len(run_chunks))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        count_jobs = [pool.submit(_count_pulls, tables, n, s) for n, s in zip(pull_chunks, seeds)]
+        run_jobs = [pool.submit(_pulls_to_complete, tables, unique_ids, n, s)
+                    for n, s in zip(run_chunks, seeds[len(pull_chunks):])]
+        counts = sum((job.result() for job in count_jobs), np.zeros(tables["total_items"], dtype=np.int64))
+        completion = np.concatenate([job.result() for job in run_jobs]) if run_jobs else np.zeros(0, dtype=np.int64)
+    elapsed = time.perf_counter() - start
+
+    # Merge duplicate (rarity, name) slots to match GachaSampler.item_probabilities()
+    observed: Dict[Tuple[str, str], int] = {}
+    for label, hits in zip(labels, counts.tolist()):
+        observed[label] = observed.get(label, 0) + hits
+    return {
+        "expected": sampler.item_probabilities(),
+        "observed": observed,
+        "pulls": pulls,
+        "completion": completion,
+        "elapsed": elapsed,
+    }
+
+def _print_report(result: Dict[str, Any]):
+    pulls = result["pulls"]
+    print(f"Simulated {pulls:,} pulls in {result['elapsed']:.2f}s "
+          f"({pulls / max(result['elapsed'], 1e-9) / 1e6:.1f}M pulls/s)\n")
+
+    print(f"{'rarity':<6} {'item':<20} {'expected':>9} {'observed':>9} {'95% CI':>21}  ok")
+    outside = 0
+    for (rarity, name), expected in result["expected"].items():
+        hits = result["observed"].get((rarity, name), 0)
+        low, high = wilson_interval(hits, pulls)
+        ok = low <= expected <= high
+        outside += not ok
+        print(f"{rarity:<6} {name:<20} {expected:>9.4%} {hits / pulls:>9.4%} "
+              f"[{low:>8.4%}, {high:>8.4%}]  {'yes' if ok else 'NO'}")
+    print(f"\n{outside} of {len(result['expected'])} items outside their 95% interval "
+          f"(about {len(result['expected']) * 0.05:.1f} expected by chance)")
+
+    completion = result["completion"]
+    if completion.size:
+        print(f"\nPulls to own every item ({completion.size:,} simulated players):")
+        print(f"{'':<8} {'pulls':>8} {'1x coins':>12} {'10x coins':>12}")
+        rows = [("mean", float(completion.mean()))]
+        rows += [(f"p{q}", float(np.percentile(completion, q))) for q in (10, 50, 90, 99)]
+        rows.append(("max", float(completion.max())))
+        for label, value in rows:
+            cost_1 = value * GACHA_1_COST
+            cost_10 = math.ceil(value / 10) * GACHA_10_COST
+            print(f"{label:<8} {value:>8.0f} {cost_1:>12,.0f} {cost_10:>12,.0f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo check of gacha drop rates and collection cost")
+    parser.add_argument("--data", help="gacha_data.json to read (default: the one DataManager uses)")
+    parser.add_argument("--pulls", type=int, default=10_000_000, help="pulls to sample for drop rates")
+    parser.add_argument("--runs", type=int, default=10_000, help="players to simulate until collection is complete")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=2_000_000, help="pulls per worker task")
+    args = parser.parse_args(argv)
+
+    if args.data:
+        with open(args.data, "r", encoding="utf-8") as f:
+            gacha_data = json.load(f)
+    else:
+        from .data_manager import get_data_manager
+        data_manager = get_data_manager()
+        print(f"Reading {data_manager.gacha_data_path}")
+        gacha_data = data_manager.get_gacha_data()
+
+    result = simulate(gacha_data, args.pulls, args.runs, args.workers, args.seed, args.chunk)
+    _print_report(result)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,16 @@
 import pygame
 import math
 import random
-import os
+import numpy as np
 from typing import List, Tuple, Dict, Optional, Callable
-from .data_manager import DataManager, Rarity
+from .data_manager import get_data_manager, Rarity
+from .gacha_sampler import GachaSampler, GACHA_1_COST, GACHA_10_COST
+from .text_cache import get_text_cache
+from .surface_cache import get_surface_cache
+from .font_registry import get_font_registry, ICON_FONT_SIZE
+from .image_cache import get_image_cache, ICON_IMAGE_SIZE
+from .particle_engine import ParticleEngine
+from .animation_clock import approach, ticks
 
 # --- Constants ---
 BLACK = (0, 0, 0)
@@ -16,14 +23,16 @@ BLUE = (70, 130, 180)
 BLUE_LIGHT = (120, 180, 255)
 SILVER = (192, 192, 192)
 
+# ระยะเวลาและความเร็วแอนิเมชันนับเป็น tick ที่ 60 Hz (update แปลง dt เป็น tick ให้)
 SPIN_DURATION = 90 * 2  # 3s at 60 FPS
 REVEAL_DURATION = 30 * 2  # 1s
 RESULT_SHOW_DURATION = 60 * 2  # 2s
 PREVIEW_CHANGE_RATE = 8
+FADE_STEP = 24  # alpha ต่อ tick
 
-# --- Gacha Costs ---
-GACHA_1_COST = 100
-GACHA_10_COST = 900
+# อนุภาคใช้หน่วยวินาที (ค่าเดิมตั้งไว้ต่อเฟรมที่ 60 FPS: แรงโน้มถ่วง 0.008 px/เฟรม², แรงต้านแกน x 0.999/เฟรม)
+PARTICLE_GRAVITY = 0.008 * 60 * 60
+PARTICLE_DRAG = (0.999, 1.0)
 
 # --- Easing functions ---
 def ease_in_out_cubic(t):
@@ -49,57 +58,6 @@ def ease_out_elastic(t):
     return 0 if t == 0 else 1 if t == 1 else pow(2, -10 * t) * math.sin((t * 10 - 0.75) * c4) + 1
 
 # --- Effect Classes ---
-class Particle:
-    def __init__(self, x, y, color, velocity, life, size=3):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx, self.vy = velocity
-        self.life = life
-        self.max_life = life
-        self.size = size
-        self.gravity = 0.008
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.vx *= 0.999
-        self.life -= 1
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            size = max(1, int(self.size * (self.life / self.max_life)))
-            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (*self.color, alpha), (size, size), size)
-            screen.blit(particle_surf, (self.x - size, self.y - size))
-
-class StarParticle(Particle):
-    def __init__(self, x, y):
-        super().__init__(x, y, GOLD, (0, random.uniform(-2, -0.5)), 72, 6)
-        self.angle = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(1, 3)
-        self.scale_pulse = random.uniform(0.8, 1.2)
-    def update(self):
-        self.y += self.vy
-        self.angle += self.rotation_speed
-        self.life -= 1
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            pulse = 1 + 0.3 * math.sin(self.angle * 0.1)
-            size = max(1, int(self.size * (self.life / self.max_life) * self.scale_pulse * pulse))
-            if size < 1: return
-            star_surf = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-            points = []
-            for i in range(10):
-                angle_rad = math.radians(self.angle + i * 36)
-                radius = size if i % 2 == 0 else size // 2
-                px = size * 2 + radius * math.cos(angle_rad)
-                py = size * 2 + radius * math.sin(angle_rad)
-                points.append((px, py))
-            pygame.draw.polygon(star_surf, (*self.color, alpha), points)
-            screen.blit(star_surf, (self.x - size * 2, self.y - size * 2))
-
 class RadialBurst:
     def __init__(self, x, y, color):
         self.x = x
@@ -109,10 +67,10 @@ class RadialBurst:
         self.max_radius = 250
         self.life = 72
         self.max_life = 72
-    def update(self):
+    def update(self, tick_count=1):
         progress = 1 - (self.life / self.max_life)
         self.radius = self.max_radius * ease_out_elastic(progress)
-        self.life -= 1
+        self.life -= tick_count
     def draw(self, screen):
         if self.life > 0:
             alpha = int(128 * (self.life / self.max_life))
@@ -132,36 +90,46 @@ class RotatingBorder:
         self.thickness = thickness
         self.color = color
         self.angle = 0
+        self.previous_angle = 0
+        self.previous_size = size
         self.scale = 1.0
         self.target_scale = 1.0
         self.target_speed = rotation_speed
-    def update(self):
-        self.angle = (self.angle + self.rotation_speed) % 360
-        self.scale += (self.target_scale - self.scale) * 0.1
-        self.rotation_speed += (self.target_speed - self.rotation_speed) * 0.1
+    def update(self, tick_count=1):
+        self.previous_angle, self.previous_size = self.angle, self.size
+        self.angle = (self.angle + self.rotation_speed * tick_count) % 360
+        self.scale = approach(self.scale, self.target_scale, 0.1, tick_count)
+        self.rotation_speed = approach(self.rotation_speed, self.target_speed, 0.1, tick_count)
         self.size = int(self.base_size * self.scale)
     def set_speed(self, speed_multiplier):
         self.target_speed = self.base_speed * speed_multiplier
     def set_scale(self, scale):
         self.target_scale = scale
-    def draw(self, screen):
-        half_size = self.size // 2
+    def draw(self, screen, lerp=None):
+        """lerp(previous, current): วาดระหว่าง step ล่าสุดสอง step (None = วาดตามสถานะล่าสุด)"""
+        angle, size = self.angle, self.size
+        if lerp is not None:
+            # หมุนข้าม 0/360 ให้ interpolate ทางที่สั้นกว่า
+            turn = (self.angle - self.previous_angle + 180) % 360 - 180
+            angle = lerp(self.previous_angle, self.previous_angle + turn)
+            size = int(lerp(self.previous_size, self.size))
+        half_size = size // 2
         points = [ (0, -half_size), (half_size, 0), (0, half_size), (-half_size, 0) ]
-        cos_a = math.cos(math.radians(self.angle))
-        sin_a = math.sin(math.radians(self.angle))
+        cos_a = math.cos(math.radians(angle))
+        sin_a = math.sin(math.radians(angle))
         rotated_points = [
             (x * cos_a - y * sin_a + self.center_x,
              x * sin_a + y * cos_a + self.center_y)
             for x, y in points
         ]
-        glow_surf = pygame.Surface((self.size + 20, self.size + 20), pygame.SRCALPHA)
+        glow_surf = pygame.Surface((size + 20, size + 20), pygame.SRCALPHA)
         glow_points = [
-            (x * cos_a - y * sin_a + (self.size + 20) // 2,
-             x * sin_a + y * cos_a + (self.size + 20) // 2)
+            (x * cos_a - y * sin_a + (size + 20) // 2,
+             x * sin_a + y * cos_a + (size + 20) // 2)
             for x, y in [(p[0] * 1.1, p[1] * 1.1) for p in points]
         ]
         pygame.draw.polygon(glow_surf, (*self.color, 50), glow_points, self.thickness + 2)
-        screen.blit(glow_surf, (self.center_x - (self.size + 20) // 2, self.center_y - (self.size + 20) // 2))
+        screen.blit(glow_surf, (self.center_x - (size + 20) // 2, self.center_y - (size + 20) // 2))
         pygame.draw.polygon(screen, self.color, rotated_points, self.thickness)
 
 class GachaItem:
@@ -173,6 +141,7 @@ class GachaItem:
         self.rarity = rarity
         self.color = self.RARITY_COLORS[rarity]
         self.image = None
+        self.image_path = None
         self.is_emoji = self._is_emoji(self.icon)
         if not self.is_emoji:
             self._load_image()
@@ -182,70 +151,29 @@ class GachaItem:
         return not text.lower().endswith('.png')
     
     def _load_image(self):
-        """Load the item image from assets"""
-        try:
-            # Get the image path using DataManager
-            data_manager = DataManager()
-            image_path = data_manager.get_assets_path("images", f"Item/{self.icon}")
-            
-            if os.path.exists(image_path):
-                self.image = pygame.image.load(image_path).convert_alpha()
-            else:
-                print(f"Warning: Image not found for {self.name}: {image_path}")
-                self.image = None
-        except Exception as e:
-            print(f"Error loading image for {self.name}: {e}")
+        """โหลดภาพไอเทมผ่าน image cache (ใช้ร่วมกับหน้าคอลเลกชัน)"""
+        self.image_path = get_data_manager().get_assets_path("images", f"Item/{self.icon}")
+        self.image = get_image_cache().acquire(self.image_path)
+    
+    def release(self):
+        """คืนภาพให้ image cache (ปิดหน้ากาชา)"""
+        if self.image is not None:
+            get_image_cache().release(self.image_path)
             self.image = None
     
     def get_icon_surface(self, size=None):
-        if self.is_emoji:
-            font = None
-            emoji_font_size = max(10, (size or 60) // 2)
-            # ลองใช้ฟอนต์อิโมจิที่รองรับบน Windows ก่อน
-            try:
-                font = pygame.font.SysFont("Segoe UI Emoji", emoji_font_size)
-            except Exception:
-                font = None
-            if font is None or font.get_height() == 0:
-                try:
-                    font = pygame.font.Font("assets/fonts/NotoColorEmoji-Regular.ttf", emoji_font_size)
-                except Exception:
-                    font = pygame.font.Font(None, emoji_font_size)
-            return font.render(self.icon, True, WHITE)
         if self.image is None:
-            font = pygame.font.Font(None, size or 60)
-            return font.render(self.icon, True, WHITE)
+            # อิโมจิ/ข้อความเรนเดอร์ครั้งเดียวที่ ICON_FONT_SIZE แล้วย่อขยายตามขนาด (ปัดเป็นช่วง) ไม่สร้างฟอนต์ใหม่ทุกขนาด
+            # ฟอนต์อิโมจิ (Segoe UI Emoji บน Windows) หาในระบบครั้งเดียวผ่าน font registry
+            registry = get_font_registry()
+            font = registry.emoji(ICON_FONT_SIZE // 2) if self.is_emoji else registry.get(None, ICON_FONT_SIZE)
+            glyph = get_text_cache().render(font, self.icon, WHITE)
+            return get_surface_cache().scaled_icon((font, self.icon), glyph, ICON_FONT_SIZE, size)
         if size:
-            return self._scale_image_to_fit(self.image, size)
+            # ย่อภาพครั้งเดียวที่ ICON_IMAGE_SIZE ขนาดที่เคลื่อนไหวย่อจากภาพนั้น (ไม่เพิ่ม entry ใน image cache ทุกขนาด)
+            icon = get_image_cache().load(self.image_path, ICON_IMAGE_SIZE, fit=True)
+            return get_surface_cache().scaled_icon(self.image_path, icon, ICON_IMAGE_SIZE, size)
         return self.image
-    
-    def _scale_image_to_fit(self, image, target_size):
-        """Scale image to fit within target_size while maintaining aspect ratio"""
-        img_width, img_height = image.get_size()
-        
-        # Calculate scale factor to fit within target_size
-        scale_x = target_size / img_width
-        scale_y = target_size / img_height
-        scale = min(scale_x, scale_y)  # Use smaller scale to fit within bounds
-        
-        # Calculate new dimensions
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
-        
-        # Scale the image
-        scaled_image = pygame.transform.scale(image, (new_width, new_height))
-        
-        # Create a surface with the target size and center the scaled image
-        result_surface = pygame.Surface((target_size, target_size), pygame.SRCALPHA)
-        
-        # Calculate centering offset
-        offset_x = (target_size - new_width) // 2
-        offset_y = (target_size - new_height) // 2
-        
-        # Blit the scaled image centered on the result surface
-        result_surface.blit(scaled_image, (offset_x, offset_y))
-        
-        return result_surface
 
 class FloatingText:
     def __init__(self, text, x, y, color, font):
@@ -258,8 +186,8 @@ class FloatingText:
         self.target_scale = 1.0
         self.text_surf = font.render(text, True, color)
         self.original_surf = self.text_surf.copy()
-    def update(self):
-        self.scale += (self.target_scale - self.scale) * 0.1
+    def update(self, tick_count=1):
+        self.scale = approach(self.scale, self.target_scale, 0.1, tick_count)
         progress = (self.max_life - self.life) / self.max_life
         self.y = self.start_y - ease_out_bounce(progress) * 80
         if self.scale != 1.0:
@@ -267,7 +195,7 @@ class FloatingText:
                        int(self.original_surf.get_height() * self.scale))
             if new_size[0] > 0 and new_size[1] > 0:
                 self.text_surf = pygame.transform.scale(self.original_surf, new_size)
-        self.life -= 1
+        self.life -= tick_count
     def draw(self, screen):
         if self.life > 0:
             alpha = int(255 * (self.life / self.max_life))
@@ -276,22 +204,31 @@ class FloatingText:
             screen.blit(self.text_surf, text_rect)
 
 class GachaOverlaySystem:
-    def __init__(self, screen_size, font_dict, money_manager, ui_manager, sound_manager=None, on_close: Optional[Callable]=None):
+    def __init__(self, screen_size, font_dict, money_manager, ui_manager, sound_manager=None, on_close: Optional[Callable]=None,
+                 clock=None):
         self.width, self.height = screen_size
         self.fonts = font_dict
         self.money_manager = money_manager
         self.ui_manager = ui_manager
         self.sound_manager = sound_manager
         self.on_close = on_close
+        # FixedStepClock ของเกม: วาดแอนิเมชันโดย interpolate ระหว่าง step (None = วาดตามสถานะล่าสุด)
+        self.clock = clock
         self.state = "idle"
         self.animation_timer = 0
+        self.draw_timer = 0
         self.effects = []
+        self.particles = ParticleEngine(gravity=PARTICLE_GRAVITY, drag=PARTICLE_DRAG)
+        self.stars = ParticleEngine(shape="star")
         self.screen_flash_alpha = 0
         self.result_scale = 0.5
+        self.draw_result_scale = self.result_scale
+        self._previous = (self.animation_timer, self.result_scale)
         self.target_result_scale = 1.0
         self.center = (self.width // 2, self.height // 2 - 50)
         self.current_results = []
         self.current_item_index = 0
+        self.text_cache = get_text_cache()
         self._load_data()
         self._load_fonts()
         self.borders = [
@@ -318,6 +255,7 @@ class GachaOverlaySystem:
         self.button1_rect = pygame.Rect(self.width // 2 - 200, self.height - 120, 180, 70)
         self.button10_rect = pygame.Rect(self.width // 2 + 20, self.height - 120, 180, 70)
         self.preview_item = None
+        self._preview_slot = None
         # --- Fade-in animation ---
         self.fade_alpha = 0  # 0 = โปร่งใส, 255 = ทึบ
         self.fading_out = False
@@ -326,7 +264,7 @@ class GachaOverlaySystem:
 
     def _load_data(self):
         # ใช้ DataManager แทนการโหลดไฟล์โดยตรง
-        self.data_manager = DataManager()
+        self.data_manager = get_data_manager()
         gacha_data = self.data_manager.get_gacha_data()
         
         self.items_by_rarity = {
@@ -335,12 +273,14 @@ class GachaOverlaySystem:
         }
         self.all_items = [item for sublist in self.items_by_rarity.values() for item in sublist]
         self.rates = gacha_data["base_rates"]
+        # ตารางสุ่ม (alias table) สร้างครั้งเดียว ใช้ซ้ำทุกการสุ่ม
+        self.sampler = GachaSampler(gacha_data)
 
     def _load_fonts(self):
         # ใช้ fonts จาก dict ที่ main ส่งมา (รองรับขนาดใหญ่/กลาง/เล็ก/ไอคอน)
         # ถ้าไม่มีขนาดไหนจะ fallback เป็น default
         def get_font(name, default_size):
-            return self.fonts.get(name) or pygame.font.Font(None, default_size)
+            return self.fonts.get(name) or get_font_registry().get(None, default_size)
         self.fonts.setdefault("large", get_font("large", 56))
         self.fonts.setdefault("medium", get_font("medium", 36))
         self.fonts.setdefault("small", get_font("small", 28))
@@ -351,53 +291,43 @@ class GachaOverlaySystem:
         self.fonts.setdefault("floating_medium", get_font("floating_medium", 42))
         self.fonts.setdefault("floating_small", get_font("floating_small", 36))
 
-    def _get_weighted_item(self, rarity):
-        items = self.items_by_rarity[rarity]
-        weights = [item.rate for item in items]
-        return random.choices(items, weights=weights)[0]
-    def _get_rarity(self):
-        rand = random.uniform(0, 100)
-        cumulative_rate = 0
-        for rarity, rate in self.rates.items():
-            cumulative_rate += rate
-            if rand < cumulative_rate:
-                return rarity
-        return 'R'
     def _draw_items(self, count):
-        return [self._get_weighted_item(self._get_rarity()) for _ in range(count)]
+        return [self.items_by_rarity[rarity][index] for rarity, index in self.sampler.draw(count)]
+    def _grants_for(self, results):
+        return [(item.name, Rarity(item.rarity)) for item in results]
 
-    def _create_particles(self, x, y, color, count, speed_range, life_range, size_range):
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(*speed_range)
-            velocity = (speed * math.cos(angle), speed * math.sin(angle))
-            life = random.randint(*life_range)
-            size = random.randint(*size_range)
-            self.effects.append(Particle(x, y, color, velocity, life, size))
+    def _clear_effects(self):
+        self.effects.clear()
+        self.particles.clear()
+        self.stars.clear()
+
+    def _create_stars(self, x, y, count):
+        rng = self.stars.rng
+        self.stars.emit(
+            x + rng.integers(-150, 151, count), y + rng.integers(-150, 151, count),
+            0, rng.uniform(-120, -30, count), 1.2, 6, GOLD,
+            angle=rng.uniform(0, 360, count), spin=rng.uniform(60, 180, count), pulse=rng.uniform(0.8, 1.2, count)
+        )
+
+    def _create_ring(self, x, y, color, count, radius, speed):
+        angles = np.radians(np.arange(count) * (360 / count))
+        self.particles.emit(x + radius * np.cos(angles), y + radius * np.sin(angles),
+                            np.cos(angles) * speed, np.sin(angles) * speed, 1.2, 4, color)
 
     def _create_rarity_effects(self, item):
         x, y = self.center
         if item.rarity == 'SSR':
-            self._create_particles(x, y, random.choice([GOLD, GOLD_LIGHT]), 40, (2.5, 7.0), (72, 144), (3, 6))
-            for _ in range(12):
-                self.effects.append(StarParticle(
-                    x + random.randint(-150, 150),
-                    y + random.randint(-150, 150)
-                ))
+            self.particles.burst(x, y, 40, (150, 420), (1.2, 2.4), (3, 6), random.choice([GOLD, GOLD_LIGHT]))
+            self._create_stars(x, y, 12)
             self.effects.append(RadialBurst(x, y, GOLD))
             self.effects.append(FloatingText("✨ SSR ✨", x, y - 120, GOLD, self.fonts["floating_large"]))
             self.screen_flash_alpha = 200
         elif item.rarity == 'SR':
-            for i in range(20):
-                angle = math.radians(i * 18)
-                px = x + 120 * math.cos(angle)
-                py = y + 120 * math.sin(angle)
-                velocity = (math.cos(angle) * 2.5, math.sin(angle) * 2.5)
-                self.effects.append(Particle(px, py, PURPLE_LIGHT, velocity, 72, 4))
+            self._create_ring(x, y, PURPLE_LIGHT, 20, 120, 150)
             self.effects.append(FloatingText("⭐ SR ⭐", x, y - 120, PURPLE, self.fonts["floating_medium"]))
             self.screen_flash_alpha = 120
         else:
-            self._create_particles(x, y, BLUE_LIGHT, 24, (1.5, 4.0), (36, 72), (4, 6))
+            self.particles.burst(x, y, 24, (90, 240), (0.6, 1.2), (4, 6), BLUE_LIGHT)
             self.effects.append(FloatingText(f"• {item.name} •", x, y - 120, BLUE, self.fonts["floating_small"]))
 
     def handle_event(self, event):
@@ -405,25 +335,29 @@ class GachaOverlaySystem:
             mouse_pos = pygame.mouse.get_pos()
             if self.state == "idle":
                 if self.button1_rect.collidepoint(mouse_pos):
-                    if self.money_manager.spend_coins(GACHA_1_COST):
+                    results = self._draw_items(1)
+                    # จ่ายเงินและบันทึกไอเทมที่ได้เป็น record เดียวกัน
+                    if self.money_manager.spend_coins(GACHA_1_COST, self._grants_for(results)):
                         if self.sound_manager:
                             self.sound_manager.play_sfx('button')
                             self.sound_manager.play_sfx('gacha_start')
-                        self.current_results = self._draw_items(1)
+                        self.current_results = results
                         self.current_item_index = 0
                         self.state = "spinning"
                         self.animation_timer = 0
-                        self.effects.clear()
+                        self._clear_effects()
                 elif self.button10_rect.collidepoint(mouse_pos):
-                    if self.money_manager.spend_coins(GACHA_10_COST):
+                    results = self._draw_items(10)
+                    # จ่ายเงินและบันทึกไอเทมที่ได้เป็น record เดียวกัน
+                    if self.money_manager.spend_coins(GACHA_10_COST, self._grants_for(results)):
                         if self.sound_manager:
                             self.sound_manager.play_sfx('button')
                             self.sound_manager.play_sfx('gacha_start')
-                        self.current_results = self._draw_items(10)
+                        self.current_results = results
                         self.current_item_index = 0
                         self.state = "spinning"
                         self.animation_timer = 0
-                        self.effects.clear()
+                        self._clear_effects()
                 elif self.close_rect.collidepoint(mouse_pos):
                     if not self.fading_out:
                         if self.sound_manager:
@@ -439,25 +373,35 @@ class GachaOverlaySystem:
                 self.fading_out = True
                 self.state = "fading_out"
 
+    def is_idle(self):
+        """หน้าจอรอกดสุ่ม ไม่มีเอฟเฟกต์ค้าง (เหลือแค่กรอบหมุน) วาดช้าลงได้"""
+        return (self.state == "idle" and not self.fading_out and self.fade_alpha >= 255
+                and not self.effects and not self.particles and not self.stars
+                and self.screen_flash_alpha <= 0)
+
     def update(self, dt):
         prev_state = getattr(self, '_prev_state', None)
         if prev_state != self.state:
             if self.sound_manager and self.state == "revealing":
                 self.sound_manager.play_sfx('gacha_result')
             self._prev_state = self.state
-        self.animation_timer += 1
+        self._previous = (self.animation_timer, self.result_scale)
+        tick_count = ticks(dt)
+        self.animation_timer += tick_count
         # --- Fade-in/out animation ---
         if self.fading_out:
             if self.fade_alpha > 0:
-                self.fade_alpha = max(0, self.fade_alpha - 24)
+                self.fade_alpha = max(0, self.fade_alpha - FADE_STEP * tick_count)
             if self.fade_alpha <= 0 and not self._fade_out_called:
                 self._fade_out_called = True
+                for item in self.all_items:
+                    item.release()
                 if self.on_close:
                     self.on_close()
             return  # skip other updates while fading out
         else:
             if self.fade_alpha < 255:
-                self.fade_alpha = min(255, self.fade_alpha + 24)  # ปรับความเร็ว fade ได้
+                self.fade_alpha = min(255, self.fade_alpha + FADE_STEP * tick_count)  # ปรับความเร็ว fade ได้ที่ FADE_STEP
         # --- State machine ---
         if self.state == "spinning" and self.animation_timer >= SPIN_DURATION:
             self.state = "revealing"
@@ -468,9 +412,7 @@ class GachaOverlaySystem:
             self.state = "showing_result"
             self.animation_timer = 0
             item = self.current_results[self.current_item_index]
-            # บันทึกไอเทมที่ได้ลงใน collection
-            rarity_enum = Rarity(item.rarity)
-            self.data_manager.add_item_to_collection(item.name, rarity_enum)
+            # ไอเทมถูกบันทึกลง collection ไปแล้วตอนจ่ายเงิน (ดู handle_event)
             self._create_rarity_effects(item)
         elif self.state == "showing_result" and self.animation_timer >= RESULT_SHOW_DURATION:
             self.current_item_index += 1
@@ -482,12 +424,14 @@ class GachaOverlaySystem:
                 self.result_scale = 0.5
                 self.target_result_scale = 1.0
         # --- Effects ---
+        self.particles.update(dt)
+        self.stars.update(dt)
         for effect in self.effects:
-            effect.update()
+            effect.update(tick_count)
         self.effects = [effect for effect in self.effects if getattr(effect, 'life', 1) > 0]
         if self.screen_flash_alpha > 0:
-            self.screen_flash_alpha = max(0, self.screen_flash_alpha - 3)
-        self.result_scale += (self.target_result_scale - self.result_scale) * 0.15
+            self.screen_flash_alpha = max(0, self.screen_flash_alpha - 3 * tick_count)
+        self.result_scale = approach(self.result_scale, self.target_result_scale, 0.15, tick_count)
         # --- Border animation ---
         speed_mult, scale = 1.0, 1.0
         if self.state == "spinning":
@@ -503,9 +447,19 @@ class GachaOverlaySystem:
         for border in self.borders:
             border.set_speed(speed_mult)
             border.set_scale(scale)
-            border.update()
+            border.update(tick_count)
+
+    def _lerp(self, previous, current):
+        return current if self.clock is None else self.clock.lerp(previous, current)
 
     def draw(self, surface):
+        # --- ค่าแอนิเมชันระหว่าง step ล่าสุดสอง step (timer ที่ถูกรีเซ็ตตอนเปลี่ยน state ไม่ interpolate) ---
+        previous_timer, previous_scale = self._previous
+        if self.animation_timer >= previous_timer:
+            self.draw_timer = self._lerp(previous_timer, self.animation_timer)
+            self.draw_result_scale = self._lerp(previous_scale, self.result_scale)
+        else:
+            self.draw_timer, self.draw_result_scale = self.animation_timer, self.result_scale
         # --- พื้นหลัง: ใช้ bg เดียวกับเกมหลัก ---
         self.ui_manager.draw_background_image(surface)
         # --- Background ---
@@ -517,22 +471,26 @@ class GachaOverlaySystem:
         #     b = int(20 + color_ratio * 30)
         #     pygame.draw.line(surface, (r, g, b), (0, y), (self.width, y))
         # --- Borders ---
+        lerp = self._lerp if self.clock is not None else None
         for border in self.borders:
-            border.draw(surface)
+            border.draw(surface, lerp)
         # --- Effects ---
+        self.particles.draw(surface)
+        self.stars.draw(surface)
         for effect in self.effects:
             effect.draw(surface)
         if self.screen_flash_alpha > 0:
-            flash_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            flash_surf.fill((255, 255, 255, self.screen_flash_alpha))
-            surface.blit(flash_surf, (0, 0))
+            self.ui_manager.transitions.tint(surface, WHITE, self.screen_flash_alpha)
         # --- Main ---
         if self.state == "spinning":
-            if self.animation_timer % PREVIEW_CHANGE_RATE == 0 or not self.preview_item:
+            # เปลี่ยนไอเทมตัวอย่างทุก PREVIEW_CHANGE_RATE tick
+            preview_slot = int(self.draw_timer // PREVIEW_CHANGE_RATE)
+            if preview_slot != self._preview_slot or not self.preview_item:
+                self._preview_slot = preview_slot
                 self.preview_item = random.choice(self.all_items)
             center_x, center_y = self.center
-            pulse = 1 + 0.2 * math.sin(self.animation_timer * 0.2)
-            alpha = int(120 + 60 * math.sin(self.animation_timer * 0.15))
+            pulse = 1 + 0.2 * math.sin(self.draw_timer * 0.2)
+            alpha = int(120 + 60 * math.sin(self.draw_timer * 0.15))
             item_size = int(120 * pulse)
             preview_surf = pygame.Surface((item_size, item_size), pygame.SRCALPHA)
             glow_rect = pygame.Rect(5, 5, item_size - 10, item_size - 10)
@@ -550,34 +508,34 @@ class GachaOverlaySystem:
                 item = self.current_results[self.current_item_index]
                 center_x, center_y = self.center
                 if item.rarity == 'SSR':
-                    center_y += math.sin(self.animation_timer * 0.08) * 8
-                item_size = int(140 * self.result_scale)
+                    center_y += math.sin(self.draw_timer * 0.08) * 8
+                item_size = int(140 * self.draw_result_scale)
                 item_rect = pygame.Rect(center_x - item_size // 2, center_y - item_size // 2, item_size, item_size)
                 glow_size = item_size + 20
                 glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-                glow_alpha = int(100 * self.result_scale)
+                glow_alpha = int(100 * self.draw_result_scale)
                 pygame.draw.rect(glow_surf, (*item.color, glow_alpha), glow_surf.get_rect(), border_radius=15)
                 surface.blit(glow_surf, (center_x - glow_size // 2, center_y - glow_size // 2))
                 pygame.draw.rect(surface, item.color, item_rect, border_radius=12)
-                pygame.draw.rect(surface, WHITE, item_rect, int(4 * self.result_scale), border_radius=12)
+                pygame.draw.rect(surface, WHITE, item_rect, int(4 * self.draw_result_scale), border_radius=12)
                 
                 # Use image instead of text for icon
-                icon_size = int(100 * self.result_scale)
+                icon_size = int(100 * self.draw_result_scale)
                 icon_surface = item.get_icon_surface(icon_size)
                 icon_rect = icon_surface.get_rect(center=(center_x, center_y - 5))
                 surface.blit(icon_surface, icon_rect)
                 
-                rarity_text = self.fonts["rarity"].render(item.rarity, True, item.color)
-                name_text = self.fonts["small"].render(item.name, True, WHITE)
+                rarity_text = self.text_cache.render(self.fonts["rarity"], item.rarity, item.color)
+                name_text = self.text_cache.render(self.fonts["small"], item.name, WHITE)
                 rarity_rect = rarity_text.get_rect(center=(center_x, center_y + item_size // 2 + 20))
                 name_rect = name_text.get_rect(center=(center_x, center_y + item_size // 2 + 50))
                 surface.blit(rarity_text, rarity_rect)
                 surface.blit(name_text, name_rect)
         # --- UI ---
         title_text = "TREE GACHA"
-        title = self.fonts["large"].render(title_text, True, GOLD)
+        title = self.text_cache.render(self.fonts["large"], title_text, GOLD)
         title_rect = title.get_rect(center=(self.width // 2, 50))
-        glow_title = self.fonts["large"].render(title_text, True, GOLD_LIGHT)
+        glow_title = self.text_cache.render(self.fonts["large"], title_text, GOLD_LIGHT)
         for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
             glow_rect = title_rect.copy()
             glow_rect.x += offset[0]
@@ -592,7 +550,7 @@ class GachaOverlaySystem:
         # --- ปุ่ม X (close) ---
         mouse_pos = pygame.mouse.get_pos()
         is_hover = self.close_rect.collidepoint(mouse_pos)
-        pulse = 1.0 + (0.12 if is_hover else 0.06) * math.sin(self.animation_timer * 0.18)
+        pulse = 1.0 + (0.12 if is_hover else 0.06) * math.sin(self.draw_timer * 0.18)
         btn_size = int(self.close_btn_size * pulse)
         btn_rect = pygame.Rect(
             self.close_rect.centerx - btn_size//2,
@@ -605,7 +563,7 @@ class GachaOverlaySystem:
         surface.blit(shadow, (btn_rect.x-3, btn_rect.y-3))
         pygame.draw.rect(surface, color, btn_rect, border_radius=12)
         pygame.draw.rect(surface, WHITE, btn_rect, 2, border_radius=12)
-        x_font = self.fonts["medium"].render("X", True, WHITE)
+        x_font = self.text_cache.render(self.fonts["medium"], "X", WHITE)
         x_rect = x_font.get_rect(center=btn_rect.center)
         surface.blit(x_font, x_rect)
         
@@ -617,14 +575,10 @@ class GachaOverlaySystem:
             self._draw_button(surface, self.button1_rect, f"x1 ({GACHA_1_COST}¢)", GOLD if can_afford_1 else (100, 100, 100))
             self._draw_button(surface, self.button10_rect, f"x10 ({GACHA_10_COST}¢)", PURPLE if can_afford_10 else (100, 100, 100))
 
-        # --- Fade-in overlay (drawn last to overlay everything) ---
-        if self.fade_alpha < 255:
-            fade_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            fade_surf.fill((0, 0, 0, 255 - self.fade_alpha))
-            surface.blit(fade_surf, (0, 0))
+        # fade เข้า/ออก: GameManager cross-fade จากภาพที่ถ่ายไว้ (ui_manager.transitions)
 
     def _draw_button(self, surface, rect, text, color):
-        pulse = 0.8 + 0.2 * math.sin(self.animation_timer * 0.05)
+        pulse = 0.8 + 0.2 * math.sin(self.draw_timer * 0.05)
         glow_alpha = int(60 * pulse)
         glow_surf = pygame.Surface((rect.width + 20, rect.height + 20), pygame.SRCALPHA)
         pygame.draw.rect(glow_surf, (*color, glow_alpha), glow_surf.get_rect(), border_radius=15)
@@ -633,7 +587,7 @@ class GachaOverlaySystem:
         pygame.draw.rect(surface, WHITE, rect, 3, border_radius=12)
         
         # Calculate appropriate text scale to fit within button
-        button_text = self.fonts["medium"].render(text, True, WHITE)
+        button_text = self.text_cache.render(self.fonts["medium"], text, WHITE)
         text_width, text_height = button_text.get_size()
         
         # Calculate available space (with padding)
@@ -668,8 +622,8 @@ class GachaOverlaySystem:
     def _draw_gacha_coin_box(self, surface):
         """วาดกล่อง coin display ที่ตำแหน่งใหม่ (อิงขอบขวาหน้าจอ)"""
         money_text = self.money_manager.get_display_value()
-        money_surf = self.fonts["medium"].render(money_text, True, (255, 223, 0))
-        symbol_surf = self.fonts["small"].render("¢", True, (200, 150, 0))
+        money_surf = self.text_cache.render(self.fonts["medium"], money_text, (255, 223, 0))
+        symbol_surf = self.text_cache.render(self.fonts["small"], "¢", (200, 150, 0))
         padding_x = 18
         padding_y = 10
         spacing = 20
@@ -678,7 +632,7 @@ class GachaOverlaySystem:
         self.ui_manager.draw_modern_box(surface, box_rect, color=(50, 50, 30, 200))
         # วาดไอคอนเหรียญ (ชิดซ้าย)
         coin_center = (box_rect.left + padding_x + icon_diameter // 2, box_rect.centery)
-        coin_bounce = math.sin(self.animation_timer * 6) * 2
+        coin_bounce = math.sin(self.draw_timer * 6) * 2
         coin_y = coin_center[1] + coin_bounce
         pygame.draw.circle(surface, (255, 215, 0), (coin_center[0], int(coin_y)), 18)
         pygame.draw.circle(surface, (255, 165, 0), (coin_center[0], int(coin_y)), 18, 3)
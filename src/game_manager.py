@@ -1,43 +1,73 @@
 # NongGameTyping/src/game_manager.py
 import pygame
 import sys
+import time
 from .word_manager import WordManager
 from .input_box import InputBox
 from .combo_manager import ComboManager
 from .money_manager import MoneyManager
-from .sound_manager import SoundManager
+from .sound_manager import SoundManager, SFX_FILES, SCENE_SFX
 from .ui import UIManager
 from .gacha_ui_system import GachaOverlaySystem
 from .collection_ui_system import CollectionOverlaySystem
-from .data_manager import DataManager
+from .data_manager import get_data_manager
+from .dirty_rects import DirtyRectTracker
+from .background_layer import DEFAULT_AMBIENT_FPS
+from .font_registry import get_font_registry
+from .image_cache import get_image_cache
+from .animation_clock import FixedStepClock, DEFAULT_SIMULATION_HZ
+from .frame_scheduler import FrameScheduler, DEFAULT_IDLE_FPS, DEFAULT_BACKGROUND_FPS
+from .asset_loader import AssetLoader
 
 class GameManager:
     """
     คลาสหลักที่ควบคุม Game Loop, State, และการทำงานร่วมกันของ Manager ต่างๆ
     """
     def __init__(self):
+        # เวลาตั้งแต่เริ่มเกมจนวาดเฟรมแรกที่เล่นได้ (รายงานใน run)
+        self._startup_started = time.perf_counter()
+        self._startup_reported = False
         # โหลดค่าตั้งค่าจาก DataManager
-        self.data_manager = DataManager()
+        self.data_manager = get_data_manager()
         config = self.data_manager.get_settings()
         
         self.SCREEN_WIDTH = config.get('screen_width', 1280)
         self.SCREEN_HEIGHT = config.get('screen_height', 720)
-        self.FPS = config.get('fps', 60)
+        self.FPS = config.get('fps', 60)  # 0 = ไม่จำกัด
         self.MAX_TIME_PER_WORD = config.get('max_time_per_word', 20)
         self.growth_on_success = config.get('growth_on_success', 0.15)
         self.growth_on_error = config.get('growth_on_error', -0.05)
         self.growth_timer_interval = config.get('growth_timer_interval', 5.0)
         self.growth_per_interval = config.get('growth_per_interval', 0.01)
         self.coins_per_growth = config.get('coins_per_growth', 5)
+        self.dirty_rect_rendering = config.get('dirty_rect_rendering', False)
+        self.debug_dirty_rects = config.get('debug_dirty_rects', False)
 
         pygame.init()
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption("NongGame - Typing Farmer")
-        self.clock = pygame.time.Clock()
+        # ลดความถี่การวาดเมื่อไม่มีอะไรเคลื่อนไหว/หน้าต่างไม่ได้โฟกัส และหยุดวาดเมื่อย่อหน้าต่าง
+        self.scheduler = FrameScheduler(
+            self.FPS,
+            config.get('idle_fps', DEFAULT_IDLE_FPS),
+            config.get('background_fps', DEFAULT_BACKGROUND_FPS),
+            enabled=config.get('power_save', True)
+        )
+        # เวลาในเกมเดินด้วย fixed step เสมอ ไม่ว่าจะวาดที่กี่ fps
+        self.sim_clock = FixedStepClock(config.get('simulation_hz', DEFAULT_SIMULATION_HZ))
+
+        # decode ภาพ/เสียงทั้งหมดพร้อมกันบน thread pool ระหว่างแสดงหน้าโหลด
+        self.asset_loader = self.preload_assets()
 
         # Initialize all managers with proper integration
-        self.sound_manager = SoundManager()
-        self.ui_manager = UIManager(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, sound_manager=self.sound_manager)
+        self.sound_manager = SoundManager(preloaded=self.asset_loader.sounds)
+        self.ui_manager = UIManager(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, sound_manager=self.sound_manager,
+                                    ambient_fps=config.get('ambient_fps', DEFAULT_AMBIENT_FPS))
+        # ภาพฉากที่ใช้ cross-fade ตอนเปิด/ปิด overlay (จองหน่วยความจำไว้ครั้งเดียว)
+        self.transitions = self.ui_manager.transitions
+        if self.dirty_rect_rendering:
+            # วาด/ส่งขึ้นจอเฉพาะส่วนที่เปลี่ยนในฉากหลัก (overlay ยังวาดเต็มจอ)
+            self.ui_manager.dirty_rects = DirtyRectTracker((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         self.word_manager = WordManager()
         self.combo_manager = ComboManager()
         self.money_manager = MoneyManager()  # This now loads from DataManager
@@ -62,7 +92,8 @@ class GameManager:
         self.best_combo = config.get('best_combo', 0)
 
         self.load_autosave()  # โหลด autosave ถ้ามี
-        self._autosave_timer = 0.0  # ตัวจับเวลา autosave
+        self._autosave_timer = 0.0  # ตัวจับเวลา autosave (เวลาจริง)
+        self.autosave_interval = 5.0
 
     def reset_round(self, is_error=False):
         if is_error:
@@ -106,17 +137,17 @@ class GameManager:
 
     def save_game_statistics(self):
         """บันทึกสถิติเกมลง DataManager"""
-        settings = self.data_manager.get_settings()
-        settings['total_words_typed'] = self.total_words_typed
-        settings['total_coins_earned'] = self.total_coins_earned
-        settings['best_combo'] = self.best_combo
-        self.data_manager.update_settings(settings)
+        self.data_manager.update_settings({
+            'total_words_typed': self.total_words_typed,
+            'total_coins_earned': self.total_coins_earned,
+            'best_combo': self.best_combo,
+        })
 
     def load_autosave(self):
         """โหลด autosave ถ้ามี"""
         data = self.data_manager.load_autosave()
         if data:
-            self.money_manager.coins = data.get("coins", self.money_manager.coins)
+            # เงินโหลดจาก economy journal แล้ว (save.json เก็บไว้เป็นสำเนาเท่านั้น)
             self.combo_manager.combo = data.get("combo", self.combo_manager.combo)
             self.plant_growth = data.get("plant_growth", self.plant_growth)
 
@@ -131,13 +162,22 @@ class GameManager:
     def run(self):
         self.sound_manager.play_bgm()
         while self.running:
-            dt = self.clock.tick(self.FPS) / 1000.0
-            self._autosave_timer += dt
-            if self._autosave_timer >= 5.0:
+            # fps (0 = ไม่จำกัด) กำหนดแค่ความถี่การวาด เกมจำลองด้วย fixed step ของ sim_clock
+            frame_dt = self.scheduler.wait(self.is_animating(), self.autosave_interval - self._autosave_timer)
+            self._autosave_timer += frame_dt
+            if self._autosave_timer >= self.autosave_interval:
                 self._autosave_timer = 0.0
                 self.autosave()
+            if self.scheduler.rendering:
+                steps = self.sim_clock.advance(frame_dt)
+            else:
+                # ย่อหน้าต่างอยู่: หยุดเวลาในเกมไว้ก่อน
+                steps = 0
+                self.sim_clock.reset()
 
-            for event in pygame.event.get():
+            for event in self.scheduler.events():
+                if self.scheduler.observe(event):
+                    self._invalidate_dirty_rects()
                 if event.type == pygame.QUIT:
                     self.running = False
 
@@ -170,66 +210,172 @@ class GameManager:
                 elif self.current_scene == "gacha":
                     pass
 
-            # --- อัปเดต/วาด overlay กาชา ถ้ามี ---
-            if self.gacha_overlay is not None:
-                self.gacha_overlay.update(dt)
-                # ตรวจสอบอีกครั้งหลังจาก update (อาจถูก set เป็น None ระหว่าง fade-out)
-                if self.gacha_overlay is not None:
-                    self.ui_manager.draw_background_image(self.screen)  # วาดพื้นหลังเกม
-                    self.gacha_overlay.draw(self.screen)
-                    pygame.display.flip()
-                    continue  # ข้าม logic เกมหลัก (หยุดเวลา)
-
-            # --- อัปเดต/วาด overlay collection ถ้ามี ---
-            if self.collection_overlay is not None:
-                self.collection_overlay.update(dt)
-                # ตรวจสอบอีกครั้งหลังจาก update (อาจถูก set เป็น None ระหว่าง fade-out)
-                if self.collection_overlay is not None:
-                    self.ui_manager.draw_background_image(self.screen)  # วาดพื้นหลังเกม
-                    self.collection_overlay.draw(self.screen)
-                    pygame.display.flip()
-                    continue  # ข้าม logic เกมหลัก (หยุดเวลา)
-
-            if self.current_scene == "main":
-                self.timer -= dt
-                self.growth_timer += dt
-                if self.growth_timer >= self.growth_timer_interval:
-                    self.growth_timer = 0.0
-                    if self.plant_growth < 1.0:
-                        self.plant_growth = min(1.0, self.plant_growth + 0.01 * self.combo_manager.combo)
-
-                self.input_box.update()
-                if self.input_box.text == self.word_manager.current_word:
-                    self.handle_success()
-                if self.timer <= 0:
-                    self.reset_round(is_error=True)
-                if self.plant_growth >= 1.0:
-                    self.sound_manager.play_sfx('harvest')
-                    self.money_manager.add_coins(self.coins_per_growth)
-                    self.total_coins_earned += self.coins_per_growth
-                    self.plant_growth = 0.0
-
-                game_state = {
-                    'current_word': self.word_manager.current_word,
-                    'input_box': self.input_box,
-                    'combo_manager': self.combo_manager,
-                    'timer': self.timer,
-                    'max_time': self.MAX_TIME_PER_WORD,
-                    'plant_growth': self.plant_growth,
-                    'money_manager': self.money_manager
-                }
-                self.ui_manager.draw_all(self.screen, game_state)
-            elif self.current_scene == "gacha":
-                pass
-
-            pygame.display.flip()
+            overlay = self.gacha_overlay or self.collection_overlay
+            for _ in range(steps):
+                self.update_step(self.sim_clock.step)
+                if (self.gacha_overlay or self.collection_overlay) is not overlay:
+                    # overlay เปิด/ปิดระหว่าง step: ทิ้ง step ที่เหลือของเฟรมนี้
+                    # ไม่ให้เวลาคำศัพท์/การเติบโตของฉากหลักวิ่งต่อด้วย step ที่ค้างอยู่
+                    break
+            if self.scheduler.rendering:
+                self.draw_frame()
+                if not self._startup_reported:
+                    self._startup_reported = True
+                    self.report_startup()
 
         pygame.quit()
         # บันทึกสถิติก่อนปิดเกม
         self.save_game_statistics()
         self.autosave()  # autosave ก่อนออก
+        self.data_manager.shutdown()  # บังคับเขียนข้อมูลที่ค้างอยู่ลงไฟล์
+        print(self.scheduler.report())
+        print(f"Fonts: {get_font_registry().stats()}")
+        print(f"Images: {get_image_cache().stats()}")
+        print(f"Sounds: {self.sound_manager.stats()}")
         sys.exit()
 
+    def preload_assets(self):
+        """โหลดภาพฉากหลัก ต้นไม้ ไอคอน ไอเทม และเสียง SFX ของฉากหลักก่อนเข้าเกม
+
+        ภาพที่ได้อยู่ใน image cache แล้ว UIManager/หน้ากาชาจึงไม่ต้อง decode ซ้ำ
+        (ขนาด/alpha ต้องตรงกับที่ UIManager ขอ)
+        """
+        loader = AssetLoader()
+        assets = self.data_manager.get_assets_path
+        loader.image(assets("images", "bg.png"), (self.SCREEN_WIDTH, self.SCREEN_HEIGHT), alpha=False)
+        for idx in range(1, 5):
+            loader.image(assets("images", f"Tree_Growain/tree{idx}.png"))
+        loader.image(assets("images", "icon_gacha.png"))
+        loader.image(assets("images", "icon_collection.png"))
+        # ภาพไอเทมใช้ทั้งหน้ากาชาและคอลเลกชัน โหลดไว้ก่อนเปิดหน้าเหล่านั้น
+        for path in self.item_image_paths():
+            loader.image(path)
+        # เสียงของหน้าอื่น decode เมื่อเปิดหน้านั้น
+        for name in SCENE_SFX['main']:
+            loader.sound(name, assets("sounds", SFX_FILES[name]))
+        loader.run(self.screen)
+        return loader
+
+    def report_startup(self):
+        """พิมพ์เวลาจนถึงเฟรมแรกที่เล่นได้"""
+        elapsed = time.perf_counter() - self._startup_started
+        stats = self.asset_loader.stats()
+        print(f"Startup: first interactive frame after {elapsed * 1000:.0f} ms "
+              f"({stats['assets']} assets decoded on {stats['workers']} threads "
+              f"in {stats['seconds'] * 1000:.0f} ms, {stats['failed']} failed)")
+
+    def item_image_paths(self):
+        """ไฟล์ภาพของไอเทมกาชาทั้งหมด"""
+        return [self.data_manager.get_assets_path("images", f"Item/{item.icon}")
+                for item in self.data_manager.get_all_items() if item.icon.lower().endswith('.png')]
+
+    def is_animating(self):
+        """มีอะไรเคลื่อนไหวบนจอหรือไม่ (ถ้าไม่ scheduler จะลดความถี่การวาด)"""
+        if self.gacha_overlay is not None:
+            return not self.gacha_overlay.is_idle()
+        if self.collection_overlay is not None:
+            return not self.collection_overlay.is_idle()
+        # ฉากหลักมีแถบเวลานับถอยหลังตลอด
+        return True
+
+    def update_step(self, dt):
+        """จำลองเกมไปหนึ่ง step (dt คงที่ตาม simulation_hz)"""
+        # --- overlay กาชา/collection: หยุดเวลาเกมหลักระหว่างเปิดอยู่ ---
+        if self.gacha_overlay is not None:
+            self.gacha_overlay.update(dt)
+            return
+        if self.collection_overlay is not None:
+            self.collection_overlay.update(dt)
+            return
+
+        if self.current_scene == "main":
+            self.timer -= dt
+            self.growth_timer += dt
+            if self.growth_timer >= self.growth_timer_interval:
+                self.growth_timer = 0.0
+                if self.plant_growth < 1.0:
+                    self.plant_growth = min(1.0, self.plant_growth + 0.01 * self.combo_manager.combo)
+
+            self.input_box.update()
+            if self.input_box.text == self.word_manager.current_word:
+                self.handle_success()
+            if self.timer <= 0:
+                self.reset_round(is_error=True)
+            if self.plant_growth >= 1.0:
+                self.sound_manager.play_sfx('harvest')
+                self.money_manager.add_coins(self.coins_per_growth)
+                self.total_coins_earned += self.coins_per_growth
+                self.plant_growth = 0.0
+
+            self.ui_manager.update(dt)
+            self.ui_manager.update_tree_animation(self.plant_growth * 100, dt)
+
+    def draw_frame(self):
+        """วาดหนึ่งเฟรมจากสถานะล่าสุด (ค่าที่เปลี่ยนต่อเนื่องเลื่อนไปตามเวลาที่ยังไม่ได้จำลอง)"""
+        # --- วาด overlay กาชา/collection ถ้ามี (overlay วาดพื้นหลังเอง) ---
+        overlay = self.gacha_overlay or self.collection_overlay
+        if overlay is not None:
+            if overlay.fade_alpha < 255:
+                self._draw_overlay_transition(overlay)
+            else:
+                self.transitions.finish()
+                overlay.draw(self.screen)
+            self._invalidate_dirty_rects()
+            pygame.display.flip()
+            return
+        self.transitions.finish()
+
+        if self.current_scene == "main":
+            self._draw_main_scene(self.screen)
+            dirty_rects = self.ui_manager.dirty_rects
+            if dirty_rects is not None:
+                if self.debug_dirty_rects:
+                    dirty_rects.draw_debug(self.screen)
+                pygame.display.update(dirty_rects.end_frame())
+                return
+
+        pygame.display.flip()
+
+    def _draw_main_scene(self, surface):
+        """วาดฉากหลักลง surface"""
+        render_lag = self.sim_clock.lag
+        game_state = {
+            'current_word': self.word_manager.current_word,
+            'input_box': self.input_box,
+            'combo_manager': self.combo_manager,
+            'timer': max(0.0, self.timer - render_lag),
+            'max_time': self.MAX_TIME_PER_WORD,
+            'plant_growth': self.plant_growth,
+            'money_manager': self.money_manager,
+            'render_lag': render_lag
+        }
+        self.ui_manager.draw_all(surface, game_state)
+
+    def _snapshot_main_scene(self, surface):
+        """วาดฉากหลักเต็มจอลง surface สำหรับ transition (ไม่ผ่าน dirty rect)"""
+        dirty_rects = self.ui_manager.dirty_rects
+        self.ui_manager.dirty_rects = None
+        try:
+            self._draw_main_scene(surface)
+        finally:
+            self.ui_manager.dirty_rects = dirty_rects
+
+    def _draw_overlay_transition(self, overlay):
+        """cross-fade ระหว่างฉากหลักกับ overlay จากภาพที่ถ่ายไว้ครั้งเดียวตอนเริ่ม fade"""
+        # ตอนเริ่ม fade บนจอยังเป็นเฟรมล่าสุดของฉากเดิม
+        if overlay.fading_out:
+            self.transitions.begin((id(overlay), "out"), self.screen, self._snapshot_main_scene)
+            progress = 1 - overlay.fade_alpha / 255
+        else:
+            self.transitions.begin((id(overlay), "in"), self.screen, overlay.draw)
+            progress = overlay.fade_alpha / 255
+        self.transitions.draw(self.screen, progress)
+
+    def _invalidate_dirty_rects(self):
+        """overlay วาดทับทั้งจอ เฟรมแรกหลังปิด overlay จึงต้องวาดฉากหลักใหม่ทั้งหมด"""
+        if self.ui_manager.dirty_rects is not None:
+            self.ui_manager.dirty_rects.invalidate()
+
     def open_gacha_overlay(self):
         # เตรียม fonts dict สำหรับ gacha overlay
         fonts = {
@@ -246,6 +392,7 @@ class GameManager:
         def close_overlay():
             self.gacha_overlay = None
             self.sound_manager.play_bgm()
+        self.sound_manager.preload_scene('gacha')
         self.sound_manager.play_gacha_bgm()
         self.gacha_overlay = GachaOverlaySystem(
             (self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
@@ -253,7 +400,8 @@ class GameManager:
             self.money_manager,  # ส่ง money_manager
             self.ui_manager,  # ส่ง ui_manager
             self.sound_manager,  # ส่ง sound_manager ใหม่
-            on_close=close_overlay
+            on_close=close_overlay,
+            clock=self.sim_clock  # วาดแอนิเมชันแบบ interpolate ระหว่าง step
         )
 
     def open_collection_overlay(self):
@@ -275,5 +423,6 @@ class GameManager:
             (self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
             fonts,
             self.ui_manager,  # ส่ง ui_manager
-            on_close=close_overlay
+            on_close=close_overlay,
+            clock=self.sim_clock
         )
\ No newline at end of file
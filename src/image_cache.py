@@ -0,0 +1,164 @@
+# NongGameTyping/src/image_cache.py
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+import pygame
+
+# Memory cap for decoded images; pinned (acquired) images never count as evictable
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Item icons are fitted once into this square; animated sizes are scaled from it (see SurfaceCache.scaled_icon)
+ICON_IMAGE_SIZE = 120
+
+ImageKey = Tuple[str, Optional[Hashable], bool, bool]
+
+class ImageCache:
+    """Decoded image assets keyed by (path, size, alpha, fit)
+
+    load() returns the shared surface for an asset, decoding and converting
+    it on the first request; a size gives a scaled copy (smoothscale to an
+    exact (w, h), or with fit=True scaled into a size x size square and
+    centred, as item icons are drawn). acquire()/release() count users of
+    an image: entries with users are pinned, the rest are evicted least
+    recently used once resident bytes pass the budget. Missing files
+    return None and are reported once. Returned surfaces are shared, so
+    never draw onto them.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[ImageKey, pygame.Surface]" = OrderedDict()
+        self._refs: Dict[ImageKey, int] = {}
+        self._missing = set()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: str, size=None, alpha: bool = True, fit: bool = False) -> Optional[pygame.Surface]:
+        key = (path, size, alpha, fit)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        if path in self._missing:
+            return None
+        self.misses += 1
+        surf = self._decode(path, alpha) if size is None else self._scale(path, size, alpha, fit)
+        if surf is None:
+            return None
+        self._entries[key] = surf
+        self._bytes += self._surface_bytes(surf)
+        self._evict()
+        return surf
+
+    def acquire(self, path: str, size=None, alpha: bool = True, fit: bool = False) -> Optional[pygame.Surface]:
+        """load() and pin the image until a matching release()"""
+        surf = self.load(path, size, alpha, fit)
+        if surf is not None:
+            key = (path, size, alpha, fit)
+            self._refs[key] = self._refs.get(key, 0) + 1
+        return surf
+
+    def release(self, path: str, size=None, alpha: bool = True, fit: bool = False):
+        key = (path, size, alpha, fit)
+        count = self._refs.get(key, 0) - 1
+        if count > 0:
+            self._refs[key] = count
+        else:
+            self._refs.pop(key, None)
+            self._evict()
+
+    def put(self, path: str, image: pygame.Surface, size=None, alpha: bool = True) -> pygame.Surface:
+        """Store an image decoded elsewhere (see asset_loader), converting it here"""
+        key = (path, size, alpha, False)
+        surf = self._entries.get(key)
+        if surf is None:
+            self.misses += 1
+            surf = image.convert_alpha() if alpha else image.convert()
+            self._entries[key] = surf
+            self._bytes += self._surface_bytes(surf)
+            self._evict()
+        return surf
+
+    def preload(self, paths: Iterable[str], alpha: bool = True) -> int:
+        """Decode assets ahead of a scene; returns how many are resident"""
+        return sum(1 for path in paths if self.load(path, alpha=alpha) is not None)
+
+    def _decode(self, path: str, alpha: bool) -> Optional[pygame.Surface]:
+        if not os.path.exists(path):
+            print(f"Warning: Image not found: {path}")
+            self._missing.add(path)
+            return None
+        try:
+            image = pygame.image.load(path)
+        except Exception as e:
+            print(f"Error loading image {path}: {e}")
+            self._missing.add(path)
+            return None
+        return image.convert_alpha() if alpha else image.convert()
+
+    def _scale(self, path: str, size, alpha: bool, fit: bool) -> Optional[pygame.Surface]:
+        image = self.load(path, alpha=alpha)
+        if image is None:
+            return None
+        if not fit:
+            return pygame.transform.smoothscale(image, size)
+        # Keep the aspect ratio and centre the image in a size x size square
+        img_width, img_height = image.get_size()
+        scale = min(size / img_width, size / img_height)
+        new_width, new_height = int(img_width * scale), int(img_height * scale)
+        result = pygame.Surface((size, size), pygame.SRCALPHA)
+        result.blit(pygame.transform.scale(image, (new_width, new_height)),
+                    ((size - new_width) // 2, (size - new_height) // 2))
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "pinned": len(self._refs),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        """Drop every unpinned image"""
+        for key in [key for key in self._entries if key not in self._refs]:
+            self._bytes -= self._surface_bytes(self._entries.pop(key))
+        self._missing.clear()
+
+    def _evict(self):
+        if self._bytes <= self.max_bytes:
+            return
+        # Always keep the newest entry, even if it alone exceeds the cap
+        for key in list(self._entries)[:-1]:
+            if self._bytes <= self.max_bytes:
+                break
+            if key in self._refs:
+                continue
+            self._bytes -= self._surface_bytes(self._entries.pop(key))
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surf: pygame.Surface) -> int:
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+# Shared instance (see get_image_cache)
+_shared_image_cache: Optional[ImageCache] = None
+_shared_lock = threading.Lock()
+
+def get_image_cache() -> ImageCache:
+    """Return the process-wide ImageCache, creating it on first use"""
+    global _shared_image_cache
+    if _shared_image_cache is None:
+        with _shared_lock:
+            if _shared_image_cache is None:
+                _shared_image_cache = ImageCache()
+    return _shared_image_cache
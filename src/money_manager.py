@@ -1,27 +1,34 @@
 # NongGameTyping/src/money_manager.py
-from .data_manager import DataManager
+from .data_manager import get_data_manager
+from .economy_journal import EconomyJournal
 
 class MoneyManager:
     """จัดการเงินในเกม"""
     def __init__(self):
-        self.data_manager = DataManager()
-        # โหลดข้อมูลเงินจาก DataManager
-        settings = self.data_manager.get_settings()
-        self.coins = settings.get('coins', 1000)  # เริ่มต้นด้วย 1000 coin ถ้าไม่มีข้อมูล
+        # เงินจริงเก็บใน economy journal ของ DataManager ที่แชร์กัน ไม่เก็บสำเนาไว้เอง
+        self.data_manager = get_data_manager()
+        self.data_manager.get_economy()
+
+    @property
+    def coins(self):
+        """จำนวนเงินปัจจุบัน (อ่านจาก economy journal)"""
+        return self.data_manager.get_economy().coins
 
     def add_coins(self, amount):
         """เพิ่มเงิน"""
         if amount > 0:
-            self.coins += amount
-            self._save_coins()
+            self.data_manager.commit_economy([EconomyJournal.coin_earned(amount)])
 
-    def spend_coins(self, amount):
-        """ใช้เงิน (ถ้ามีพอ)"""
-        if self.coins >= amount:
-            self.coins -= amount
-            self._save_coins()
+    def spend_coins(self, amount, grants=None):
+        """ใช้เงิน (ถ้ามีพอ) และมอบไอเทมใน grants [(name, Rarity), ...] ใน record เดียวกัน"""
+        events = []
+        if amount > 0:
+            events.append(EconomyJournal.coin_spent(amount))
+        for name, rarity in grants or []:
+            events.append(EconomyJournal.item_granted(name, rarity.value))
+        if not events:
             return True
-        return False
+        return self.data_manager.commit_economy(events)
 
     def get_coins(self):
         """รับจำนวนเงินปัจจุบัน"""
@@ -30,9 +37,3 @@ class MoneyManager:
     def get_display_value(self):
         """รับค่าสำหรับแสดงผล"""
         return f"{self.coins}"
-
-    def _save_coins(self):
-        """บันทึกข้อมูลเงินลง DataManager"""
-        settings = self.data_manager.get_settings()
-        settings['coins'] = self.coins
-        self.data_manager.update_settings(settings)
\ No newline at end of file
@@ -0,0 +1,232 @@
+# NongGameTyping/src/particle_engine.py
+import math
+from typing import Optional, Tuple
+import numpy as np
+import pygame
+from .surface_cache import ALPHA_STEP, get_surface_cache
+
+# Drag factors are given per 60 Hz frame, the rate the old per-object particles were tuned at
+REFERENCE_FPS = 60
+
+# Colour channels are rounded to this step so jittered burst colours share stamps
+COLOR_STEP = 8
+
+# Star stamps are pre-rotated in steps of this many degrees (a five-pointed star repeats every 72)
+STAR_ANGLE_STEP = 4
+STAR_SYMMETRY = 72
+
+# Stars breathe by this fraction of their size as they spin
+STAR_TWINKLE = 0.3
+
+# Slots allocated up front; the arrays double when a burst needs more
+DEFAULT_CAPACITY = 256
+
+SHAPES = ("circle", "star")
+
+class ParticleEngine:
+    """Particles stored as NumPy arrays (structure of arrays)
+
+    Position, velocity, life, size and colour of every live particle sit in
+    the first `count` slots of flat arrays; update() integrates them all at
+    once and compacts dead ones in place. draw() groups particles by their
+    look (shape, colour, radius, alpha, rotation), fetches one stamp per
+    group from the shared surface cache and draws everything with a single
+    Surface.blits call.
+
+    Units are pixels and seconds. `drag` is the (x, y) velocity factor per
+    1/60 s, `gravity` is px/s², `spin` is degrees/s.
+    """
+
+    def __init__(self, shape: str = "circle", gravity: float = 0.0, drag: Tuple[float, float] = (1.0, 1.0),
+                 fade_power: float = 1.0, fade_alpha: bool = True, shrink: bool = True,
+                 max_particles: Optional[int] = None, capacity: int = DEFAULT_CAPACITY,
+                 rng: Optional[np.random.Generator] = None):
+        if shape not in SHAPES:
+            raise ValueError(f"unknown particle shape: {shape}")
+        self.shape = shape
+        self.gravity = gravity
+        self.drag = drag
+        self.fade_power = fade_power
+        self.fade_alpha = fade_alpha
+        self.shrink = shrink
+        self.max_particles = max_particles
+        self.rng = rng or np.random.default_rng()
+        self.surface_cache = get_surface_cache()
+        self.count = 0
+        self._allocate(max(1, capacity if max_particles is None else min(capacity, max_particles)))
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.max_life = np.ones(capacity, np.float32)
+        self.size = np.zeros(capacity, np.float32)
+        self.pulse = np.ones(capacity, np.float32)
+        self.angle = np.zeros(capacity, np.float32)
+        self.spin = np.zeros(capacity, np.float32)
+        # RGB packed as 0xRRGGBB after rounding to COLOR_STEP
+        self.color = np.zeros(capacity, np.int64)
+
+    def _arrays(self):
+        return (self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+                self.size, self.pulse, self.angle, self.spin, self.color)
+
+    def _grow(self, needed: int):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        old = self._arrays()
+        count = self.count
+        self._allocate(capacity)
+        for new, previous in zip(self._arrays(), old):
+            new[:count] = previous[:count]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, vx, vy, life, size, color, angle=0.0, spin=0.0, pulse=1.0) -> int:
+        """Add particles; each argument is a scalar or one value per particle
+
+        color is one (r, g, b) or an (n, 3) array. Returns how many were
+        added (fewer than asked once max_particles is reached).
+        """
+        n = int(np.broadcast(np.asarray(x), np.asarray(y), np.asarray(vx), np.asarray(vy),
+                             np.asarray(life), np.asarray(size)).size)
+        if self.max_particles is not None:
+            n = min(n, self.max_particles - self.count)
+        if n <= 0:
+            return 0
+        start, end = self.count, self.count + n
+        if end > self.capacity:
+            self._grow(end)
+
+        for array, value in ((self.x, x), (self.y, y), (self.vx, vx), (self.vy, vy), (self.life, life),
+                             (self.size, size), (self.angle, angle), (self.spin, spin), (self.pulse, pulse)):
+            array[start:end] = value if np.ndim(value) == 0 else np.asarray(value)[:n]
+        self.max_life[start:end] = np.maximum(self.life[start:end], 1e-6)
+
+        rgb = np.asarray(color, dtype=np.int64).reshape(-1, 3)[:n]
+        rgb = np.clip((rgb + COLOR_STEP // 2) // COLOR_STEP * COLOR_STEP, 0, 255)
+        self.color[start:end] = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+        self.count = end
+        return n
+
+    def burst(self, x: float, y: float, count: int, speed: Tuple[float, float], life: Tuple[float, float],
+              size: Tuple[float, float], color, color_jitter: int = 0) -> int:
+        """Emit count particles from (x, y) in random directions
+
+        speed, life and size are (low, high) uniform ranges; color_jitter
+        shifts each channel of color by up to that much per particle.
+        """
+        rng = self.rng
+        angles = rng.uniform(0, 2 * math.pi, count)
+        speeds = rng.uniform(*speed, count)
+        colors = np.broadcast_to(np.asarray(color, dtype=np.int64)[:3], (count, 3))
+        if color_jitter:
+            colors = np.clip(colors + rng.integers(-color_jitter, color_jitter + 1, (count, 3)), 0, 255)
+        return self.emit(x, y, np.cos(angles) * speeds, np.sin(angles) * speeds,
+                         rng.uniform(*life, count), rng.uniform(*size, count), colors)
+
+    def update(self, dt: float):
+        n = self.count
+        if not n:
+            return
+        vx, vy = self.vx[:n], self.vy[:n]
+        if self.gravity:
+            vy += self.gravity * dt
+        self.x[:n] += vx * dt
+        self.y[:n] += vy * dt
+        steps = dt * REFERENCE_FPS
+        drag_x, drag_y = self.drag
+        if drag_x != 1.0:
+            vx *= drag_x ** steps
+        if drag_y != 1.0:
+            vy *= drag_y ** steps
+        if self.shape == "star":
+            self.angle[:n] += self.spin[:n] * dt
+        life = self.life[:n]
+        life -= dt
+
+        alive = life > 0
+        if not alive.all():
+            keep = int(alive.sum())
+            for array in self._arrays():
+                array[:keep] = array[:n][alive]
+            self.count = keep
+
+    def draw(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        """Draw every live particle; returns the area touched (None if nothing was drawn)"""
+        n = self.count
+        if not n:
+            return None
+        fade = np.clip(self.life[:n] / self.max_life[:n], 0.0, 1.0)
+        if self.fade_power != 1.0:
+            fade = fade ** self.fade_power
+        scale = self.size[:n] * self.pulse[:n]
+        if self.shape == "star":
+            scale = scale * (1 + STAR_TWINKLE * np.sin(self.angle[:n] * 0.1))
+            turns = np.rint((self.angle[:n] % STAR_SYMMETRY) / STAR_ANGLE_STEP).astype(np.int64)
+            turns %= STAR_SYMMETRY // STAR_ANGLE_STEP
+        else:
+            turns = np.zeros(n, np.int64)
+        if self.shrink:
+            radius = np.maximum(1, (scale * fade).astype(np.int64))
+        else:
+            radius = scale.astype(np.int64)
+        radius = np.minimum(radius, 1023)
+        if self.fade_alpha:
+            # Same rounding as surface_cache.quantize_color, so a key maps to exactly one stamp
+            alpha = np.minimum(255, np.rint((255 * fade).astype(np.int64) / ALPHA_STEP).astype(np.int64) * ALPHA_STEP)
+        else:
+            alpha = np.full(n, 255, np.int64)
+
+        visible = (radius > 0) & (alpha > 0)
+        if not visible.all():
+            index = np.flatnonzero(visible)
+            if not index.size:
+                return None
+            radius, alpha, turns = radius[index], alpha[index], turns[index]
+            x, y, color = self.x[:n][index], self.y[:n][index], self.color[:n][index]
+        else:
+            x, y, color = self.x[:n], self.y[:n], self.color[:n]
+
+        keys = (((color << 8 | alpha) << 10 | radius) << 5) | turns
+        unique, inverse = np.unique(keys, return_inverse=True)
+        stamps = np.empty(len(unique), dtype=object)
+        for i, key in enumerate(unique.tolist()):
+            stamps[i] = self._stamp(key)
+
+        # Circle stamps are 2r wide and star stamps 4r, both centred on the particle
+        offset = radius * 2 if self.shape == "star" else radius
+        dests = np.column_stack(((x - offset).astype(np.int64), (y - offset).astype(np.int64)))
+        surface.blits(zip(stamps[inverse], dests.tolist()), doreturn=False)
+
+        left, top = dests.min(axis=0).tolist()
+        right, bottom = (dests + (offset * 2)[:, None]).max(axis=0).tolist()
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def _stamp(self, key: int) -> pygame.Surface:
+        turns = key & 31
+        radius = (key >> 5) & 1023
+        alpha = (key >> 15) & 255
+        packed = key >> 23
+        color = ((packed >> 16) & 255, (packed >> 8) & 255, packed & 255, alpha)
+        if self.shape == "circle":
+            return self.surface_cache.circle(radius, color)
+
+        def build():
+            surf = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+            points = []
+            for i in range(10):
+                angle_rad = math.radians(turns * STAR_ANGLE_STEP + i * 36)
+                r = radius if i % 2 == 0 else radius // 2
+                points.append((radius * 2 + r * math.cos(angle_rad), radius * 2 + r * math.sin(angle_rad)))
+            pygame.draw.polygon(surf, color, points)
+            return surf
+        return self.surface_cache.get(("star", radius, color, turns), build)
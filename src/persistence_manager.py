@@ -0,0 +1,158 @@
+# NongGameTyping/src/persistence_manager.py
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+# Default seconds between background flushes (overridable via settings['save_interval'])
+DEFAULT_SAVE_INTERVAL = 2.0
+
+# Window used for the bytes-written-per-minute metric
+WRITE_STATS_WINDOW = 60.0
+
+# A serializer returns (path, encoded bytes) for one dirty key, or None when it
+# has nothing to write (or persisted itself, like the economy journal's fsync)
+Serializer = Callable[[], Optional[Tuple[str, bytes]]]
+
+def _fsync_directory(path: str):
+    """Persist a rename on filesystems that need the directory synced too"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Not supported (e.g. Windows)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def write_file_atomic(path: str, payload: bytes):
+    """Write a file via temp file + fsync + rename so a crash never leaves it half written"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_directory(os.path.dirname(path) or ".")
+
+class PersistenceManager:
+    """Write-behind saver: callers mark data dirty, a worker thread flushes it in batches"""
+
+    def __init__(self, interval: float = DEFAULT_SAVE_INTERVAL,
+                 on_written: Optional[Callable[[str, str], None]] = None):
+        self.interval = interval
+        self.on_written = on_written
+        self._serializers: Dict[str, Serializer] = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._worker = None
+
+        # Write metrics
+        self._recent_writes = deque()  # (monotonic time, bytes)
+        self.total_bytes_written = 0
+        self.total_files_written = 0
+        self.total_flushes = 0
+
+    def register(self, key: str, serializer: Serializer):
+        """Register how to serialize a dirty key"""
+        self._serializers[key] = serializer
+
+    def mark_dirty(self, key: str):
+        """Schedule a key to be written on the next flush"""
+        if key not in self._serializers:
+            raise ValueError(f"Unknown persistence key: {key}")
+        with self._lock:
+            self._dirty.add(key)
+        self._ensure_worker()
+
+    def is_dirty(self, key: str) -> bool:
+        with self._lock:
+            return key in self._dirty
+
+    def flush(self):
+        """Write every dirty key now (safe to call from any thread)"""
+        with self._flush_lock:
+            with self._lock:
+                keys = self._dirty
+                self._dirty = set()
+            if not keys:
+                return
+
+            failed = set()
+            for key in keys:
+                try:
+                    result = self._serializers[key]()
+                    if result is None:
+                        continue
+                    path, payload = result
+                    write_file_atomic(path, payload)
+                    self.record_write(len(payload))
+                    if self.on_written:
+                        self.on_written(key, path)
+                except Exception as e:
+                    print(f"Error flushing {key}: {e}")
+                    failed.add(key)
+
+            if failed:
+                # Retry on the next cycle
+                with self._lock:
+                    self._dirty |= failed
+            self.total_flushes += 1
+
+    def shutdown(self):
+        """Stop the worker and force a final flush"""
+        self._stopping = True
+        self._wake.set()
+        worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout=5.0)
+        self._worker = None
+        self.flush()
+
+    def get_write_stats(self) -> Dict[str, float]:
+        """Bytes written in the last minute plus lifetime totals"""
+        with self._lock:
+            self._prune_recent_writes(time.monotonic())
+            bytes_last_minute = sum(size for _, size in self._recent_writes)
+        return {
+            "bytes_per_minute": bytes_last_minute,
+            "total_bytes": self.total_bytes_written,
+            "files_written": self.total_files_written,
+            "flushes": self.total_flushes,
+        }
+
+    def record_write(self, size: int):
+        """Count bytes written to disk, including by data that persists itself"""
+        now = time.monotonic()
+        with self._lock:
+            self._recent_writes.append((now, size))
+            self._prune_recent_writes(now)
+            self.total_bytes_written += size
+            self.total_files_written += 1
+
+    def _prune_recent_writes(self, now: float):
+        while self._recent_writes and now - self._recent_writes[0][0] > WRITE_STATS_WINDOW:
+            self._recent_writes.popleft()
+
+    def _ensure_worker(self):
+        if self._worker is not None or self._stopping:
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run, name="persistence", daemon=True)
+            self._worker.start()
+        atexit.register(self.shutdown)
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
@@ -1,49 +1,70 @@
 # NongGameTyping/src/sound_manager.py
 import pygame
 import os
-from .data_manager import DataManager
+from collections import OrderedDict
+from .data_manager import get_data_manager
+
+# Sound Effects (SFX): ชื่อ -> ไฟล์ใน assets/sounds
+SFX_FILES = {
+    'typing': 'typing.wav',
+    'success': 'success.mp3',
+    'error': 'error.mp3',
+    'gacha_start': 'gacha_start.wav',
+    'gacha_result': 'gacha_result.wav',
+    'button': 'button.wav',
+    'harvest': 'harvest.wav',
+    'button_hover': 'button_hover.wav',
+}
+
+# เสียงที่ใช้ในแต่ละฉาก โหลดไว้ก่อนเข้าฉาก ที่เหลือ decode ตอนเล่นครั้งแรก
+SCENE_SFX = {
+    'main': ('typing', 'success', 'error', 'harvest', 'button', 'button_hover'),
+    'gacha': ('gacha_start', 'gacha_result'),
+}
+
+# หน่วยความจำสูงสุดของเสียงที่ decode แล้ว (MB) เกินแล้วลบเสียงที่ไม่ได้เล่นนานที่สุดออก
+DEFAULT_SOUND_MEMORY_MB = 16
 
 class SoundManager:
     """
     จัดการการโหลดและเล่นเสียงทั้งหมดในเกม
     ตรวจสอบไฟล์ก่อนโหลด ถ้าไม่มีไฟล์จะข้ามไปและแสดงคำเตือน
+    SFX จะ decode เมื่อเล่นครั้งแรก (หรือ preload ตามฉาก) ส่วนเพลงยาว stream ผ่าน mixer.music เสมอ
     """
-    def __init__(self):
-        self.sounds = {}
+    def __init__(self, preloaded=None):
+        """preloaded: เสียงที่ decode มาแล้ว (จาก AssetLoader) ชื่อ -> Sound"""
+        preloaded = preloaded or {}
+        self.sounds = OrderedDict()  # เสียงที่ decode แล้ว เรียงจากเล่นนานที่สุดไปล่าสุด
+        self.sound_paths = {}  # ชื่อ -> ไฟล์ SFX ที่มีอยู่จริง
         self.bgm_path = None
         
         # Initialize data manager for asset paths
-        self.data_manager = DataManager()
+        self.data_manager = get_data_manager()
         
         # Load volume settings
-        settings = self.data_manager.get_settings()
-        self.sound_volume = settings.get('sound_volume', 0.5)
-        self.music_volume = settings.get('music_volume', 0.3)
+        self.sound_volume = self.data_manager.get_setting('sound_volume', 0.5)
+        self.music_volume = self.data_manager.get_setting('music_volume', 0.3)
+        self.max_bytes = int(self.data_manager.get_setting('sound_memory_mb', DEFAULT_SOUND_MEMORY_MB) * 1024 * 1024)
+        self.sound_bytes = 0
+        self.decodes = 0
+        self.evictions = 0
         
         try:
             pygame.mixer.init()
             print("Pygame mixer initialized successfully.")
 
-            # --- โหลด Sound Effects (SFX) ---
-            sfx_to_load = {
-                'typing': 'typing.wav',
-                'success': 'success.mp3',
-                'error': 'error.mp3',
-                'gacha_start': 'gacha_start.wav',
-                'gacha_result': 'gacha_result.wav',
-                'button': 'button.wav',
-                'harvest': 'harvest.wav',
-                'button_hover': 'button_hover.wav',
-                'gacha_bgm': 'gacha_bgm.mp3',
-            }
-
-            for name, filename in sfx_to_load.items():
+            # --- หาไฟล์ Sound Effects (SFX) ยังไม่ decode ---
+            for name, filename in SFX_FILES.items():
                 path = self.data_manager.get_assets_path("sounds", filename)
                 # ตรวจสอบว่าไฟล์มีอยู่จริงหรือไม่ ก่อนที่จะโหลด
                 if os.path.exists(path):
-                    self.sounds[name] = pygame.mixer.Sound(path)
+                    self.sound_paths[name] = path
                 else:
                     print(f"Warning: SFX file not found, skipping: {path}")
+            # ใช้เสียงที่โหลดไว้แล้ว (จาก AssetLoader) ไม่ต้อง decode ซ้ำ
+            for name, sound in preloaded.items():
+                if name in self.sound_paths:
+                    self._store(name, sound)
 
             # --- เตรียม Background Music (BGM) ---
             bgm_file = self.data_manager.get_assets_path("sounds", "bgm.mp3")
@@ -56,14 +77,77 @@ class SoundManager:
         except Exception as e:
             print(f"An error occurred during SoundManager initialization: {e}")
             # หากเกิดปัญหาในการ init mixer ให้ปิดการใช้งานเสียงทั้งหมด
-            self.sounds = {}
+            self.sounds = OrderedDict()
+            self.sound_paths = {}
+            self.sound_bytes = 0
             self.bgm_path = None
 
+    def get_sound(self, name):
+        """คืน Sound ที่ decode แล้ว (decode ตอนนี้ถ้ายังไม่เคย) หรือ None ถ้าไม่มีไฟล์"""
+        sound = self.sounds.get(name)
+        if sound is not None:
+            self.sounds.move_to_end(name)
+            return sound
+        path = self.sound_paths.get(name)
+        if path is None:
+            return None
+        try:
+            sound = pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"Error loading SFX {path}: {e}")
+            del self.sound_paths[name]
+            return None
+        self.decodes += 1
+        self._store(name, sound)
+        return sound
+
+    def preload(self, names):
+        """decode เสียงไว้ก่อน เช่นก่อนเข้าฉากที่ใช้"""
+        for name in names:
+            self.get_sound(name)
+
+    def preload_scene(self, scene):
+        self.preload(SCENE_SFX.get(scene, ()))
+
+    def _store(self, name, sound):
+        self.sounds[name] = sound
+        self.sound_bytes += self._sound_bytes(sound)
+        self._evict()
+
+    def _evict(self):
+        if self.sound_bytes <= self.max_bytes:
+            return
+        # เก็บเสียงล่าสุดไว้เสมอ และไม่ลบเสียงที่กำลังเล่นอยู่
+        for name in list(self.sounds)[:-1]:
+            if self.sound_bytes <= self.max_bytes:
+                break
+            if self.sounds[name].get_num_channels() > 0:
+                continue
+            self.sound_bytes -= self._sound_bytes(self.sounds.pop(name))
+            self.evictions += 1
+
+    @staticmethod
+    def _sound_bytes(sound):
+        """ขนาดของเสียงที่ decode แล้วในรูปแบบของ mixer"""
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return 0
+        frequency, size, channels = mixer
+        return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+    def stats(self):
+        return {
+            "sounds": len(self.sounds),
+            "bytes": self.sound_bytes,
+            "max_bytes": self.max_bytes,
+            "decodes": self.decodes,
+            "evictions": self.evictions,
+        }
+
     def update_volumes(self):
         """อัปเดตระดับเสียงจาก DataManager"""
-        settings = self.data_manager.get_settings()
-        self.sound_volume = settings.get('sound_volume', 0.5)
-        self.music_volume = settings.get('music_volume', 0.3)
+        self.sound_volume = self.data_manager.get_setting('sound_volume', 0.5)
+        self.music_volume = self.data_manager.get_setting('music_volume', 0.3)
         
         # อัปเดตระดับเสียงของ BGM ที่กำลังเล่นอยู่
         if pygame.mixer.music.get_busy():
@@ -86,16 +170,17 @@ class SoundManager:
         """เล่นเอฟเฟกต์เสียง"""
         if volume is None:
             volume = self.sound_volume
-        # โค้ดส่วนนี้ทำงานได้ดีอยู่แล้ว เพราะมันเช็คว่า 'name' อยู่ใน self.sounds หรือไม่
-        if name in self.sounds:
+        # get_sound คืน None ถ้าไม่มีไฟล์เสียงนี้
+        sound = self.get_sound(name)
+        if sound is not None:
             try:
-                self.sounds[name].set_volume(volume)
-                self.sounds[name].play()
+                sound.set_volume(volume)
+                sound.play()
             except pygame.error:
                 pass
 
     def play_gacha_bgm(self, volume=None):
-        """เล่น BGM สำหรับหน้ากาชา"""
+        """เล่น BGM สำหรับหน้ากาชา (stream จากไฟล์ ไม่ decode ทั้งเพลง)"""
         if volume is None:
             volume = self.music_volume
         gacha_bgm_file = self.data_manager.get_assets_path("sounds", "gacha_bgm.mp3")
@@ -0,0 +1,162 @@
+# NongGameTyping/src/surface_cache.py
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import pygame
+
+# Alpha is rounded to this step so pulsing effects reuse a handful of surfaces
+ALPHA_STEP = 4
+
+# Default memory cap for cached surfaces
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Variable-width bars are cut from a cached bar rounded up to a multiple of this
+BAR_WIDTH_BUCKET = 256
+
+# Animated icon sizes are rounded to this many pixels so a pulse reuses a few scaled copies
+ICON_SIZE_STEP = 4
+
+def quantize_size(size: int, step: int = ICON_SIZE_STEP) -> int:
+    """size snapped to a multiple of step (at least one step)"""
+    return max(step, int(round(size / step)) * step)
+
+def quantize_color(color) -> Tuple[int, int, int, int]:
+    """RGBA with the alpha snapped to ALPHA_STEP (opaque when no alpha is given)"""
+    r, g, b = color[0], color[1], color[2]
+    a = color[3] if len(color) > 3 else 255
+    a = min(255, int(round(a / ALPHA_STEP)) * ALPHA_STEP)
+    return int(r), int(g), int(b), a
+
+class SurfaceCache:
+    """LRU cache of small SRCALPHA surfaces used by per-frame UI drawing
+
+    Callers describe what they need (shape, size, colour, radius) and get back
+    a shared surface instead of allocating a new one each frame. Surfaces are
+    evicted least-recently-used once the byte cap is exceeded. Returned
+    surfaces are shared, so never draw onto them.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, builder: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Return the surface cached under key, building it on a miss"""
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = builder()
+        self._entries[key] = surf
+        self._bytes += self._surface_bytes(surf)
+        self._evict()
+        return surf
+
+    def scaled_icon(self, key: Hashable, source: pygame.Surface, base_size: int, size: Optional[int]) -> pygame.Surface:
+        """source, drawn for base_size, resized for size rounded to ICON_SIZE_STEP
+
+        key identifies source; no size returns source unscaled.
+        """
+        if not size:
+            return source
+        size = quantize_size(size)
+        if size == base_size:
+            return source
+        scale = size / base_size
+        w, h = source.get_size()
+
+        def build():
+            return pygame.transform.smoothscale(source, (max(1, round(w * scale)), max(1, round(h * scale))))
+        return self.get(("scaled_icon", key, size), build)
+
+    def rounded_rect(self, size, color, radius: int = 0, width: int = 0) -> pygame.Surface:
+        """A (w, h) surface holding a filled (width=0) or outlined rounded rect"""
+        w, h = int(size[0]), int(size[1])
+        color = quantize_color(color)
+        key = ("rect", w, h, color, radius, width)
+
+        def build():
+            surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, surf.get_rect(), width, border_radius=radius)
+            return surf
+        return self.get(key, build)
+
+    def circle(self, radius: int, color, width: int = 0) -> pygame.Surface:
+        """A (2r, 2r) surface holding a filled or outlined circle"""
+        radius = int(radius)
+        color = quantize_color(color)
+        key = ("circle", radius, color, width)
+
+        def build():
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (radius, radius), radius, width)
+            return surf
+        return self.get(key, build)
+
+    def blit_rounded_rect(self, target: pygame.Surface, rect, color, radius: int = 0, width: int = 0):
+        """Blend a cached rounded rect onto target at rect"""
+        rect = pygame.Rect(rect)
+        target.blit(self.rounded_rect(rect.size, color, radius, width), rect.topleft)
+
+    def blit_hbar(self, target: pygame.Surface, rect, color, radius: int = 0, width: int = 0):
+        """Blend a rounded rect whose width changes every frame (timers, progress bars)
+
+        The body is cut from a wider cached bar and the right-hand corners
+        blitted separately, which is pixel-identical to drawing the exact width
+        but needs one cached surface per bucket instead of one per pixel.
+        """
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        cap = min(radius, rect.height // 2)
+        if rect.width <= cap * 2:
+            self.blit_rounded_rect(target, rect, color, radius, width)
+            return
+        base_w = -(-rect.width // BAR_WIDTH_BUCKET) * BAR_WIDTH_BUCKET
+        base = self.rounded_rect((base_w, rect.height), color, radius, width)
+        target.blit(base, rect.topleft, (0, 0, rect.width - cap, rect.height))
+        target.blit(base, (rect.right - cap, rect.top), (base_w - cap, 0, cap, rect.height))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone exceeds the cap
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, surf = self._entries.popitem(last=False)
+            self._bytes -= self._surface_bytes(surf)
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surf: pygame.Surface) -> int:
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+# Shared instance (see get_surface_cache)
+_shared_surface_cache: Optional[SurfaceCache] = None
+_shared_lock = threading.Lock()
+
+def get_surface_cache() -> SurfaceCache:
+    """Return the process-wide SurfaceCache, creating it on first use"""
+    global _shared_surface_cache
+    if _shared_surface_cache is None:
+        with _shared_lock:
+            if _shared_surface_cache is None:
+                _shared_surface_cache = SurfaceCache()
+    return _shared_surface_cache
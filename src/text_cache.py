@@ -0,0 +1,120 @@
+# NongGameTyping/src/text_cache.py
+import string
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import pygame
+
+# Whole-string renders kept before the least recently used one is dropped
+DEFAULT_MAX_ENTRIES = 512
+
+# Characters baked into a glyph atlas; anything else falls back to the string cache
+ATLAS_CHARS = "".join(ch for ch in string.printable if ch.isprintable())
+
+class GlyphAtlas:
+    """All ATLAS_CHARS of one font and colour packed side by side in one surface
+
+    Each glyph is rendered on its own and copied in, so blitting an area of
+    the atlas gives the same pixels as font.render(ch).
+    """
+
+    def __init__(self, font: pygame.font.Font, color, chars: str = ATLAS_CHARS):
+        glyphs = [(ch, font.render(ch, True, color)) for ch in chars]
+        width = sum(glyph.get_width() for _, glyph in glyphs)
+        height = max(glyph.get_height() for _, glyph in glyphs)
+        self.surface = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+        self.rects: Dict[str, pygame.Rect] = {}
+        x = 0
+        for ch, glyph in glyphs:
+            self.surface.blit(glyph, (x, 0))
+            self.rects[ch] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+
+class TextCache:
+    """LRU cache of rendered strings plus per-colour glyph atlases
+
+    Text that does not change between frames (labels, counters, hints) is
+    rendered once and reused; typed words are assembled from glyph atlases.
+    Returned surfaces are shared, so never draw onto them.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Any, ...], pygame.Surface]" = OrderedDict()
+        self._atlases: Dict[Tuple[Any, ...], GlyphAtlas] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """Cached equivalent of font.render(text, antialias, color)"""
+        key = (font, text, tuple(color), antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def glyph_atlas(self, font: pygame.font.Font, color) -> GlyphAtlas:
+        """Return (building on first use) the atlas for font in color"""
+        key = (font, tuple(color))
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(font, color)
+            self._atlases[key] = atlas
+        return atlas
+
+    def prebake(self, font: pygame.font.Font, colors: Iterable[Any]):
+        """Build atlases up front so the first frames do not pay for them"""
+        for color in colors:
+            self.glyph_atlas(font, color)
+
+    def glyph_blit(self, font: pygame.font.Font, ch: str, color, center) -> Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]:
+        """A (source, dest, area) entry for Surface.blits drawing ch centred at center"""
+        atlas = self.glyph_atlas(font, color)
+        area = atlas.rects.get(ch)
+        if area is None:
+            source = self.render(font, ch, color)
+            area = source.get_rect()
+        else:
+            source = atlas.surface
+            self.hits += 1
+        dest = area.copy()
+        dest.center = center
+        return source, dest.topleft, area
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "atlases": len(self._atlases),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._atlases.clear()
+
+def blit_glyphs(surface: pygame.Surface, entries: List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]]):
+    """Draw glyph_blit() entries with a single Surface.blits call"""
+    surface.blits(entries, doreturn=False)
+
+# Shared instance (see get_text_cache)
+_shared_text_cache: Optional[TextCache] = None
+_shared_lock = threading.Lock()
+
+def get_text_cache() -> TextCache:
+    """Return the process-wide TextCache, creating it on first use"""
+    global _shared_text_cache
+    if _shared_text_cache is None:
+        with _shared_lock:
+            if _shared_text_cache is None:
+                _shared_text_cache = TextCache()
+    return _shared_text_cache
@@ -0,0 +1,61 @@
+# NongGameTyping/src/transitions.py
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import pygame
+
+class TransitionCompositor:
+    """Cross-fades between two scene snapshots and tints the screen
+
+    begin() copies the outgoing frame and renders the incoming scene once
+    into surfaces allocated up front; every frame of the fade is then two
+    blits, the incoming one with a surface alpha. tint() replaces the
+    full-screen SRCALPHA overlays used for flashes with one reused opaque
+    surface and set_alpha, which blends the same.
+    """
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = size
+        self._outgoing = pygame.Surface(size).convert()
+        self._incoming = pygame.Surface(size).convert()
+        self._tint = pygame.Surface(size).convert()
+        self._tint_color: Optional[Tuple[int, int, int]] = None
+        self.key: Optional[Hashable] = None
+        self.captures = 0
+
+    @property
+    def active(self) -> bool:
+        return self.key is not None
+
+    def begin(self, key: Hashable, outgoing: pygame.Surface, draw_incoming: Callable[[pygame.Surface], Any]):
+        """Snapshot both scenes unless a transition with this key is already running"""
+        if key == self.key:
+            return
+        self.key = key
+        self._outgoing.blit(outgoing, (0, 0))
+        draw_incoming(self._incoming)
+        self.captures += 1
+
+    def draw(self, surface: pygame.Surface, progress: float):
+        """Blend the snapshots; progress 0 shows the outgoing scene, 1 the incoming one"""
+        surface.blit(self._outgoing, (0, 0))
+        alpha = int(max(0.0, min(1.0, progress)) * 255)
+        if alpha:
+            self._incoming.set_alpha(alpha)
+            surface.blit(self._incoming, (0, 0))
+
+    def finish(self):
+        self.key = None
+
+    def tint(self, surface: pygame.Surface, color, alpha: float) -> Optional[pygame.Rect]:
+        """Blend a flat colour over the whole surface at the given alpha"""
+        alpha = int(alpha)
+        if alpha <= 0:
+            return None
+        color = tuple(color[:3])
+        if color != self._tint_color:
+            self._tint.fill(color)
+            self._tint_color = color
+        self._tint.set_alpha(alpha)
+        return surface.blit(self._tint, (0, 0))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"captures": self.captures, "active": self.active}
@@ -0,0 +1,103 @@
+# NongGameTyping/src/tree_sprites.py
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+import pygame
+
+# Size steps baked per growth stage
+DEFAULT_STEPS = 64
+
+# Frames are baked up front while the whole sheet fits in this budget; past it they are baked on first use
+DEFAULT_BUDGET_BYTES = 48 * 1024 * 1024
+
+# Squash (stage-change) frames kept around; the squash animation only visits a handful
+SQUASH_CACHE_SIZE = 32
+SQUASH_STEP = 0.01
+
+class TreeSpriteSheet:
+    """Pre-scaled frames of each tree growth stage, quantised by size
+
+    Each stage covers a range of size scales; the range is split into `steps`
+    evenly spaced frames and draws pick the nearest one, so smoothscale runs
+    once per frame at load instead of every game frame.
+    """
+
+    def __init__(self, images: Sequence[Optional[pygame.Surface]],
+                 scale_ranges: Sequence[Tuple[float, float]],
+                 steps: int = DEFAULT_STEPS, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.images = list(images)
+        self.scale_ranges = list(scale_ranges)
+        self.steps = steps
+        self._frames: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._squashed: "OrderedDict[Tuple[int, int, int], pygame.Surface]" = OrderedDict()
+
+        start = time.perf_counter()
+        keys = [(stage, step) for stage in range(len(self.images)) if self.images[stage] is not None
+                for step in range(self._stage_steps(stage))]
+        total = sum(self._frame_bytes(stage, step) for stage, step in keys)
+        if total <= budget_bytes:
+            for stage, step in keys:
+                self._bake(stage, step)
+            print(f"Baked {len(keys)} tree frames ({total / 1048576:.1f} MB, "
+                  f"{(time.perf_counter() - start) * 1000:.1f} ms)")
+        else:
+            print(f"Tree sheet would need {total / 1048576:.1f} MB; baking frames on first use")
+
+    def frame(self, stage: int, size_scale: float, squash: float = 1.0) -> Optional[pygame.Surface]:
+        """The frame nearest to size_scale, squashed vertically by squash (1.0 = none)"""
+        img = self.images[stage]
+        if img is None:
+            return None
+        step = self._step_for(stage, size_scale)
+        if squash >= 1.0 - SQUASH_STEP / 2:
+            return self._frames.get((stage, step)) or self._bake(stage, step)
+
+        key = (stage, step, round(squash / SQUASH_STEP))
+        surf = self._squashed.get(key)
+        if surf is not None:
+            self._squashed.move_to_end(key)
+            return surf
+        scale = self._scale_for(stage, step)
+        w, h = img.get_size()
+        # Scale from the source, not from a baked frame, to keep the quality of a single resample
+        size = (max(1, int(w * scale)), max(1, int(h * scale * key[2] * SQUASH_STEP)))
+        surf = pygame.transform.smoothscale(img, size)
+        self._squashed[key] = surf
+        if len(self._squashed) > SQUASH_CACHE_SIZE:
+            self._squashed.popitem(last=False)
+        return surf
+
+    def _stage_steps(self, stage: int) -> int:
+        low, high = self.scale_ranges[stage]
+        if high <= low or self.images[stage] is None:
+            return 1
+        # No point in more steps than there are distinct pixel sizes in the range
+        span = int(max(self.images[stage].get_size()) * (high - low))
+        return max(1, min(self.steps, span + 1))
+
+    def _step_for(self, stage: int, size_scale: float) -> int:
+        low, high = self.scale_ranges[stage]
+        steps = self._stage_steps(stage)
+        if steps == 1:
+            return 0
+        t = (min(max(size_scale, low), high) - low) / (high - low)
+        return int(round(t * (steps - 1)))
+
+    def _scale_for(self, stage: int, step: int) -> float:
+        low, high = self.scale_ranges[stage]
+        steps = self._stage_steps(stage)
+        return low if steps == 1 else low + (high - low) * step / (steps - 1)
+
+    def _frame_size(self, stage: int, step: int) -> Tuple[int, int]:
+        w, h = self.images[stage].get_size()
+        scale = self._scale_for(stage, step)
+        return max(1, int(w * scale)), max(1, int(h * scale))
+
+    def _frame_bytes(self, stage: int, step: int) -> int:
+        w, h = self._frame_size(stage, step)
+        return w * h * 4
+
+    def _bake(self, stage: int, step: int) -> pygame.Surface:
+        surf = pygame.transform.smoothscale(self.images[stage], self._frame_size(stage, step))
+        self._frames[(stage, step)] = surf
+        return surf
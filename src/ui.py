@@ -1,20 +1,48 @@
 import pygame
 import math
-import os
 import random
 from .explosion_particles import FireworkExplosion
 from .diamond_button import DiamondButton
-from .data_manager import DataManager
+from .data_manager import get_data_manager
+from .surface_cache import get_surface_cache, quantize_color
+from .text_cache import get_text_cache, blit_glyphs
+from .font_registry import get_font_registry
+from .image_cache import get_image_cache
+from .tree_sprites import TreeSpriteSheet
+from .animation_clock import ticks
+from .background_layer import BackgroundCompositor, DEFAULT_AMBIENT_FPS
+from .transitions import TransitionCompositor
+
+# ขั้นการเติบโตของต้นไม้ (ช่วง growth_percent ของแต่ละภาพ tree1-4)
+TREE_STAGE_BOUNDS = ((0, 25), (25, 50), (50, 75), (75, 100))
+
+def tree_stage(growth_percent):
+    """ขั้นของต้นไม้ (0-3) ตาม growth_percent"""
+    for idx, (_, upper) in enumerate(TREE_STAGE_BOUNDS[:-1]):
+        if growth_percent < upper:
+            return idx
+    return len(TREE_STAGE_BOUNDS) - 1
+
+def tree_size_scale(growth_percent):
+    """ขนาดต้นไม้เทียบกับภาพต้นฉบับ"""
+    growth_factor = max(0.3, min(1.0, growth_percent / 100))
+    return 0.4 + 0.6 * growth_factor
 
 class UIManager:
     """จัดการการวาดองค์ประกอบ UI ทั้งหมด - ปรับปรุงแล้ว"""
-    def __init__(self, screen_width, screen_height, sound_manager=None):
+    def __init__(self, screen_width, screen_height, sound_manager=None, ambient_fps=DEFAULT_AMBIENT_FPS):
         # --- ค่าคงที่ ---
         self.SCREEN_WIDTH = screen_width
         self.SCREEN_HEIGHT = screen_height
         
         # Initialize data manager for asset paths
-        self.data_manager = DataManager()
+        self.data_manager = get_data_manager()
+        
+        # surface โปร่งใสที่ใช้วาดซ้ำทุกเฟรม (กล่อง, แถบ, อนุภาค) เก็บไว้ใช้ร่วมกัน
+        self.surface_cache = get_surface_cache()
+        
+        # โหมด dirty rect (GameManager ตั้งค่าให้ถ้าเปิดใน settings): แต่ละส่วนรายงานพื้นที่ที่วาด
+        self.dirty_rects = None
         
         # Get asset paths from data manager
         self.FONT_PATH = self.data_manager.get_assets_path("fonts", "PressStart2P-Regular.ttf")
@@ -36,42 +64,46 @@ class UIManager:
         self.COLOR_WARNING = (242, 245, 125)
         self.COLOR_INFO = (242, 245, 125)
 
-        # --- โหลดฟอนต์ ---
+        # --- โหลดฟอนต์ (ผ่าน font registry ใช้ร่วมกันทั้งเกม) ---
+        fonts = get_font_registry()
         try:
-            self.font_xlarge = pygame.font.Font(self.FONT_PATH_X, 64)
-            self.font_large = pygame.font.Font(self.FONT_PATH, 32)
-            self.font_medium = pygame.font.Font(self.FONT_PATH, 24)
-            self.font_small = pygame.font.Font(self.FONT_PATH, 18)
-            self.font_tiny = pygame.font.Font(self.FONT_PATH, 12)
+            self.font_xlarge = fonts.get(self.FONT_PATH_X, 64)
+            self.font_large = fonts.get(self.FONT_PATH, 32)
+            self.font_medium = fonts.get(self.FONT_PATH, 24)
+            self.font_small = fonts.get(self.FONT_PATH, 18)
+            self.font_tiny = fonts.get(self.FONT_PATH, 12)
         except FileNotFoundError:
             print(f"Font file not found. Using default fonts.")
-            self.font_xlarge = pygame.font.Font(None, 96)
-            self.font_large = pygame.font.Font(None, 64)
-            self.font_medium = pygame.font.Font(None, 32)
-            self.font_small = pygame.font.Font(None, 24)
-            self.font_tiny = pygame.font.Font(None, 18)
+            self.font_xlarge = fonts.get(None, 96)
+            self.font_large = fonts.get(None, 64)
+            self.font_medium = fonts.get(None, 32)
+            self.font_small = fonts.get(None, 24)
+            self.font_tiny = fonts.get(None, 18)
+        
+        # ข้อความที่ไม่เปลี่ยนทุกเฟรมใช้ cache; ตัวอักษรของคำที่พิมพ์ใช้ glyph atlas ที่อบไว้ล่วงหน้า
+        self.text_cache = get_text_cache()
+        self.text_cache.prebake(self.font_xlarge, [self.COLOR_SUCCESS, self.COLOR_ERROR,
+                                                   self.COLOR_INFO, self.COLOR_TEXT_SECONDARY])
             
-        # --- โหลดรูปภาพพื้นหลัง ---
-        self.background_image = None
-        try:
-            bg_path = self.data_manager.get_assets_path("images", "bg.png")
-            if os.path.exists(bg_path):
-                self.background_image = pygame.image.load(bg_path).convert()
-                # ปรับขนาดให้พอดีกับหน้าจอ
-                self.background_image = pygame.transform.smoothscale(
-                    self.background_image, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
-                )
-                print(f"Background image loaded successfully: {bg_path}")
-            else:
-                print(f"Background image not found: {bg_path}")
-        except Exception as e:
-            print(f"Error loading background image: {e}")
+        # --- โหลดรูปภาพพื้นหลัง (ย่อให้พอดีกับหน้าจอ) ผ่าน image cache ---
+        self.image_cache = get_image_cache()
+        bg_path = self.data_manager.get_assets_path("images", "bg.png")
+        self.background_image = self.image_cache.acquire(bg_path, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT), alpha=False)
+        if self.background_image is not None:
+            print(f"Background image loaded successfully: {bg_path}")
+        # พื้นหลัง + ประกายลอยรวมเป็น layer เดียว วาดใหม่แค่ ambient_fps ครั้งต่อวินาที
+        self.background = BackgroundCompositor((self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
+                                               self.background_image, ambient_fps)
+        # surface เต็มจอสำหรับ fade/แฟลช จองไว้ครั้งเดียวแล้วใช้ซ้ำ
+        self.transitions = TransitionCompositor((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
             
         # --- Animation Variables ---
         self.success_effect_alpha = 0
         self.current_success_color = (50, 255, 50, 128)
         self.plant_growth = 0.0
         self.animation_time = 0.0
+        # เวลาที่ใช้วาด = เวลาจำลองล่าสุด + ส่วนที่ยังไม่ได้จำลอง (interpolation ระหว่าง step)
+        self.draw_time = 0.0
         
         # --- UI Animation Variables ---
         self.ui_bounce_scale = 1.0
@@ -84,11 +116,12 @@ class UIManager:
         self.tree_images = []
         for idx in range(1, 5):
             path = self.data_manager.get_assets_path("images", f"Tree_Growain/tree{idx}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                self.tree_images.append(img)
-            else:
-                self.tree_images.append(None)
+            self.tree_images.append(self.image_cache.acquire(path))
+        # ย่อภาพแต่ละขั้นไว้ล่วงหน้าตามช่วงขนาดที่ขั้นนั้นเป็นไปได้ แทนการ smoothscale ทุกเฟรม
+        self.tree_sheet = TreeSpriteSheet(
+            self.tree_images,
+            [(tree_size_scale(low), tree_size_scale(high)) for low, high in TREE_STAGE_BOUNDS]
+        )
         
         self.current_tree_index = 0
         self.tree_anim_scale = 1.0
@@ -106,27 +139,15 @@ class UIManager:
 
         # --- DiamondButton (Gacha) ---
         gacha_icon_path = self.data_manager.get_assets_path("images", "icon_gacha.png")
-        self.gacha_icon = None
-        if os.path.exists(gacha_icon_path):
-            try:
-                self.gacha_icon = pygame.image.load(gacha_icon_path).convert_alpha()
-            except Exception as e:
-                print(f"Error loading gacha icon: {e}")
-                self.gacha_icon = self._create_gacha_icon()
-        else:
+        self.gacha_icon = self.image_cache.acquire(gacha_icon_path)
+        if self.gacha_icon is None:
             # Create a programmatic gacha icon
             self.gacha_icon = self._create_gacha_icon()
         
         # --- DiamondButton (Collection) ---
         collection_icon_path = self.data_manager.get_assets_path("images", "icon_collection.png")
-        self.collection_icon = None
-        if os.path.exists(collection_icon_path):
-            try:
-                self.collection_icon = pygame.image.load(collection_icon_path).convert_alpha()
-            except Exception as e:
-                print(f"Error loading collection icon: {e}")
-                self.collection_icon = self._create_collection_icon()
-        else:
+        self.collection_icon = self.image_cache.acquire(collection_icon_path)
+        if self.collection_icon is None:
             # Create a programmatic collection icon
             self.collection_icon = self._create_collection_icon()
         
@@ -143,10 +164,13 @@ class UIManager:
         self.collection_button = DiamondButton(btn2_x + btn_size//2, btn2_y + btn_size//2, btn_size, self.collection_icon, sound_manager=self.sound_manager)
 
     def update(self, dt):
-        """อัปเดตแอนิเมชันทั้งหมด"""
+        """อัปเดตแอนิเมชันทั้งหมด (เรียกทุก step ของ simulation clock)"""
         self.animation_time += dt
         # อัปเดต explosion particles
         self.firework.update(dt)
+        # เลเยอร์สีตอนพิมพ์ถูก/ผิดจางลง 3 ต่อ tick
+        if self.success_effect_alpha > 0:
+            self.success_effect_alpha = max(0, self.success_effect_alpha - 3 * ticks(dt))
         # อัปเดต UI animations
         self.ui_pulse_alpha = abs(math.sin(self.animation_time * 3)) * 50
         # อัปเดต tree sway
@@ -159,20 +183,22 @@ class UIManager:
         self.gacha_button.update_animation(dt)
         self.collection_button.update_animation(dt)
 
-    def draw_background_image(self, surface):
-        """วาดรูปภาพพื้นหลัง"""
-        if self.background_image:
-            surface.blit(self.background_image, (0, 0))
-        else:
-            # หากไม่มีรูปภาพพื้นหลัง ให้ใช้สีพื้นหลังธรรมดา
-            surface.fill((25, 25, 40))
+    def draw_background_image(self, surface, area=None, ambient=False):
+        """วาดรูปภาพพื้นหลัง (ระบุ area เพื่อคืนพื้นหลังเฉพาะส่วนนั้น, ambient=True รวมประกายลอยด้วย)"""
+        # หากไม่มีรูปภาพพื้นหลัง layer จะเป็นสีพื้นหลังธรรมดา
+        self.background.draw(surface, area, ambient)
+
+    def _mark_dirty(self, rect, name=None, state=None):
+        """รายงานพื้นที่ที่วาดในเฟรมนี้ (ไม่ทำอะไรถ้าไม่ได้เปิดโหมด dirty rect)"""
+        if self.dirty_rects is not None:
+            self.dirty_rects.mark(rect, name, state)
 
     def draw_gradient_bg(self, surface):
         """วาดพื้นหลังแบบไล่สี (ใช้รูปภาพแทน)"""
         self.draw_background_image(surface)
 
     def draw_modern_box(self, surface, rect, color=None, border_color=None, corner_radius=None, shadow=True):
-        """วาดกล่องสไตล์โมเดิร์น"""
+        """วาดกล่องสไตล์โมเดิร์น คืนค่าพื้นที่ที่วาดรวมเงา"""
         if color is None:
             color = self.COLOR_BOX_BG
         if border_color is None:
@@ -181,30 +207,36 @@ class UIManager:
             corner_radius = self.CORNER_RADIUS
             
         # วาดเงา
+        drawn_rect = pygame.Rect(rect)
         if shadow:
             shadow_rect = rect.move(self.SHADOW_OFFSET, self.SHADOW_OFFSET)
-            shadow_surf = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surf, (0, 0, 0, 80), shadow_surf.get_rect(), border_radius=corner_radius)
-            surface.blit(shadow_surf, shadow_rect.topleft)
-        
-        # วาดกล่องหลัก
-        box_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(box_surf, color, box_surf.get_rect(), border_radius=corner_radius)
-        pygame.draw.rect(box_surf, border_color, box_surf.get_rect(), 2, border_radius=corner_radius)
-        
+            self.surface_cache.blit_rounded_rect(surface, shadow_rect, (0, 0, 0, 80), corner_radius)
+            drawn_rect.union_ip(shadow_rect)
+        
+        # วาดกล่องหลัก (พื้น + ขอบ ประกอบครั้งเดียวแล้วเก็บไว้ใน cache)
+        fill = quantize_color(color)
+        border = quantize_color(border_color)
+        def build_box():
+            box_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+            pygame.draw.rect(box_surf, fill, box_surf.get_rect(), border_radius=corner_radius)
+            pygame.draw.rect(box_surf, border, box_surf.get_rect(), 2, border_radius=corner_radius)
+            return box_surf
+        box_surf = self.surface_cache.get(("modern_box", rect.size, fill, border, corner_radius), build_box)
         surface.blit(box_surf, rect.topleft)
+        return drawn_rect
 
     def draw_glass_panel(self, surface, rect, alpha=80):
         """วาดกล่องสไตล์ glass (โปร่งใส/ขาวเบลอ)"""
-        glass_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        # สีขาวโปร่งใส
-        glass_surf.fill((255, 255, 255, alpha))
-        # เพิ่มขอบขาวบางๆ
-        pygame.draw.rect(glass_surf, (255, 255, 255, min(120, alpha+40)), glass_surf.get_rect(), 2, border_radius=24)
+        def build_glass():
+            glass_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+            # สีขาวโปร่งใส
+            glass_surf.fill((255, 255, 255, alpha))
+            # เพิ่มขอบขาวบางๆ
+            pygame.draw.rect(glass_surf, (255, 255, 255, min(120, alpha+40)), glass_surf.get_rect(), 2, border_radius=24)
+            return glass_surf
+        glass_surf = self.surface_cache.get(("glass_panel", rect.size, alpha), build_glass)
         # เพิ่มเงาเบาๆ
-        shadow = pygame.Surface((rect.width+12, rect.height+12), pygame.SRCALPHA)
-        pygame.draw.rect(shadow, (0,0,0,40), shadow.get_rect(), border_radius=28)
-        surface.blit(shadow, (rect.x-6, rect.y-6))
+        self.surface_cache.blit_rounded_rect(surface, rect.inflate(12, 12), (0, 0, 0, 40), 28)
         surface.blit(glass_surf, rect.topleft)
 
     def draw_animated_timer(self, surface, current_time, max_time, x, y, w, h=None):
@@ -213,9 +245,8 @@ class UIManager:
             h = 8
         ratio = max(0, min(1, current_time / max_time))
         bg_rect = pygame.Rect(x, y, w, h)
-        bg_surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surf, (*self.COLOR_ACCENT[:3], 100), bg_surf.get_rect(), border_radius=h//4)
-        surface.blit(bg_surf, bg_rect.topleft)
+        self.surface_cache.blit_rounded_rect(surface, bg_rect, (*self.COLOR_ACCENT[:3], 100), h//4)
+        state = None
         if ratio > 0:
             fill_w = max(h, int(w * ratio))
             fill_rect = pygame.Rect(x, y, fill_w, h)
@@ -226,32 +257,33 @@ class UIManager:
             else:
                 color = self.COLOR_ERROR
             if ratio < 0.3:
-                pulse = abs(math.sin(self.animation_time * 8)) * 0.3 + 0.7
+                pulse = abs(math.sin(self.draw_time * 8)) * 0.3 + 0.7
                 color = tuple(int(c * pulse) for c in color)
-            fill_surf = pygame.Surface((fill_w, h), pygame.SRCALPHA)
-            pygame.draw.rect(fill_surf, color, fill_surf.get_rect(), border_radius=h//4)
-            glow_surf = pygame.Surface((fill_w + 6, h + 6), pygame.SRCALPHA)
             glow_color = (*color[:3], 50)
-            pygame.draw.rect(glow_surf, glow_color, glow_surf.get_rect(), border_radius=(h+6)//4)
-            surface.blit(glow_surf, (x - 3, y - 3))
-            surface.blit(fill_surf, fill_rect.topleft)
+            self.surface_cache.blit_hbar(surface, fill_rect.inflate(6, 6), glow_color, (h+6)//4)
+            # สีทึบวาดลงจอตรงๆ ได้ ไม่ต้องมี surface ชั่วคราว
+            pygame.draw.rect(surface, color[:3], fill_rect, border_radius=h//4)
+            state = (fill_w, color)
+        # แสงเรืองของแถบล้นออกไปรอบละ 3px
+        self._mark_dirty(bg_rect.inflate(6, 6), "timer", state)
 
     def draw_combo_display(self, surface, combo_manager, x, y):
         """วาดการแสดงคอมโบแบบพิเศษ"""
         combo_text = combo_manager.get_display_value()
         box_rect = pygame.Rect(x, y, 240, 80)
-        self.draw_modern_box(surface, box_rect)
-        combo_surf = self.font_medium.render(combo_text, True, self.COLOR_WARNING)
+        drawn_rect = self.draw_modern_box(surface, box_rect)
+        combo_surf = self.text_cache.render(self.font_medium, combo_text, self.COLOR_WARNING)
         combo_rect = combo_surf.get_rect(center=(box_rect.centerx, box_rect.centery))
         surface.blit(combo_surf, combo_rect)
+        self._mark_dirty(drawn_rect.union(combo_rect), "combo", combo_text)
 
     def draw_money_display(self, surface, money_manager, x=None, y=None):
         """วาดการแสดงเงินแบบพิเศษ (กล่องชิดขวาบน, ข้อความชิดขวา, ขนาดพอดี)"""
         money_text = money_manager.get_display_value()
         
         # เตรียม surface ของข้อความและไอคอน
-        money_surf = self.font_medium.render(money_text, True, (255, 223, 0))
-        symbol_surf = self.font_small.render("¢", True, (200, 150, 0))
+        money_surf = self.text_cache.render(self.font_medium, money_text, (255, 223, 0))
+        symbol_surf = self.text_cache.render(self.font_small, "¢", (200, 150, 0))
         
         padding_x = 18
         padding_y = 10
@@ -267,11 +299,11 @@ class UIManager:
         if y is None:
             y = 8
         box_rect = pygame.Rect(x, y, box_w, box_h)
-        self.draw_modern_box(surface, box_rect, color=(50, 50, 30, 200))
+        drawn_rect = self.draw_modern_box(surface, box_rect, color=(50, 50, 30, 200))
         
         # วาดไอคอนเหรียญ (ชิดซ้าย)
         coin_center = (box_rect.left + padding_x + icon_diameter // 2, box_rect.centery)
-        coin_bounce = math.sin(self.animation_time * 6) * 2
+        coin_bounce = math.sin(self.draw_time * 6) * 2
         coin_y = coin_center[1] + coin_bounce
         pygame.draw.circle(surface, (255, 215, 0), (coin_center[0], int(coin_y)), 18)
         pygame.draw.circle(surface, (255, 165, 0), (coin_center[0], int(coin_y)), 18, 3)
@@ -284,6 +316,7 @@ class UIManager:
         money_rect.centery = box_rect.centery
         money_rect.right = box_rect.right - padding_x
         surface.blit(money_surf, money_rect)
+        self._mark_dirty(drawn_rect.union(money_rect), "money", (money_text, int(coin_y)))
 
     def draw_enhanced_input_feedback(self, surface, target_word, user_input, center_pos):
         """วาดการแสดงผลการพิมพ์แบบโมเดิร์นขาวเท่ (แต่ใช้พื้นหลังสีเดิม) และแสดงตัวอักษรเป็นตัวใหญ่เสมอ ไม่มีวงกลมเรืองแสงหลังตัวอักษร"""
@@ -292,13 +325,13 @@ class UIManager:
         total_width = len(target_word) * char_spacing + 40
         bg_rect = pygame.Rect(x - total_width//2, y - 80, total_width, 160)
         # ใช้กล่องสีเข้มแบบเดิม
-        self.draw_modern_box(surface, bg_rect, color=(20, 20, 20, 150))
-        focus_radius = 30 + abs(math.sin(self.animation_time * 4)) * 20
-        focus_surf = pygame.Surface((int(focus_radius * 2), int(focus_radius * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(focus_surf, (*self.COLOR_INFO[:3], 30), (int(focus_radius), int(focus_radius)), int(focus_radius), 3)
+        drawn_rect = self.draw_modern_box(surface, bg_rect, color=(20, 20, 20, 150))
+        focus_radius = 30 + abs(math.sin(self.draw_time * 4)) * 20
+        focus_surf = self.surface_cache.circle(int(focus_radius), (*self.COLOR_INFO[:3], 30), 3)
         surface.blit(focus_surf, (x - int(focus_radius), y - int(focus_radius)))
-        # วาด firework ก่อนตัวอักษร
-        self.firework.draw(surface)
+        # วาด firework ก่อนตัวอักษร (ประกายไฟกระเด็นออกนอกกล่องได้ จึงรายงานแยก)
+        self._mark_dirty(self.firework.draw(surface))
+        glyphs = []
         for i, ch in enumerate(target_word.upper()):
             char_x = x - (len(target_word)-1) * char_spacing // 2 + i * char_spacing
             char_y = y
@@ -307,7 +340,7 @@ class UIManager:
             if i < len(user_input):
                 if user_input[i].upper() == ch:
                     color = self.COLOR_SUCCESS
-                    bounce = math.sin(self.animation_time * 6 + i) * 5
+                    bounce = math.sin(self.draw_time * 6 + i) * 5
                     char_key = (target_word, i)
                     if char_key not in self.last_exploded_chars:
                         self.firework.explode(char_x, char_y, base_color=self.COLOR_SUCCESS, count=8)
@@ -321,13 +354,16 @@ class UIManager:
                     color = self.COLOR_ERROR
             elif i == len(user_input):
                 color = self.COLOR_INFO
-                bounce = math.sin(self.animation_time * 4) * 8
+                bounce = math.sin(self.draw_time * 4) * 8
             else:
                 color = self.COLOR_TEXT_SECONDARY
             char_y += bounce
-            char_surf = self.font_xlarge.render(ch, True, color)
-            char_rect = char_surf.get_rect(center=(char_x, char_y))
-            surface.blit(char_surf, char_rect)
+            glyphs.append(self.text_cache.glyph_blit(self.font_xlarge, ch, color, (char_x, char_y)))
+        blit_glyphs(surface, glyphs)
+        for source, dest, area in glyphs:
+            drawn_rect.union_ip(pygame.Rect(dest, area.size))
+        # ตัวอักษรเด้งและวงโฟกัสขยับทุกเฟรม
+        self._mark_dirty(drawn_rect, "input")
 
     def trigger_success_effect(self, color=None):
         """เริ่มเอฟเฟกต์ความสำเร็จ"""
@@ -360,23 +396,13 @@ class UIManager:
     def draw_success_overlay(self, surface):
         """วาดเลเยอร์ซ้อนทับเมื่อสำเร็จ"""
         if self.success_effect_alpha > 0:
-            overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
-            color_with_alpha = (*self.current_success_color[:3], self.success_effect_alpha)
-            overlay.fill(color_with_alpha)
-            surface.blit(overlay, (0, 0))
-            self.success_effect_alpha -= 3
+            self._mark_dirty(self.transitions.tint(surface, self.current_success_color, self.success_effect_alpha))
 
-    def update_tree_animation(self, growth_percent):
-        """อัปเดตแอนิเมชันต้นไม้"""
+    def update_tree_animation(self, growth_percent, dt=1 / 60):
+        """อัปเดตแอนิเมชันต้นไม้ (ยุบ/ขยายตอนเปลี่ยนขั้น 0.1 ต่อ tick)"""
+        step = 0.1 * ticks(dt)
         # กำหนดขั้นตอนการเติบโต
-        if growth_percent < 25:
-            idx = 0
-        elif growth_percent < 50:
-            idx = 1
-        elif growth_percent < 75:
-            idx = 2
-        else:
-            idx = 3
+        idx = tree_stage(growth_percent)
         
         # เปลี่ยนขั้นตอนการเติบโต
         if idx != self.current_tree_index:
@@ -386,13 +412,13 @@ class UIManager:
         
         # อัปเดตแอนิเมชันการเปลี่ยนขนาด
         if self.tree_anim_direction == -1:
-            self.tree_anim_timer += 0.1
+            self.tree_anim_timer += step
             self.tree_anim_scale = max(0.3, 1.0 - self.tree_anim_timer)
             if self.tree_anim_scale <= 0.31:
                 self.tree_anim_direction = 1
                 self.tree_anim_timer = 0.0
         elif self.tree_anim_direction == 1:
-            self.tree_anim_timer += 0.1
+            self.tree_anim_timer += step
             self.tree_anim_scale = min(1.0, 0.3 + self.tree_anim_timer)
             if self.tree_anim_scale >= 0.99:
                 self.tree_anim_direction = 0
@@ -401,33 +427,23 @@ class UIManager:
     def draw_enhanced_tree(self, surface, growth_percent):
         """วาดต้นไม้แบบปรับปรุง"""
         # กำหนดขั้นตอนการเติบโต
-        if growth_percent < 25:
-            idx = 0
-        elif growth_percent < 50:
-            idx = 1
-        elif growth_percent < 75:
-            idx = 2
-        else:
-            idx = 3
-        
-        img = self.tree_images[idx]
+        idx = tree_stage(growth_percent)
         scale = self.tree_anim_scale
         
         # คำนวณขนาดต้นไม้
-        growth_factor = max(0.3, min(1.0, growth_percent / 100))
-        size_scale = 0.4 + 0.6 * growth_factor
+        size_scale = tree_size_scale(growth_percent)
         
-        if img:
-            w, h = img.get_width(), img.get_height()
-            new_w = max(1, int(w * size_scale))
-            new_h = max(1, int(h * size_scale * scale))
+        # เฟรมที่ย่อไว้แล้วซึ่งใกล้ขนาดนี้ที่สุด
+        tree_img = self.tree_sheet.frame(idx, size_scale, scale)
+        if tree_img:
+            new_w, new_h = tree_img.get_size()
             
             # เพิ่มการโยกไหวเล็กน้อย
             x = self.SCREEN_WIDTH // 2 - new_w // 2 + int(self.tree_sway_offset)
             y = int(self.SCREEN_HEIGHT * 0.95 - new_h)
             
-            tree_img = pygame.transform.smoothscale(img, (new_w, new_h))
             surface.blit(tree_img, (x, y))
+            self._mark_dirty(pygame.Rect(x, y, new_w, new_h), "tree", (id(tree_img), x, y))
         else:
             # วาดต้นไม้ง่ายๆ หากไม่มีภาพ
             x = self.SCREEN_WIDTH // 2 + int(self.tree_sway_offset)
@@ -440,9 +456,11 @@ class UIManager:
             pygame.draw.circle(surface, self.COLOR_SUCCESS, (x, y), radius)
             
             # วาดเครื่องหมายคำถาม
-            question_surf = self.font_large.render("?", True, self.COLOR_TEXT)
+            question_surf = self.text_cache.render(self.font_large, "?", self.COLOR_TEXT)
             question_rect = question_surf.get_rect(center=(x, y))
             surface.blit(question_surf, question_rect)
+            tree_rect = pygame.Rect(x - radius, y - radius, radius * 2 + 4, radius * 2 + 4)
+            self._mark_dirty(tree_rect.union(question_rect), "tree", (x, y, radius))
 
     def draw_enhanced_growth_bar(self, surface, growth):
         """วาดแถบการเติบโตแบบโมเดิร์นขาวเท่"""
@@ -450,26 +468,20 @@ class UIManager:
         bar_h = 16
         x = self.SCREEN_WIDTH // 2 - bar_w // 2
         y = self.SCREEN_HEIGHT - bar_h - 50
-        glow_alpha = int(abs(math.sin(self.animation_time * 2)) * 30 + 20)
+        glow_alpha = int(abs(math.sin(self.draw_time * 2)) * 30 + 20)
         glow_rect = pygame.Rect(x - 4, y - 4, bar_w + 8, bar_h + 8)
-        glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surf, (255, 255, 255, glow_alpha), glow_surf.get_rect(), border_radius=12)
-        surface.blit(glow_surf, glow_rect.topleft)
+        self.surface_cache.blit_rounded_rect(surface, glow_rect, (255, 255, 255, glow_alpha), 12)
         bg_rect = pygame.Rect(x, y, bar_w, bar_h)
-        bg_surf = pygame.Surface((bar_w, bar_h), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surf, (220, 220, 220, 120), bg_surf.get_rect(), border_radius=8)
-        surface.blit(bg_surf, bg_rect.topleft)
+        self.surface_cache.blit_rounded_rect(surface, bg_rect, (220, 220, 220, 120), 8)
         fill_w = int(bar_w * min(1.0, max(0.0, growth)))
         if fill_w > 0:
             actual_fill_w = max(8, fill_w - 4)
             fill_rect = pygame.Rect(x + 2, y + 2, actual_fill_w, bar_h - 4)
-            wave_offset = math.sin(self.animation_time * 4) * 0.1
+            wave_offset = math.sin(self.draw_time * 4) * 0.1
             base_alpha = 220 + int(wave_offset * 35)
-            fill_surf = pygame.Surface((actual_fill_w, bar_h - 4), pygame.SRCALPHA)
-            pygame.draw.rect(fill_surf, (255, 255, 255, base_alpha), fill_surf.get_rect(), border_radius=6)
-            surface.blit(fill_surf, fill_rect.topleft)
+            self.surface_cache.blit_hbar(surface, fill_rect, (255, 255, 255, base_alpha), 6)
             if growth > 0.05:
-                sparkle_pos = int((actual_fill_w - 20) * abs(math.sin(self.animation_time * 3)))
+                sparkle_pos = int((actual_fill_w - 20) * abs(math.sin(self.draw_time * 3)))
                 sparkle_x = x + 2 + sparkle_pos
                 sparkle_y = y + bar_h // 2
                 for i in range(3):
@@ -477,32 +489,31 @@ class UIManager:
                     sparkle_alpha = 255 - i * 80
                     pygame.draw.circle(surface, (255, 255, 255, sparkle_alpha), 
                                      (sparkle_x + offset, sparkle_y), 2 - i)
-        border_surf = pygame.Surface((bar_w, bar_h), pygame.SRCALPHA)
-        pygame.draw.rect(border_surf, (255, 255, 255, 80), border_surf.get_rect(), 1, border_radius=8)
-        surface.blit(border_surf, bg_rect.topleft)
+        self.surface_cache.blit_rounded_rect(surface, bg_rect, (255, 255, 255, 80), 8, 1)
+        # แสงเรืองและประกายเคลื่อนที่ทุกเฟรม
+        self._mark_dirty(glow_rect, "growth_bar")
 
     def draw_all(self, surface, game_state):
-        """วาดทุกอย่างด้วยเลย์เอาต์ใหม่"""
-        dt = 1/60  # สมมติ 60 FPS
-        self.update(dt)
+        """วาดทุกอย่างด้วยเลย์เอาต์ใหม่ (การอัปเดตอยู่ใน update/update_tree_animation ตาม simulation clock)"""
+        self.draw_time = self.animation_time + game_state.get('render_lag', 0.0)
         
-        # วาดพื้นหลัง (ใช้รูปภาพแทน gradient และดิน)
-        self.draw_background_image(surface)
-        particle_time = pygame.time.get_ticks() / 1000.0
-        for i in range(20):
-            x = (i * 137 + particle_time * 20) % self.SCREEN_WIDTH
-            y = (i * 47 + math.sin(particle_time + i) * 30) % self.SCREEN_HEIGHT
-            alpha = int(abs(math.sin(particle_time + i)) * 100 + 50)
-            particle_surf = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (255, 255, 255, alpha), (3, 3), 3)
-            surface.blit(particle_surf, (x, y))
+        # วาดพื้นหลังพร้อมประกายลอย (layer ที่รวมไว้แล้ว อัปเดตตาม ambient_fps)
+        changed = self.background.refresh(self.draw_time)
+        if self.dirty_rects is None:
+            self.draw_background_image(surface, ambient=True)
+        else:
+            # คืนพื้นหลังเฉพาะส่วนที่เฟรมก่อนวาดทับ และส่วนที่ประกายย้ายไป
+            for rect in self.dirty_rects.restore_rects():
+                self.draw_background_image(surface, rect, ambient=True)
+            for rect in changed:
+                self.draw_background_image(surface, rect, ambient=True)
+                self._mark_dirty(rect)
         
         # วาดเอฟเฟกต์ความสำเร็จ
         self.draw_success_overlay(surface)
         
         # วาดต้นไม้
         growth_percent = game_state.get('plant_growth', 0.0) * 100
-        self.update_tree_animation(growth_percent)
         self.draw_enhanced_tree(surface, growth_percent)
         
         # วาดการป้อนข้อมูล (ตรงกลางจอ)
@@ -530,18 +541,20 @@ class UIManager:
         self.draw_animated_timer(surface, game_state['timer'], game_state['max_time'], 
                                timer_x, timer_y, timer_w, timer_h)
         
-        # วาดปุ่มกาชามุมล่างขวา
-        self.gacha_button.draw(surface)
+        # วาดปุ่มกาชามุมล่างขวา (ปุ่มที่หยุดนิ่งไม่ต้องส่งขึ้นจอใหม่)
+        gacha_state = None if self.gacha_button.is_animating() else "idle"
+        self._mark_dirty(self.gacha_button.draw(surface), "gacha_button", gacha_state)
         # วาดปุ่มกาชาตัวที่สองมุมซ้ายล่าง
-        self.collection_button.draw(surface)
+        collection_state = None if self.collection_button.is_animating() else "idle"
+        self._mark_dirty(self.collection_button.draw(surface), "collection_button", collection_state)
 
     def draw_gacha_coin_display(self, surface, money_manager):
         """วาดการแสดง coin สำหรับหน้า gacha (มุมขวาบน)"""
         money_text = money_manager.get_display_value()
         
         # เตรียม surface ของข้อความและไอคอน
-        money_surf = self.font_medium.render(money_text, True, (255, 223, 0))
-        symbol_surf = self.font_small.render("¢", True, (200, 150, 0))
+        money_surf = self.text_cache.render(self.font_medium, money_text, (255, 223, 0))
+        symbol_surf = self.text_cache.render(self.font_small, "¢", (200, 150, 0))
         
         padding_x = 18
         padding_y = 10
@@ -559,7 +572,7 @@ class UIManager:
         
         # วาดไอคอนเหรียญ (ชิดซ้าย)
         coin_center = (box_rect.left + padding_x + icon_diameter // 2, box_rect.centery)
-        coin_bounce = math.sin(self.animation_time * 6) * 2
+        coin_bounce = math.sin(self.draw_time * 6) * 2
         coin_y = coin_center[1] + coin_bounce
         pygame.draw.circle(surface, (255, 215, 0), (coin_center[0], int(coin_y)), 18)
         pygame.draw.circle(surface, (255, 165, 0), (coin_center[0], int(coin_y)), 18, 3)
@@ -595,7 +608,7 @@ class UIManager:
         # Create a book/collection icon using text
         try:
             # Try to use a large font for the icon
-            icon_font = pygame.font.Font(None, 80)
+            icon_font = get_font_registry().get(None, 80)
             icon_text = "📚"  # Book emoji for collection
             text_surface = icon_font.render(icon_text, True, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(icon_size//2, icon_size//2))
@@ -617,7 +630,7 @@ class UIManager:
         # Create a gacha icon using text
         try:
             # Try to use a large font for the icon
-            icon_font = pygame.font.Font(None, 80)
+            icon_font = get_font_registry().get(None, 80)
             icon_text = "🎲"  # Dice emoji for gacha
             text_surface = icon_font.render(icon_text, True, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(icon_size//2, icon_size//2))
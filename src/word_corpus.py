@@ -0,0 +1,88 @@
+# NongGameTyping/src/word_corpus.py
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Optional
+
+# File layout: header, (count + 1) native uint64 offsets into the blob, packed UTF-8 blob
+MAGIC = b"NGWC"
+VERSION = 1
+_HEADER = struct.Struct("<4sIcxxxQQq")  # magic, version, byteorder, count, source size, source mtime_ns
+_BYTEORDER = b"<" if sys.byteorder == "little" else b">"
+
+def compile_corpus(words: Iterable[str], path: str, source_path: Optional[str] = None) -> int:
+    """Pack words into a corpus file at path; return the number of words written
+
+    The source file's size and mtime are recorded so is_current() can tell
+    when the corpus needs rebuilding.
+    """
+    blob = bytearray()
+    offsets = array("Q", [0])
+    for word in words:
+        blob += str(word).encode("utf-8")
+        offsets.append(len(blob))
+    count = len(offsets) - 1
+
+    source_size, source_mtime = 0, 0
+    if source_path is not None:
+        st = os.stat(source_path)
+        source_size, source_mtime = st.st_size, st.st_mtime_ns
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, _BYTEORDER, count, source_size, source_mtime))
+        offsets.tofile(f)
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return count
+
+def is_current(path: str, source_path: str) -> bool:
+    """Check whether a corpus file exists and was built from the current source file"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+        magic, version, byteorder, _, source_size, source_mtime = _HEADER.unpack(header)
+        st = os.stat(source_path)
+    except (OSError, struct.error):
+        return False
+    return (magic == MAGIC and version == VERSION and byteorder == _BYTEORDER
+            and source_size == st.st_size and source_mtime == st.st_mtime_ns)
+
+class WordCorpus(Sequence):
+    """Read-only, memory-mapped word list that decodes words on demand"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, byteorder, count, _, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or byteorder != _BYTEORDER:
+            self._mm.close()
+            raise ValueError(f"Not a compatible word corpus: {path}")
+        self._count = count
+        offsets_start = _HEADER.size
+        self._blob_start = offsets_start + (count + 1) * 8
+        self._offsets = memoryview(self._mm)[offsets_start:self._blob_start].cast("Q")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word index out of range")
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def close(self):
+        if self._mm.closed:
+            return
+        self._offsets.release()
+        self._mm.close()
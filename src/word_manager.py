@@ -1,15 +1,26 @@
 # NongGameTyping/src/word_manager.py
-import random
-from .data_manager import DataManager
+from .data_manager import get_data_manager
+from .word_sampler import WordSampler, DEFAULT_TIER
 
 class WordManager:
     """จัดการการโหลดและสุ่มคำศัพท์จาก DataManager"""
     def __init__(self):
-        self.data_manager = DataManager()
-        self.words = self.data_manager.get_words()
+        self.data_manager = get_data_manager()
+        # สุ่มตามระดับความยาก settings['difficulty'] และไม่ให้คำซ้ำติดกัน
+        self.sampler = WordSampler()
         self.current_word = self.get_new_word()
 
+    @property
+    def words(self):
+        """ลิสต์คำศัพท์ปัจจุบันจาก DataManager ที่แชร์กัน"""
+        return self.data_manager.get_words()
+
     def get_new_word(self):
-        """สุ่มคำใหม่จากลิสต์"""
-        self.current_word = self.data_manager.get_random_word()
-        return self.current_word
\ No newline at end of file
+        """สุ่มคำใหม่ตามระดับความยาก (easy / normal / hard)"""
+        words = self.words
+        if not len(words):
+            self.current_word = "default"
+            return self.current_word
+        difficulty = self.data_manager.get_setting('difficulty', DEFAULT_TIER)
+        self.current_word = self.sampler.draw(words, difficulty)
+        return self.current_word
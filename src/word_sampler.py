@@ -0,0 +1,166 @@
+# NongGameTyping/src/word_sampler.py
+import math
+import os
+import random
+import time
+from array import array
+from collections import Counter, deque
+from typing import Dict, Optional, Sequence
+import numpy as np
+from .alias_table import AliasTable
+
+DIFFICULTY_TIERS = ("easy", "normal", "hard")
+DEFAULT_TIER = "normal"
+
+# Words drawn recently are rejected so the same word never comes back too soon
+NO_REPEAT_WINDOW = 8
+MAX_REJECTIONS = 32
+
+# Letters that are slow to reach on a QWERTY keyboard or rare in English text
+RARE_LETTERS = frozenset("jqxzkvbwy")
+
+# Share of each feature in the 0..1 difficulty score
+LENGTH_WEIGHT = 0.5
+RARE_LETTER_WEIGHT = 0.2
+BIGRAM_WEIGHT = 0.3
+
+# Keeps every word reachable in every tier
+WEIGHT_FLOOR = 0.01
+
+# Bump when the scoring changes so cached scores are recomputed
+SCORE_VERSION = 1
+
+def _tier_weight(tier: str, score):
+    """Weight of a score (or, elementwise, a NumPy array of scores) in tier"""
+    if tier == "easy":
+        return (1.0 - score) ** 3 + WEIGHT_FLOOR
+    if tier == "hard":
+        return score ** 3 + WEIGHT_FLOOR
+    # normal: favour the middle of the range
+    return np.exp(-((score - 0.5) / 0.25) ** 2) + WEIGHT_FLOOR
+
+def compute_difficulty(words: Sequence[str]) -> array:
+    """Score each word between 0 (easiest) and 1 (hardest)
+
+    Features are length, the share of rare letters and how uncommon the word's
+    letter pairs are in this corpus; each is min-max normalised before mixing.
+    """
+    # Two streaming passes so a memory-mapped corpus is never copied into a list
+    bigrams = Counter()
+    for word in words:
+        word = word.lower()
+        bigrams.update(zip(word, word[1:]))
+    total_bigrams = sum(bigrams.values()) or 1
+    # -log frequency, so rare pairs cost more
+    bigram_cost = {pair: -math.log(count / total_bigrams) for pair, count in bigrams.items()}
+
+    lengths = array("f")
+    rare = array("f")
+    bigram = array("f")
+    is_rare = RARE_LETTERS.__contains__
+    for word in words:
+        word = word.lower()
+        n = len(word)
+        lengths.append(n)
+        rare.append(sum(map(is_rare, word)) / n if n else 0.0)
+        bigram.append(sum(map(bigram_cost.__getitem__, zip(word, word[1:]))) / (n - 1) if n > 1 else 0.0)
+
+    def normalise(values: array) -> array:
+        if not len(values):
+            return values
+        low, high = min(values), max(values)
+        span = (high - low) or 1.0
+        return array("f", ((v - low) / span for v in values))
+
+    mixed = array("f", (LENGTH_WEIGHT * l + RARE_LETTER_WEIGHT * r + BIGRAM_WEIGHT * b
+                        for l, r, b in zip(normalise(lengths), normalise(rare), normalise(bigram))))
+    # Stretch the mix back to 0..1 so the tier curves see the full range
+    return normalise(mixed)
+
+def load_difficulty(words: Sequence[str]) -> array:
+    """compute_difficulty() with an on-disk cache next to a memory-mapped corpus
+
+    Scoring millions of words takes seconds, so the scores are stored in
+    `<corpus>.difficulty` and reused until the corpus file changes.
+    """
+    corpus_path = getattr(words, "path", None)
+    if corpus_path is None:
+        return compute_difficulty(words)
+
+    cache_path = corpus_path + ".difficulty"
+    try:
+        st = os.stat(corpus_path)
+        key = f"{SCORE_VERSION}:{st.st_size}:{st.st_mtime_ns}:{len(words)}\n".encode("ascii")
+    except OSError:
+        return compute_difficulty(words)
+
+    try:
+        with open(cache_path, "rb") as f:
+            if f.readline() == key:
+                scores = array("f")
+                scores.fromfile(f, len(words))
+                return scores
+    except (OSError, EOFError, ValueError):
+        pass
+
+    scores = compute_difficulty(words)
+    try:
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(key)
+            scores.tofile(f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Could not cache word difficulty: {e}")
+    return scores
+
+class WordSampler:
+    """Draws words weighted by the difficulty tier, without back-to-back repeats
+
+    Difficulty scores are computed once per corpus and an alias table once per
+    tier, so each draw is O(1); nothing is rebuilt unless the corpus object or
+    the tier changes.
+    """
+
+    def __init__(self, window: int = NO_REPEAT_WINDOW, rng: Optional[random.Random] = None):
+        self.window = window
+        self.rng = rng or random.Random()
+        self._words = None
+        self._scores = None
+        self._tables: Dict[str, AliasTable] = {}
+        self._recent = deque()
+
+    def draw(self, words: Sequence[str], tier: str = DEFAULT_TIER) -> str:
+        """Pick the next word from words for the given difficulty tier"""
+        table = self._table_for(words, tier)
+        window = min(self.window, len(words) - 1)
+        recent = self._recent
+
+        index = table.sample(self.rng)
+        for _ in range(MAX_REJECTIONS):
+            if index not in recent:
+                break
+            index = table.sample(self.rng)
+
+        recent.append(index)
+        while len(recent) > max(window, 0):
+            recent.popleft()
+        return words[index]
+
+    def _table_for(self, words: Sequence[str], tier: str) -> AliasTable:
+        if tier not in DIFFICULTY_TIERS:
+            tier = DEFAULT_TIER
+        if words is not self._words:
+            start = time.perf_counter()
+            self._words = words
+            self._scores = load_difficulty(words)
+            self._tables = {}
+            self._recent.clear()
+            print(f"Scored {len(words)} words for difficulty ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        table = self._tables.get(tier)
+        if table is None:
+            # Weigh the whole float32 score array at once instead of a list of boxed floats
+            scores = np.frombuffer(self._scores, dtype=np.float32).astype(np.float64)
+            table = AliasTable(_tier_weight(tier, scores))
+            self._tables[tier] = table
+        return table
@@ -0,0 +1,41 @@
+# NongGameTyping/tests/test_economy_journal.py
+import os
+from src.economy_journal import EconomyJournal
+
+class FailingFile:
+    """Stands in for the journal file on a full or read-only disk"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def tell(self):
+        return os.path.getsize(self.path)
+
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+def test_failed_write_leaves_state_unchanged(tmp_path):
+    journal = EconomyJournal(str(tmp_path))
+    journal.seed(100, ["Carrot"])
+    assert journal.commit([EconomyJournal.coin_spent(30)])
+    journal._file.close()
+    journal._file = FailingFile(journal.journal_path)
+
+    assert not journal.commit([EconomyJournal.coin_spent(50), EconomyJournal.item_granted("Tomato")])
+    assert journal.coins == 70
+    assert journal.seq == 1
+    assert journal.owned == {"Carrot"}
+
+    # The next commit reopens the journal and everything replays cleanly
+    assert journal.commit([EconomyJournal.coin_earned(5)])
+    journal.close()
+    reloaded = EconomyJournal(str(tmp_path))
+    assert reloaded.coins == 75
+    assert reloaded.seq == 2
+    assert reloaded.owned == {"Carrot"}